@@ -13,6 +13,10 @@ from src.os_simulator.process import Process
 from src.os_simulator.scheduling.fcfs import FCFSScheduler
 from src.os_simulator.scheduling.round_robin import RoundRobinScheduler
 from src.os_simulator.scheduling.priority import PriorityScheduler
+from src.os_simulator.scheduling.sjf import SJFScheduler
+from src.os_simulator.scheduling.mlfq import MLFQScheduler
+from src.os_simulator.scheduling.cfs import CFSScheduler
+from src.os_simulator.scheduling.realtime import EDFScheduler, RateMonotonicScheduler
 from src.os_simulator.scheduling.models import GanttEntry
 from src.os_simulator.kernel import Kernel
 from src.os_simulator.metrics import MetricsCalculator
@@ -134,6 +138,24 @@ def route_command(query):
             elif "priority" in query:
                 scheduler = PriorityScheduler()
                 title = "Priority Scheduling"
+            elif "edf" in query or "earliest deadline" in query:
+                scheduler = EDFScheduler()
+                title = "Earliest Deadline First"
+            elif "rate monotonic" in query:
+                scheduler = RateMonotonicScheduler()
+                title = "Rate-Monotonic Scheduling"
+            elif "cfs" in query or "fair" in query:
+                scheduler = CFSScheduler()
+                title = "Completely Fair Scheduler"
+            elif "mlfq" in query or "feedback" in query:
+                scheduler = MLFQScheduler()
+                title = "Multi-Level Feedback Queue"
+            elif "srtf" in query or "shortest remaining" in query:
+                scheduler = SJFScheduler(preemptive=True)
+                title = "Shortest Remaining Time First"
+            elif "sjf" in query or "shortest job" in query:
+                scheduler = SJFScheduler()
+                title = "Shortest Job First"
             else:
                 scheduler = FCFSScheduler()
                 title = "FCFS Scheduling"
@@ -194,7 +216,7 @@ def route_command(query):
 
     # --- Memory ---
     elif "simulate paging" in query:
-        from src.os_simulator.memory_management.page_replacement import fifo_replacement, lru_replacement, optimal_replacement
+        from src.os_simulator.memory_management.replacement_policies import simulate_replacement
         try:
             frames = 3
             f_match = re.search(r"frames (\d+)", query)
@@ -206,9 +228,7 @@ def route_command(query):
                 ref_str = [int(x) for x in re.findall(r"\d+", ref_part)]
             
             speak(f"Simulating {current_page_algo.upper()} page replacement with {frames} frames.")
-            if current_page_algo == "fifo": res = fifo_replacement(ref_str, frames)
-            elif current_page_algo == "lru": res = lru_replacement(ref_str, frames)
-            else: res = optimal_replacement(ref_str, frames)
+            res = simulate_replacement(ref_str, frames, current_page_algo)
             
             print(f"\n--- Page Replacement Results ({current_page_algo.upper()}) ---")
             print(f"Reference String: {ref_str}")
@@ -225,6 +245,12 @@ def route_command(query):
         if "fifo" in query: current_page_algo = "fifo"
         elif "lru" in query: current_page_algo = "lru"
         elif "optimal" in query: current_page_algo = "optimal"
+        elif "second chance" in query: current_page_algo = "second_chance"
+        elif "clock" in query: current_page_algo = "clock"
+        elif "lfu" in query or "least frequently" in query: current_page_algo = "lfu"
+        elif "arc" in query or "adaptive" in query: current_page_algo = "arc"
+        elif "2q" in query or "two queue" in query: current_page_algo = "2q"
+        elif "working set" in query: current_page_algo = "working_set"
         speak(f"Page replacement algorithm set to {current_page_algo.upper()}.")
 
     elif "run paging" in query: # Simple demo
@@ -3,28 +3,33 @@ import sys
 import argparse
 import logging
 import copy
+import json
 from typing import List
 
 # Ensure the project root is in the path for modular 'src' imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.voice.speech_input import take_command
-from src.voice.speech_output import speak
-from src.core.command_router import route_command
 from src.os_simulator.kernel import Kernel
 from src.os_simulator.process import Process
 from src.os_simulator.metrics import MetricsCalculator
 from src.os_simulator.comparator import AlgorithmComparator
+from src.os_simulator.workload import WorkloadGenerator, Poisson, Exponential
+from src.os_simulator.trace import read_trace
+from src.os_simulator.streaming_metrics import StreamingMetrics
 from src.os_simulator.scheduling.fcfs import FCFSScheduler
 from src.os_simulator.scheduling.round_robin import RoundRobinScheduler
 from src.os_simulator.scheduling.priority import PriorityScheduler
+from src.os_simulator.scheduling.sjf import SJFScheduler
+from src.os_simulator.scheduling.mlfq import MLFQScheduler
+from src.os_simulator.scheduling.cfs import CFSScheduler
+from src.os_simulator.scheduling.realtime import EDFScheduler, RateMonotonicScheduler
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger("OS-CLI")
 
 def parse_processes(process_str: str) -> List[Process]:
-    """Parses processes from string format 'Name:Arrival:Burst:Priority'"""
+    """Parses processes from string format 'Name:Arrival:Burst:Priority[:Deadline]'"""
     procs = []
     try:
         segments = process_str.split(',')
@@ -34,19 +39,32 @@ def parse_processes(process_str: str) -> List[Process]:
             arrival = int(parts[1])
             burst = int(parts[2])
             priority = int(parts[3]) if len(parts) > 3 else 0
-            procs.append(Process(pid=i+1, name=name, arrival_time=arrival, burst_time=burst, priority=priority))
+            deadline = int(parts[4]) if len(parts) > 4 else None
+            procs.append(Process(pid=i+1, name=name, arrival_time=arrival, burst_time=burst, priority=priority, deadline=deadline))
     except Exception as e:
-        logger.error(f"Failed to parse processes: {e}. Format should be 'Name:Arrival:Burst:Priority,...'")
+        logger.error(f"Failed to parse processes: {e}. Format should be 'Name:Arrival:Burst:Priority[:Deadline],...'")
         sys.exit(1)
     return procs
 
+def generate_processes(args) -> List[Process]:
+    """Builds a synthetic workload for --generate (Poisson arrivals, exponential bursts)."""
+    logger.info(f"Generating {args.generate} processes (seed={args.seed}, load={args.arrival_rate * args.mean_burst:.2f})...")
+    generator = WorkloadGenerator(Poisson(args.arrival_rate), Exponential(args.mean_burst), seed=args.seed)
+    return generator.generate(args.generate).to_processes()
+
 def run_scheduler_cli(args):
     """Handles --mode scheduler"""
-    if not args.processes:
-        logger.error('Error: --processes "Name:Arrival:Burst:Priority,..." is required for scheduler mode.')
+    # Same source precedence as compare mode: --trace, then --generate, then --processes
+    procs = []
+    if args.trace:
+        pass  # Streamed below once the scheduler is known
+    elif args.generate:
+        procs = generate_processes(args)
+    elif args.processes:
+        procs = parse_processes(args.processes)
+    else:
+        logger.error('Error: --processes "Name:Arrival:Burst:Priority,...", --generate N or --trace FILE is required for scheduler mode.')
         return
-
-    procs = parse_processes(args.processes)
     
     scheduler = None
     if args.algorithm == 'fcfs':
@@ -55,10 +73,34 @@ def run_scheduler_cli(args):
         scheduler = RoundRobinScheduler(quantum=args.quantum)
     elif args.algorithm == 'priority':
         scheduler = PriorityScheduler()
+    elif args.algorithm == 'sjf':
+        scheduler = SJFScheduler()
+    elif args.algorithm == 'srtf':
+        scheduler = SJFScheduler(preemptive=True)
+    elif args.algorithm == 'mlfq':
+        scheduler = MLFQScheduler()
+    elif args.algorithm == 'cfs':
+        scheduler = CFSScheduler()
+    elif args.algorithm == 'edf':
+        scheduler = EDFScheduler()
+    elif args.algorithm == 'rm':
+        scheduler = RateMonotonicScheduler()
     else:
         logger.error(f"Unsupported algorithm: {args.algorithm}")
         return
 
+    if args.trace:
+        # Replay the trace lazily with constant-memory metrics, so it may exceed RAM
+        sink = StreamingMetrics()
+        kernel = Kernel(context_switch_time=args.context_switch, metrics_sink=sink)
+        kernel.set_scheduler(scheduler)
+        logger.info(f"Replaying trace {args.trace} with {args.algorithm.upper()}...")
+        kernel.simulate(process_stream=read_trace(args.trace), keep_timeline=False)
+        calc = MetricsCalculator()
+        calc.results = sink.snapshot()
+        calc.pretty_print()
+        return
+
     kernel = Kernel(context_switch_time=args.context_switch)
     kernel.set_scheduler(scheduler)
     for p in procs:
@@ -74,7 +116,11 @@ def run_scheduler_cli(args):
 def run_compare_cli(args):
     """Handles --mode compare"""
     # Use default workload if none provided
-    if args.processes:
+    if args.trace:
+        workload = list(read_trace(args.trace))
+    elif args.generate:
+        workload = generate_processes(args)
+    elif args.processes:
         workload = parse_processes(args.processes)
     else:
         logger.info("Using default benchmark workload...")
@@ -84,8 +130,8 @@ def run_compare_cli(args):
             Process(3, "P3", 2, 6, 2)
         ]
 
-    schedulers = [FCFSScheduler(), RoundRobinScheduler(quantum=args.quantum), PriorityScheduler()]
-    comparator = AlgorithmComparator()
+    schedulers = [FCFSScheduler(), RoundRobinScheduler(quantum=args.quantum), PriorityScheduler(), SJFScheduler()]
+    comparator = AlgorithmComparator(workers=args.workers)
     comparator.compare(workload, schedulers, context_switch_time=args.context_switch)
     comparator.print_comparison_table()
 
@@ -93,8 +139,13 @@ def run_memory_cli(args):
     """Handles --mode memory (Paging and Segmentation)"""
     from src.os_simulator.memory_management.paging import PagingMemoryManager
     from src.os_simulator.memory_management.segmentation import SegmentationMemoryManager
+    from src.os_simulator.memory_management.replacement_policies import ALGORITHMS, simulate_replacement
     
-    if args.algorithm == "segmentation":
+    if args.algorithm in ALGORITHMS:
+        reference = [int(page) for page in args.reference.split(",")] if args.reference else [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2]
+        logger.info(f"Running {args.algorithm.upper()} page replacement with {args.frames} frames...")
+        print(json.dumps(simulate_replacement(reference, args.frames, args.algorithm), indent=2))
+    elif args.algorithm == "segmentation":
         logger.info("Running Segmentation Memory Management Demo...")
         mmu = SegmentationMemoryManager(total_memory=65536)
         mmu.allocate(1, [1000, 2000, 500])
@@ -106,7 +157,6 @@ def run_memory_cli(args):
         mm.allocate(1, 400) # Allocate 2 pages
         mm.allocate(2, 200) # Allocate 1 page
         print("\nMemory Management Status:")
-        import json
         print(json.dumps(mm.get_status(), indent=2))
 
 def run_deadlock_cli(args):
@@ -128,8 +178,28 @@ def run_deadlock_cli(args):
         is_safe, sequence = banker.safe_state_check()
         print(f"Is system safe? {is_safe}. Sequence: {sequence}")
 
+def run_batch_cli(args):
+    """Handles --mode batch (headless runs from a JSON job spec)"""
+    from src.os_simulator.batch import batch_output_path, run_batch_file
+
+    if not args.spec:
+        logger.error("Error: --spec job.json is required for batch mode.")
+        return
+    # Per-run kernel logging would bury the results; only warnings and errors are shown
+    logging.disable(logging.INFO)
+    rows = run_batch_file(args.spec, args.output)
+    # Only print when neither --output nor the spec's "output" named a file
+    if batch_output_path(args.spec, args.output) is None:
+        json.dump(rows, sys.stdout, indent=2)
+        print()
+
 def interactive_mode():
     """Fallback interactive loop (AI Assistant mode)"""
+    # The voice stack is heavy and optional, so it is only imported for interactive use
+    from src.voice.speech_input import take_command
+    from src.voice.speech_output import speak
+    from src.core.command_router import route_command
+
     speak("Jarvis is online. How can I assist you today?")
     while True:
         try:
@@ -150,11 +220,21 @@ def interactive_mode():
 
 def main():
     parser = argparse.ArgumentParser(description="Jarvis OS Simulator CLI")
-    parser.add_argument("--mode", choices=["scheduler", "memory", "deadlock", "compare"], help="Simulation mode")
-    parser.add_argument("--algorithm", help="Algorithm (e.g., fcfs, rr, priority, segmentation, detection)")
+    parser.add_argument("--mode", choices=["scheduler", "memory", "deadlock", "compare", "batch"], help="Simulation mode")
+    parser.add_argument("--algorithm", help="Algorithm (e.g., fcfs, rr, priority, sjf, srtf, mlfq, cfs, edf, rm, segmentation, detection, or a page replacement policy: fifo, lru, optimal, clock, second_chance, lfu, arc, 2q, working_set)")
     parser.add_argument("--quantum", type=int, default=2, help="Time quantum for Round Robin")
     parser.add_argument("--context_switch", type=int, default=0, help="Context switch overhead units")
-    parser.add_argument("--processes", help="Processes in format 'Name:Arrival:Burst:Priority,...'")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for compare mode (0 = one per CPU)")
+    parser.add_argument("--processes", help="Processes in format 'Name:Arrival:Burst:Priority[:Deadline],...'")
+    parser.add_argument("--generate", type=int, help="Generate a synthetic workload of N processes instead of --processes")
+    parser.add_argument("--trace", help="Process trace file (.csv, .jsonl or binary .bin) instead of --processes")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for --generate")
+    parser.add_argument("--arrival_rate", type=float, default=0.08, help="Poisson arrivals per time unit for --generate")
+    parser.add_argument("--mean_burst", type=float, default=10, help="Mean exponential burst time for --generate (load = arrival_rate * mean_burst)")
+    parser.add_argument("--reference", help="Page reference string for memory mode, e.g. '7,0,1,2,0,3'")
+    parser.add_argument("--frames", type=int, default=3, help="Number of page frames for memory mode")
+    parser.add_argument("--spec", help="JSON job spec for batch mode")
+    parser.add_argument("--output", help="Batch results file (.json or .csv); defaults to the spec's \"output\", else JSON to stdout")
 
     args = parser.parse_args()
 
@@ -167,6 +247,8 @@ def main():
             run_memory_cli(args)
         elif args.mode == "deadlock":
             run_deadlock_cli(args)
+        elif args.mode == "batch":
+            run_batch_cli(args)
     else:
         interactive_mode()
 
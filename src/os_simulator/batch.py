@@ -0,0 +1,166 @@
+import json
+import logging
+import os
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type
+from os_simulator.kernel import Scheduler
+from os_simulator.comparator import Workload
+from os_simulator.sweep import ParameterSweep, SchedulerGrid
+from os_simulator.trace import load_trace_table, process_from_record
+from os_simulator import workload as workload_module
+from os_simulator.scheduling.fcfs import FCFSScheduler
+from os_simulator.scheduling.round_robin import RoundRobinScheduler
+from os_simulator.scheduling.priority import PriorityScheduler
+from os_simulator.scheduling.sjf import SJFScheduler
+from os_simulator.scheduling.mlfq import MLFQScheduler
+from os_simulator.scheduling.cfs import CFSScheduler
+from os_simulator.scheduling.realtime import EDFScheduler, RateMonotonicScheduler
+
+logger = logging.getLogger("Batch-Runner")
+
+# Algorithm name -> (scheduler class, fixed constructor arguments)
+ALGORITHMS: Dict[str, Tuple[Type[Scheduler], Dict[str, Any]]] = {
+    "fcfs": (FCFSScheduler, {}),
+    "rr": (RoundRobinScheduler, {}),
+    "priority": (PriorityScheduler, {}),
+    "sjf": (SJFScheduler, {}),
+    "srtf": (SJFScheduler, {"preemptive": True}),
+    "mlfq": (MLFQScheduler, {}),
+    "cfs": (CFSScheduler, {}),
+    "edf": (EDFScheduler, {}),
+    "rm": (RateMonotonicScheduler, {}),
+}
+
+# Distribution and arrival process names accepted in "generate" workloads
+_GENERATOR_TYPES = {
+    "poisson": workload_module.Poisson,
+    "mmpp": workload_module.MMPP,
+    "diurnal": workload_module.Diurnal,
+    "constant": workload_module.Constant,
+    "uniform": workload_module.Uniform,
+    "uniform_int": workload_module.UniformInt,
+    "exponential": workload_module.Exponential,
+    "pareto": workload_module.Pareto,
+    "lognormal": workload_module.LogNormal,
+    "bimodal": workload_module.Bimodal,
+}
+
+def build_distribution(spec: Mapping[str, Any]) -> Any:
+    """
+    Builds a workload distribution or arrival process from {"type": name, **arguments},
+    e.g. {"type": "pareto", "alpha": 2.5, "minimum": 5}. Bimodal components nest.
+    """
+    args = dict(spec)
+    kind = args.pop("type", None)
+    if kind not in _GENERATOR_TYPES:
+        raise ValueError(f"Unknown distribution type: {kind}. Choose from {sorted(_GENERATOR_TYPES)}.")
+    for name, value in args.items():
+        if isinstance(value, Mapping):
+            args[name] = build_distribution(value)
+        elif isinstance(value, list):
+            args[name] = tuple(value)
+    return _GENERATOR_TYPES[kind](**args)
+
+def load_workload(spec: Mapping[str, Any], base_dir: str = ".") -> Workload:
+    """
+    Builds one workload from its spec, which holds exactly one of:
+        "processes": a list of records with Process field names,
+        "trace": a trace file path (relative to base_dir),
+        "generate": {"n": ..., "seed": ..., "arrivals": {...}, "burst": {...}, ...}.
+    """
+    if "processes" in spec:
+        return [process_from_record(record, i) for i, record in enumerate(spec["processes"], start=1)]
+    if "trace" in spec:
+        return load_trace_table(os.path.join(base_dir, spec["trace"]), spec.get("format"))
+    if "generate" in spec:
+        options = dict(spec["generate"])
+        n = options.pop("n")
+        for name in ("arrivals", "burst", "priority", "memory"):
+            if name in options:
+                options[name] = build_distribution(options[name])
+        return workload_module.WorkloadGenerator(**options).generate(n)
+    raise ValueError("A workload needs 'processes', 'trace' or 'generate'.")
+
+def build_scheduler_grid(spec: Mapping[str, Mapping[str, Any]]) -> SchedulerGrid:
+    """
+    Builds a ParameterSweep grid from {"label": {"algorithm": name, "params": {...}}}.
+    Each parameter maps to a list of values to try (a single value is shorthand
+    for a one-element list).
+    """
+    grid = {}
+    for label, entry in spec.items():
+        algorithm = entry.get("algorithm", label).lower()
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}. Choose from {sorted(ALGORITHMS)}.")
+        scheduler_cls, fixed = ALGORITHMS[algorithm]
+        params = {name: [value] for name, value in fixed.items()}
+        for name, values in entry.get("params", {}).items():
+            params[name] = values if isinstance(values, list) else [values]
+        grid[label] = (scheduler_cls, params)
+    return grid
+
+def run_batch(spec: Mapping[str, Any], base_dir: str = ".") -> ParameterSweep:
+    """
+    Runs a batch job spec:
+
+        {
+          "workloads": {"name": {workload spec}, ...},
+          "schedulers": {"label": {"algorithm": "rr", "params": {"quantum": [2, 4]}}, ...},
+          "context_switch_times": [0, 1],   (optional, default [0])
+          "core_counts": [1, 2],            (optional, default [1])
+          "workers": 0,                     (optional, see AlgorithmComparator)
+          "cache": "results-cache.jsonl"    (optional, relative to base_dir)
+        }
+
+    Returns:
+        The finished ParameterSweep; its rows hold one result per combination.
+    """
+    for key in ("workloads", "schedulers"):
+        if not spec.get(key):
+            raise ValueError(f"Batch spec needs a non-empty '{key}' section.")
+    workloads = {name: load_workload(entry, base_dir) for name, entry in spec["workloads"].items()}
+    grid = build_scheduler_grid(spec["schedulers"])
+    cache = spec.get("cache")
+
+    sweep = ParameterSweep(
+        workers=spec.get("workers"),
+        cache_path=os.path.join(base_dir, cache) if cache else None
+    )
+    sweep.run(
+        workloads, grid,
+        context_switch_times=spec.get("context_switch_times", [0]),
+        core_counts=spec.get("core_counts", [1])
+    )
+    logger.info(f"Batch finished: {len(sweep.rows)} results.")
+    return sweep
+
+def _output_path(spec: Mapping[str, Any], base_dir: str, output: Optional[str]) -> Optional[str]:
+    return output or (os.path.join(base_dir, spec["output"]) if spec.get("output") else None)
+
+def batch_output_path(spec_path: str, output: Optional[str] = None) -> Optional[str]:
+    """
+    Returns the file run_batch_file(spec_path, output) writes to: output, else the
+    spec's "output" entry relative to the spec file, else None (nothing is written).
+    """
+    with open(spec_path) as f:
+        spec = json.load(f)
+    return _output_path(spec, os.path.dirname(os.path.abspath(spec_path)), output)
+
+def run_batch_file(spec_path: str, output: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Runs the job spec in spec_path and writes the result rows to output (CSV when it
+    ends in .csv, otherwise JSON). Paths in the spec are relative to the spec file.
+    An "output" entry in the spec is used when output is not given.
+    """
+    with open(spec_path) as f:
+        spec = json.load(f)
+    base_dir = os.path.dirname(os.path.abspath(spec_path))
+    sweep = run_batch(spec, base_dir)
+
+    output = _output_path(spec, base_dir, output)
+    if output and output.lower().endswith(".csv"):
+        sweep.to_csv(output)
+    elif output:
+        with open(output, "w") as f:
+            json.dump(sweep.rows, f, indent=2)
+        logger.info(f"Batch results written to {output}")
+    return sweep.rows
@@ -1,65 +1,174 @@
-import copy
 import csv
 import logging
-from typing import List, Dict, Any
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Mapping, Optional, Sequence, Tuple, Union
 from os_simulator.kernel import Kernel, Scheduler
 from os_simulator.process import Process
+from os_simulator.process_table import ProcessTable
 from os_simulator.metrics import MetricsCalculator
 
 logger = logging.getLogger("Comparator")
 
+Workload = Union[List[Process], ProcessTable]
+
+# Workloads shipped once to each pool worker by _init_worker
+_worker_workloads: Dict[str, ProcessTable] = {}
+
+def _init_worker(workloads: Dict[str, ProcessTable]) -> None:
+    """Pool initializer: receives every workload once instead of once per job."""
+    global _worker_workloads
+    _worker_workloads = workloads
+    # Per-run kernel logging from many workers drowns the parent's output
+    logging.disable(logging.INFO)
+
+def run_isolated(
+    table: ProcessTable,
+    scheduler: Scheduler,
+    context_switch_time: int = 0,
+    num_cores: int = 1
+) -> Dict[str, Any]:
+    """
+    Runs one scheduler on a private copy of a workload and returns its metrics.
+
+    Args:
+        table: The workload. It is not modified.
+        scheduler: Scheduler to benchmark.
+        context_switch_time: Overhead to use in the kernel.
+        num_cores: CPU cores to simulate (more than one uses the event-driven core).
+    """
+    processes = table.to_processes()
+    kernel = Kernel(context_switch_time=context_switch_time, num_cores=num_cores)
+    kernel.set_scheduler(scheduler)
+    for p in processes:
+        kernel.add_process(p)
+
+    timeline = kernel.run()
+    return MetricsCalculator().calculate(processes, timeline, kernel.system_clock)
+
+def _run_job(job: Tuple[str, Scheduler, int, int], workloads: Optional[Dict[str, ProcessTable]] = None) -> Dict[str, Any]:
+    """Executes one (workload, scheduler, context switch, cores) job."""
+    workload_name, scheduler, context_switch_time, num_cores = job
+    tables = _worker_workloads if workloads is None else workloads
+    return run_isolated(tables[workload_name], scheduler, context_switch_time, num_cores)
+
+def run_jobs(
+    jobs: Sequence[Tuple[str, Scheduler, int, int]],
+    tables: Dict[str, ProcessTable],
+    workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Runs (workload name, scheduler, context switch time, num_cores) jobs, optionally
+    on a process pool, and returns their metrics in job order.
+
+    Args:
+        jobs: The jobs to run.
+        tables: Workloads by name. Each pool worker receives them once.
+        workers: Worker processes; None or 1 runs in this process.
+    """
+    if workers is None or workers <= 1 or len(jobs) <= 1:
+        return [_run_job(job, tables) for job in jobs]
+
+    logger.info(f"Running {len(jobs)} benchmarks on {workers} worker processes...")
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(tables,)) as pool:
+        chunksize = max(1, len(jobs) // (workers * 4))
+        # pool.map yields in submission order, so merging is deterministic
+        return list(pool.map(_run_job, jobs, chunksize=chunksize))
+
+def as_table(workload: Workload) -> ProcessTable:
+    """Returns the workload as a ProcessTable, converting a process list."""
+    return workload if isinstance(workload, ProcessTable) else ProcessTable.from_processes(workload)
+
+def scheduler_labels(schedulers: Union[Sequence[Scheduler], Mapping[str, Scheduler]]) -> Dict[str, Scheduler]:
+    """
+    Names schedulers for result tables. A mapping keeps its labels; a list uses class
+    names, numbering repeats ("RoundRobinScheduler", "RoundRobinScheduler (2)", ...).
+    """
+    if isinstance(schedulers, Mapping):
+        return dict(schedulers)
+    labelled: Dict[str, Scheduler] = {}
+    for scheduler in schedulers:
+        name = type(scheduler).__name__
+        label, copy_number = name, 1
+        while label in labelled:
+            copy_number += 1
+            label = f"{name} ({copy_number})"
+        labelled[label] = scheduler
+    return labelled
+
 class AlgorithmComparator:
     """
     Automates the comparison of different scheduling algorithms 
     by running them against the same set of processes.
+
+    Runs can be fanned out to a process pool. Workloads travel to the workers
+    as column-oriented ProcessTables, once per worker, and results are merged in
+    job order so parallel and sequential runs produce identical tables.
     """
 
-    def __init__(self):
+    def __init__(self, workers: Optional[int] = None):
+        """
+        Args:
+            workers: Worker processes for the pool. None or 1 runs everything in
+                     this process; 0 uses one worker per CPU.
+        """
+        self.workers = (os.cpu_count() or 1) if workers == 0 else workers
         self.results: Dict[str, Dict[str, Any]] = {}
+        self.grid_results: Dict[Tuple[str, str, int], Dict[str, Any]] = {}
 
     def compare(
         self, 
-        process_list: List[Process], 
-        schedulers: List[Scheduler], 
+        process_list: Workload, 
+        schedulers: Union[List[Scheduler], Mapping[str, Scheduler]], 
         context_switch_time: int = 0
     ) -> Dict[str, Dict[str, Any]]:
         """
         Runs isolated simulations for each scheduler and collects metrics.
         
         Args:
-            process_list: The baseline list of processes.
-            schedulers: List of scheduler objects to benchmark.
+            process_list: The baseline list of processes (or a ProcessTable).
+            schedulers: Scheduler objects to benchmark, or a mapping of label to scheduler.
             context_switch_time: Overhead to use in the kernel.
             
         Returns:
-            A dictionary of results indexed by scheduler class name.
+            A dictionary of results indexed by scheduler label (class name by default).
         """
-        self.results = {}
-        
-        for scheduler in schedulers:
-            name = type(scheduler).__name__
-            logger.info(f"Running benchmark for: {name}")
-            
-            # 1. Isolate processes (deep copy to avoid state leakage)
-            procs_copy = [copy.deepcopy(p) for p in process_list]
-            
-            # 2. Setup isolated Kernel and Calculator
-            kernel = Kernel(context_switch_time=context_switch_time)
-            kernel.set_scheduler(scheduler)
-            
-            for p in procs_copy:
-                kernel.add_process(p)
-                
-            # 3. Execute
-            timeline = kernel.run()
-            
-            # 4. Extract Metrics
-            calculator = MetricsCalculator()
-            metrics = calculator.calculate(procs_copy, timeline, kernel.system_clock)
-            self.results[name] = metrics
-            
+        grid = self.compare_grid({"workload": process_list}, schedulers, [context_switch_time])
+        self.results = {label: metrics for (_, label, _), metrics in grid.items()}
         return self.results
 
+    def compare_grid(
+        self,
+        workloads: Mapping[str, Workload],
+        schedulers: Union[Sequence[Scheduler], Mapping[str, Scheduler]],
+        context_switch_times: Sequence[int] = (0,)
+    ) -> Dict[Tuple[str, str, int], Dict[str, Any]]:
+        """
+        Runs every (workload x scheduler x context switch time) combination.
+
+        Args:
+            workloads: Named workloads, as process lists or ProcessTables.
+            schedulers: Scheduler objects, or a mapping of label to scheduler.
+            context_switch_times: Context switch overheads to try.
+
+        Returns:
+            Metrics keyed by (workload name, scheduler label, context switch time),
+            in that nesting order regardless of which job finished first.
+        """
+        tables = {name: as_table(workload) for name, workload in workloads.items()}
+        labelled = scheduler_labels(schedulers)
+        keys = [
+            (workload_name, label, cs)
+            for workload_name in tables
+            for label in labelled
+            for cs in context_switch_times
+        ]
+        jobs = [(workload_name, labelled[label], cs, 1) for workload_name, label, cs in keys]
+
+        logger.info(f"Running {len(jobs)} benchmarks for: {', '.join(labelled)}")
+        self.grid_results = dict(zip(keys, run_jobs(jobs, tables, self.workers)))
+        return self.grid_results
+
     def print_comparison_table(self) -> None:
         """Prints the comparison results in a formatted table."""
         if not self.results:
@@ -69,6 +178,7 @@ class AlgorithmComparator:
         # Metrics to display
         metrics_keys = [
             "avg_waiting_time", 
+            "max_waiting_time", 
             "avg_turnaround_time", 
             "avg_response_time", 
             "throughput", 
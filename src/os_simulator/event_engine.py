@@ -0,0 +1,389 @@
+import heapq
+import logging
+from enum import IntEnum
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+from os_simulator.process import Process, ProcessState
+from os_simulator.system_clock import SystemClock
+from os_simulator.scheduling.ready_queue import ReadyQueue
+from os_simulator.streaming_metrics import MetricsSink
+
+logger = logging.getLogger("Event-Engine")
+
+class EventType(IntEnum):
+    """
+    Kinds of simulation events.
+    The numeric value orders events that occur at the same instant: new and
+    returning processes join the ready queue before the running process
+    gives up the CPU, matching the Round Robin convention.
+    """
+    ARRIVAL = 0
+    IO_COMPLETE = 1
+    CPU_RELEASE = 2
+
+class EventCalendar:
+    """
+    Priority queue of pending events keyed on simulated time.
+    Events with equal time are ordered by type, then by insertion order.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[int, int, int, Any]] = []
+        self._counter = 0
+
+    def schedule(self, time: int, event_type: EventType, payload: Any = None) -> None:
+        """
+        Adds an event to the calendar.
+
+        Args:
+            time: Simulated time at which the event fires.
+            event_type: The EventType of the event.
+            payload: Event data (a Process, or a slice token for CPU_RELEASE).
+        """
+        self._counter += 1
+        heapq.heappush(self._heap, (time, event_type, self._counter, payload))
+
+    def schedule_many(self, events: List[Tuple[int, EventType, Any]]) -> None:
+        """Adds a batch of (time, event_type, payload) events in O(n)."""
+        for time, event_type, payload in events:
+            self._counter += 1
+            self._heap.append((time, event_type, self._counter, payload))
+        heapq.heapify(self._heap)
+
+    def pop(self) -> Tuple[int, EventType, Any]:
+        """Removes and returns the earliest event as (time, event_type, payload)."""
+        time, event_type, _, payload = heapq.heappop(self._heap)
+        return time, event_type, payload
+
+    def peek_time(self) -> int:
+        """Returns the time of the earliest pending event."""
+        return self._heap[0][0]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+class CPUCore:
+    """
+    Per-core state tracked by the event engine: its run queue, clock,
+    timeline and the process it is currently running.
+    """
+
+    def __init__(
+        self,
+        core_id: int,
+        ready_queue: ReadyQueue,
+        system_clock: SystemClock,
+        metrics_sink: Optional[MetricsSink] = None,
+        keep_timeline: bool = True
+    ):
+        self.core_id = core_id
+        self.ready_queue = ready_queue
+        self.system_clock = system_clock
+        self.metrics_sink = metrics_sink
+        self.keep_timeline = keep_timeline
+        self.timeline: List[Tuple[Any, int, int]] = []
+        self.migrations = 0
+
+        self.running: Optional[Process] = None
+        self.dispatch_time = 0
+        self.switch_end = 0
+        self.run_start = 0
+        self.start_remaining = 0
+        self.token = 0
+        self.last_pid: Optional[int] = None
+        self.accounted_time = 0
+
+    def load(self) -> int:
+        """Number of processes queued on or running on this core."""
+        return len(self.ready_queue) + (self.running is not None)
+
+    def record(self, label: Any, start: int, end: int) -> None:
+        """Appends a busy segment to the core's timeline and charges it to its clock."""
+        if start > self.accounted_time:
+            self.system_clock.advance(start - self.accounted_time, is_busy=False)
+        self.system_clock.advance(end - start, is_busy=True)
+        self.accounted_time = end
+        if self.keep_timeline:
+            self.timeline.append((label, start, end))
+        if self.metrics_sink is not None:
+            self.metrics_sink.record_segment(label, start, end)
+
+class EventEngine:
+    """
+    Discrete-event simulation core for one or more CPU cores.
+
+    Drives processes through NEW -> READY -> RUNNING -> (WAITING ->) TERMINATED
+    by processing arrival, I/O completion and CPU release events in time order.
+    The ready-queue policy is consulted only at decision points, so the cost of
+    a run is proportional to the number of events rather than simulated time.
+
+    With several cores, each core has its own run queue and clock. Arrivals go to
+    the least-loaded core, processes returning from I/O go back to the core they
+    last ran on, and idle cores may steal work from the busiest queue. Running on a
+    different core than last time costs migration_cost units ("MIG" segments).
+    """
+
+    def __init__(
+        self,
+        ready_queue: Union[ReadyQueue, Sequence[ReadyQueue]],
+        context_switch_time: int = 0,
+        system_clock: Optional[SystemClock] = None,
+        migration_cost: int = 0,
+        work_stealing: bool = False,
+        metrics_sink: Optional[MetricsSink] = None,
+        keep_timeline: bool = True
+    ):
+        """
+        Initializes the engine.
+
+        Args:
+            ready_queue: Policy deciding which ready process runs next, or one
+                         independent policy instance per core.
+            context_switch_time: Overhead time units spent switching between processes.
+            system_clock: Clock to charge busy and idle time to. With several cores this
+                          is an aggregate clock; per-core clocks are in core_clocks.
+            migration_cost: Overhead time units when a process runs on a new core.
+            work_stealing: Let idle cores pull waiting processes from other cores.
+            metrics_sink: Receives every segment and completed process as it is produced.
+            keep_timeline: Store the timeline. Disable for very long runs that only
+                           need the metrics sink and clocks.
+        """
+        queues = [ready_queue] if isinstance(ready_queue, ReadyQueue) else list(ready_queue)
+        if not queues:
+            raise ValueError("EventEngine needs at least one ready queue.")
+
+        self.num_cores = len(queues)
+        self.context_switch_time = context_switch_time
+        self.migration_cost = migration_cost
+        self.work_stealing = work_stealing
+        self.metrics_sink = metrics_sink
+        self.system_clock = system_clock if system_clock else SystemClock(num_cores=self.num_cores)
+        if self.num_cores == 1:
+            self.cores = [CPUCore(0, queues[0], self.system_clock, metrics_sink, keep_timeline)]
+        else:
+            self.cores = [
+                CPUCore(i, q, SystemClock(), metrics_sink, keep_timeline) for i, q in enumerate(queues)
+            ]
+        self.calendar = EventCalendar()
+        self.timeline: List[Tuple[Any, int, int]] = []
+
+        self._io_index: Dict[int, int] = {}
+        self._last_core: Dict[int, int] = {}
+        self._touched: Set[int] = set()
+        self._waiting = 0  # Processes sitting in any ready queue
+        self._arrivals: Optional[Iterator[Process]] = None
+        self._last_arrival = 0
+
+    @property
+    def ready_queue(self) -> ReadyQueue:
+        """The ready queue of the first (or only) core."""
+        return self.cores[0].ready_queue
+
+    @property
+    def core_timelines(self) -> List[List[Tuple[Any, int, int]]]:
+        """Execution segments per core."""
+        return [core.timeline for core in self.cores]
+
+    @property
+    def core_clocks(self) -> List[SystemClock]:
+        """Busy/idle clock per core."""
+        return [core.system_clock for core in self.cores]
+
+    def run(self, process_list: Iterable[Process]) -> List[Tuple[Any, int, int]]:
+        """
+        Simulates the given processes until all of them terminate.
+
+        Args:
+            process_list: Processes to simulate. Their state and metrics are updated in place.
+                          A list is loaded up front; any other iterable (e.g. a generator)
+                          is consumed lazily and must yield processes in arrival order,
+                          so unbounded workloads only keep active processes in memory.
+
+        Returns:
+            A list of tuples (pid_or_msg, start_time, end_time), with "CS" marking
+            context switch overhead and "MIG" marking migration overhead. With several
+            cores, the per-core timelines are merged in start-time order.
+        """
+        if isinstance(process_list, Sequence):
+            for p in process_list:
+                self._validate_io_bursts(p)
+            self.calendar.schedule_many([(p.arrival_time, EventType.ARRIVAL, p) for p in process_list])
+        else:
+            self._arrivals = iter(process_list)
+            self._schedule_next_arrival()
+
+        calendar = self.calendar
+        cores = self.cores
+        touched = self._touched
+        while calendar:
+            now = calendar.peek_time()
+
+            # Handle every event that fires at this instant before deciding
+            while calendar and calendar.peek_time() == now:
+                _, event_type, payload = calendar.pop()
+                if event_type == EventType.CPU_RELEASE:
+                    core = cores[payload[0]]
+                    if core.running is not None and payload[1] == core.token:
+                        self._release(core, now)
+                elif event_type == EventType.ARRIVAL:
+                    if self._arrivals is not None:
+                        self._schedule_next_arrival()
+                    self._make_ready(payload, self._place(payload), now)
+                else:
+                    self._make_ready(payload, cores[self._last_core.get(payload.pid, 0)], now)
+
+            for core_id in sorted(touched):
+                core = cores[core_id]
+                if core.running is None and core.ready_queue:
+                    self._dispatch(core, now)
+            touched.clear()
+
+            if self.work_stealing and self._waiting:
+                self._steal(now)
+
+        self._finish()
+        logger.info(f"Event-driven run completed on {self.num_cores} core(s). Generated {len(self.timeline)} segments.")
+        return self.timeline
+
+    def _validate_io_bursts(self, process: Process) -> None:
+        """Ensures I/O phases fall strictly inside the CPU burst, in order."""
+        last_offset = 0
+        for offset, duration in process.io_bursts:
+            if offset <= last_offset or offset >= process.burst_time or duration < 0:
+                raise ValueError(f"Invalid I/O phases for Process {process.pid}: {process.io_bursts}")
+            last_offset = offset
+
+    def _schedule_next_arrival(self) -> None:
+        """Pulls the next process from a lazy arrival stream into the calendar."""
+        p = next(self._arrivals, None)
+        if p is None:
+            self._arrivals = None
+            return
+        if p.arrival_time < self._last_arrival:
+            raise ValueError(f"Process {p.pid} arrives at {p.arrival_time}, before the previous arrival at {self._last_arrival}.")
+        self._validate_io_bursts(p)
+        self._last_arrival = p.arrival_time
+        self.calendar.schedule(p.arrival_time, EventType.ARRIVAL, p)
+
+    def _place(self, process: Process) -> CPUCore:
+        """Chooses the core a newly arrived process is queued on (least loaded first)."""
+        if self.num_cores == 1:
+            return self.cores[0]
+        return min(self.cores, key=CPUCore.load)
+
+    def _make_ready(self, process: Process, core: CPUCore, now: int) -> None:
+        """Moves an arriving or I/O-completed process into a core's ready queue."""
+        process.update_state(ProcessState.READY)
+        core.ready_queue.push(process, now)
+        self._waiting += 1
+        self._touched.add(core.core_id)
+
+        running = core.running
+        if running is not None:
+            # Bring the running process's remaining time up to date for the policy
+            running.remaining_time = core.start_remaining - max(0, now - core.run_start)
+            if core.ready_queue.should_preempt(running, process, now):
+                self._release(core, now)
+
+    def _dispatch(self, core: CPUCore, now: int) -> None:
+        """Gives the core to its next ready process and schedules the release."""
+        p = core.ready_queue.pop(now)
+        self._waiting -= 1
+        p.update_state(ProcessState.RUNNING)
+
+        switch = core.last_pid is not None and core.last_pid != p.pid
+        switch_end = now + (self.context_switch_time if switch else 0)
+        run_start = switch_end
+        last_core = self._last_core.get(p.pid)
+        if last_core is not None and last_core != core.core_id:
+            core.migrations += 1
+            run_start += self.migration_cost
+        self._last_core[p.pid] = core.core_id
+
+        # Run until the next I/O request or completion, capped by the time slice
+        run_length = p.remaining_time
+        if p.io_bursts:
+            index = self._io_index.get(p.pid, 0)
+            if index < len(p.io_bursts):
+                executed = p.burst_time - p.remaining_time
+                run_length = p.io_bursts[index][0] - executed
+        time_slice = core.ready_queue.time_slice(p)
+        if time_slice is not None:
+            run_length = min(run_length, time_slice)
+
+        core.running = p
+        core.dispatch_time = now
+        core.switch_end = switch_end
+        core.run_start = run_start
+        core.start_remaining = p.remaining_time
+        core.token += 1
+        self.calendar.schedule(run_start + run_length, EventType.CPU_RELEASE, (core.core_id, core.token))
+
+    def _release(self, core: CPUCore, now: int) -> None:
+        """Takes the core away from its running process and routes the process onwards."""
+        p = core.running
+        core.running = None
+        core.token += 1
+        self._touched.add(core.core_id)
+
+        if core.switch_end > core.dispatch_time:
+            core.record("CS", core.dispatch_time, min(now, core.switch_end))
+        if core.run_start > core.switch_end and now > core.switch_end:
+            core.record("MIG", core.switch_end, min(now, core.run_start))
+        executed = max(0, now - core.run_start)
+        if executed > 0:
+            core.record(p.pid, core.run_start, now)
+        p.remaining_time = core.start_remaining - executed
+        core.last_pid = p.pid
+
+        if p.remaining_time == 0:
+            p.update_state(ProcessState.TERMINATED)
+            p.calculate_metrics(now)
+            self._io_index.pop(p.pid, None)
+            self._last_core.pop(p.pid, None)
+            for other in self.cores:
+                other.ready_queue.forget(p)
+            if self.metrics_sink is not None:
+                self.metrics_sink.record_completion(p)
+            return
+
+        if p.io_bursts:
+            index = self._io_index.get(p.pid, 0)
+            if index < len(p.io_bursts) and p.io_bursts[index][0] == p.burst_time - p.remaining_time:
+                self._io_index[p.pid] = index + 1
+                p.update_state(ProcessState.WAITING)
+                core.ready_queue.block(p, now)
+                self.calendar.schedule(now + p.io_bursts[index][1], EventType.IO_COMPLETE, p)
+                return
+
+        p.update_state(ProcessState.READY)
+        core.ready_queue.push(p, now)
+        self._waiting += 1
+
+    def _steal(self, now: int) -> None:
+        """Lets idle cores with empty queues take one waiting process each from the busiest queue."""
+        for core in self.cores:
+            if core.running is not None or core.ready_queue:
+                continue
+            victim = max(self.cores, key=lambda c: len(c.ready_queue))
+            if not victim.ready_queue:
+                return
+            stolen, state = victim.ready_queue.steal(now)
+            core.ready_queue.adopt(stolen, state, now)
+            self._dispatch(core, now)
+            if not self._waiting:
+                return
+
+    def _finish(self) -> None:
+        """Pads per-core clocks to the makespan and builds the merged timeline."""
+        if self.num_cores == 1:
+            self.timeline = self.cores[0].timeline
+            return
+
+        makespan = max(core.accounted_time for core in self.cores)
+        for core in self.cores:
+            core.system_clock.advance(makespan - core.accounted_time, is_busy=False)
+        self.system_clock.advance_cores(makespan, sum(core.system_clock.get_busy_time() for core in self.cores))
+        self.timeline = sorted(
+            (segment for core in self.cores for segment in core.timeline),
+            key=lambda segment: segment[1]
+        )
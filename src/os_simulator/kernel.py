@@ -1,5 +1,5 @@
 import logging
-from typing import List, Optional, Protocol, Any, Tuple
+from typing import Iterable, List, Optional, Protocol, Any, Tuple
 from os_simulator.process import Process, ProcessState
 from os_simulator.system_clock import SystemClock
 
@@ -22,6 +22,8 @@ class Scheduler(Protocol):
         ...
 
 from os_simulator.memory_management.paging import PagingMemoryManager
+from os_simulator.event_engine import EventEngine
+from os_simulator.streaming_metrics import MetricsSink
 
 class Kernel:
     """
@@ -31,22 +33,53 @@ class Kernel:
     by delegating scheduling decisions to a pluggable scheduler and managing memory.
     """
 
-    def __init__(self, context_switch_time: int = 0, system_clock: Optional[SystemClock] = None):
+    def __init__(
+        self,
+        context_switch_time: int = 0,
+        system_clock: Optional[SystemClock] = None,
+        num_cores: int = 1,
+        migration_cost: int = 0,
+        work_stealing: bool = False,
+        metrics_sink: Optional[MetricsSink] = None
+    ):
         """
         Initializes the Kernel.
         
         Args:
             context_switch_time: Overhead time units added when switching between processes.
             system_clock: Persistent clock instance for tracking simulation time.
+            num_cores: Number of CPU cores. More than one core requires the event-driven core.
+            migration_cost: Overhead time units when a process resumes on a different core.
+            work_stealing: Let idle cores take waiting processes from other cores' run queues.
+            metrics_sink: Optional sink (e.g. StreamingMetrics) fed every segment and
+                          completed process as the simulation produces them.
         """
+        if num_cores < 1:
+            raise ValueError("The kernel needs at least one CPU core.")
+        if migration_cost < 0:
+            raise ValueError("migration_cost cannot be negative.")
+        if system_clock is not None and system_clock.num_cores != num_cores:
+            raise ValueError(
+                f"system_clock tracks {system_clock.num_cores} core(s) but the kernel has {num_cores}; "
+                f"pass SystemClock(num_cores={num_cores})."
+            )
+
         self.process_table: List[Process] = []
+        # State of each process when it was added, restored by reset()
+        self._initial_states: List[Process] = []
         self.ready_queue: List[Process] = []
         self.scheduler: Optional[Scheduler] = None
         self.memory_manager = PagingMemoryManager()
         self.context_switch_time = context_switch_time
-        self.system_clock = system_clock if system_clock else SystemClock()
+        self.num_cores = num_cores
+        self.migration_cost = migration_cost
+        self.work_stealing = work_stealing
+        self.metrics_sink = metrics_sink
+        self.system_clock = system_clock if system_clock else SystemClock(num_cores=num_cores)
         self.execution_order: List[Any] = []
-        logger.info(f"Kernel initialized with Paging Memory Manager. (CS Overhead: {context_switch_time})")
+        self.core_timelines: List[List[Tuple[Any, int, int]]] = []
+        self.core_clocks: List[SystemClock] = []
+        logger.info(f"Kernel initialized with Paging Memory Manager. (CS Overhead: {context_switch_time}, Cores: {num_cores})")
 
     def add_process(self, process: Process) -> None:
         """
@@ -58,6 +91,7 @@ class Kernel:
         # Attempt to allocate memory first
         if self.memory_manager.allocate(process.pid, process.memory_required):
             self.process_table.append(process)
+            self._initial_states.append(process.clone())
             logger.info(f"Process {process.pid} ({process.name}) added to process table and memory allocated.")
         else:
             logger.error(f"Failed to add Process {process.pid}: Insufficient memory.")
@@ -84,6 +118,8 @@ class Kernel:
         if not self.scheduler:
             logger.error("Attempted to dispatch without a scheduler set.")
             raise ValueError("No scheduler set. Call set_scheduler() first.")
+        if self.num_cores > 1:
+            raise ValueError("dispatch() models a single CPU. Use simulate() for multi-core runs.")
 
         logger.info("Dispatching processes to scheduler...")
         
@@ -106,43 +142,104 @@ class Kernel:
             
             # Detect idle gap in scheduler's timeline
             if start > current_clock:
-                idle_gap = start - current_clock
-                for _ in range(idle_gap):
-                    self.system_clock.tick(is_busy=False)
+                self.system_clock.advance(start - current_clock, is_busy=False)
                 current_clock = start
 
             # Inject Context Switch if switching processes
             if last_pid is not None and last_pid != pid and self.context_switch_time > 0:
                 cs_end = current_clock + self.context_switch_time
                 final_timeline.append(("CS", current_clock, cs_end))
+                if self.metrics_sink is not None:
+                    self.metrics_sink.record_segment("CS", current_clock, cs_end)
                 # CPU is 'busy' doing context switching work
-                for _ in range(self.context_switch_time):
-                    self.system_clock.tick(is_busy=True)
+                self.system_clock.advance(self.context_switch_time, is_busy=True)
                 current_clock = cs_end
 
             # Add process execution segment
             seg_end = current_clock + duration
             final_timeline.append((pid, current_clock, seg_end))
+            if self.metrics_sink is not None:
+                self.metrics_sink.record_segment(pid, current_clock, seg_end)
             # CPU is 'busy' doing process work
-            for _ in range(duration):
-                self.system_clock.tick(is_busy=True)
-            
+            self.system_clock.advance(duration, is_busy=True)
+
             current_clock = seg_end
             last_pid = pid
 
+        if self.metrics_sink is not None:
+            for p in active_processes:
+                if p.completion_time is not None:
+                    self.metrics_sink.record_completion(p)
+
         self.execution_order = final_timeline
         logger.info(f"Dispatch completed. Generated {len(final_timeline)} segments (including overhead).")
         return final_timeline
 
-    def run(self) -> List[Any]:
+    def simulate(
+        self,
+        process_stream: Optional[Iterable[Process]] = None,
+        keep_timeline: bool = True
+    ) -> List[Tuple[Any, int, int]]:
+        """
+        Runs the discrete-event simulation core with the current scheduler.
+
+        Instead of post-processing a precomputed timeline, arrivals, I/O completions
+        and CPU releases are processed in time order and the scheduler's ready queue
+        is consulted only at decision points. Context switch overhead is simulated
+        in place, so processes arriving during a switch are queued normally.
+
+        With several cores, every core gets its own ready queue from the scheduler;
+        per-core timelines and clocks are kept in core_timelines and core_clocks, and
+        the returned timeline merges them in start-time order.
+
+        Args:
+            process_stream: Processes to simulate instead of the process table, consumed
+                            lazily in arrival order. They bypass memory allocation, so
+                            arbitrarily long workloads can be generated on the fly.
+            keep_timeline: Store the execution timeline. With a metrics sink attached,
+                           disabling it keeps memory constant over the run.
+
+        Returns:
+            A list of tuples (pid_or_msg, start_time, end_time).
+        """
+        if not self.scheduler:
+            logger.error("Attempted to simulate without a scheduler set.")
+            raise ValueError("No scheduler set. Call set_scheduler() first.")
+
+        logger.info("Starting event-driven simulation...")
+
+        if process_stream is None:
+            process_stream = [p for p in self.process_table if p.state != ProcessState.TERMINATED]
+        engine = EventEngine(
+            [self.scheduler.create_ready_queue() for _ in range(self.num_cores)],
+            context_switch_time=self.context_switch_time,
+            system_clock=self.system_clock,
+            migration_cost=self.migration_cost,
+            work_stealing=self.work_stealing,
+            metrics_sink=self.metrics_sink,
+            keep_timeline=keep_timeline
+        )
+        self.execution_order = engine.run(process_stream)
+        self.core_timelines = engine.core_timelines
+        self.core_clocks = engine.core_clocks
+        return self.execution_order
+
+    def run(self, event_driven: bool = False) -> List[Any]:
         """
         Executes the full simulation using the current configuration.
 
+        Args:
+            event_driven: Use the discrete-event core (simulate()) instead of
+                          post-processing the scheduler's precomputed timeline.
+                          Multi-core kernels always use the discrete-event core.
+
         Returns:
             The final execution log/sequence.
         """
         logger.info("Starting simulation run...")
         try:
+            if event_driven or self.num_cores > 1:
+                return self.simulate()
             return self.dispatch()
         except Exception as e:
             logger.error(f"Simulation failed: {e}")
@@ -150,18 +247,17 @@ class Kernel:
 
     def reset(self) -> None:
         """
-        Resets the kernel state to its initial configuration.
+        Resets the kernel state to its initial configuration. Each process is
+        restored to the snapshot taken when it was added.
         """
         self.system_clock.reset()
         self.execution_order = []
+        self.core_timelines = []
+        self.core_clocks = []
         self.ready_queue = []
         self.memory_manager.reset()
-        for p in self.process_table:
-            p.remaining_time = p.burst_time
-            p.state = ProcessState.NEW
-            p.completion_time = None
-            p.waiting_time = 0
-            p.turnaround_time = 0
+        for p, initial in zip(self.process_table, self._initial_states):
+            p.restore(initial)
             self.memory_manager.allocate(p.pid, p.memory_required)
             
         logger.info("Kernel state and Memory reset.")
@@ -1,103 +1,117 @@
-from typing import List, Dict, Any
+import heapq
+from collections import OrderedDict, deque
+from typing import List, Dict, Any, Sequence, Tuple
 
-def fifo_replacement(reference_string: List[int], frame_size: int) -> Dict[str, Any]:
+def fault_ratio(faults: int, total: int) -> float:
+    """Page faults per reference, rounded the same way for every result."""
+    return round(faults / total, 2) if total > 0 else 0
+
+def _result(faults: int, total: int) -> Dict[str, Any]:
+    """Builds the result dict shared by every replacement algorithm."""
+    return {
+        "page_faults": faults,
+        "page_hits": total - faults,
+        "fault_ratio": fault_ratio(faults, total)
+    }
+
+def fifo_replacement(reference_string: Sequence[int], frame_size: int) -> Dict[str, Any]:
     """
     First-In-First-Out (FIFO) Page Replacement Algorithm.
     Replaces the page that was brought in earliest.
+
+    Resident pages are kept in a set for O(1) lookups and in a deque recording
+    load order, so each reference costs O(1) regardless of frame_size.
     """
-    frames = []
+    if frame_size <= 0:
+        raise ValueError("frame_size must be positive.")
+    resident = set()
+    queue = deque()
     faults = 0
-    hits = 0
 
     for page in reference_string:
-        if page in frames:
-            hits += 1
-        else:
+        if page not in resident:
             faults += 1
-            if len(frames) < frame_size:
-                frames.append(page)
-            else:
-                frames.pop(0)
-                frames.append(page)
+            if len(queue) == frame_size:
+                resident.discard(queue.popleft())
+            queue.append(page)
+            resident.add(page)
 
-    total = len(reference_string)
-    return {
-        "page_faults": faults,
-        "page_hits": hits,
-        "fault_ratio": round(faults / total, 2) if total > 0 else 0
-    }
+    return _result(faults, len(reference_string))
 
-def lru_replacement(reference_string: List[int], frame_size: int) -> Dict[str, Any]:
+def lru_replacement(reference_string: Sequence[int], frame_size: int) -> Dict[str, Any]:
     """
     Least Recently Used (LRU) Page Replacement Algorithm.
     Replaces the page that has not been used for the longest period of time.
+
+    Resident pages live in an OrderedDict (a hash table threaded by a doubly-linked
+    list) ordered from least to most recently used, so each reference is O(1).
     """
-    frames = []
+    if frame_size <= 0:
+        raise ValueError("frame_size must be positive.")
+    frames: "OrderedDict[int, None]" = OrderedDict()
+    touch = frames.move_to_end
     faults = 0
-    hits = 0
 
     for page in reference_string:
         if page in frames:
-            hits += 1
-            # Move the hit page to the end (most recently used)
-            frames.remove(page)
-            frames.append(page)
+            # Hit: the page becomes the most recently used
+            touch(page)
         else:
             faults += 1
-            if len(frames) < frame_size:
-                frames.append(page)
-            else:
-                # Remove the first element (least recently used)
-                frames.pop(0)
-                frames.append(page)
+            if len(frames) == frame_size:
+                # Evict the least recently used page
+                frames.popitem(last=False)
+            frames[page] = None
 
-    total = len(reference_string)
-    return {
-        "page_faults": faults,
-        "page_hits": hits,
-        "fault_ratio": round(faults / total, 2) if total > 0 else 0
-    }
+    return _result(faults, len(reference_string))
+
+def next_use_indices(reference_string: Sequence[int]) -> List[int]:
+    """
+    For each position i, the index of the next reference to the same page,
+    or len(reference_string) if the page is never referenced again.
+    Computed in one backward pass.
+    """
+    n = len(reference_string)
+    next_use = [n] * n
+    last_seen: Dict[int, int] = {}
+    for i in range(n - 1, -1, -1):
+        page = reference_string[i]
+        next_use[i] = last_seen.get(page, n)
+        last_seen[page] = i
+    return next_use
 
-def optimal_replacement(reference_string: List[int], frame_size: int) -> Dict[str, Any]:
+def optimal_replacement(reference_string: Sequence[int], frame_size: int) -> Dict[str, Any]:
     """
     Optimal Page Replacement Algorithm.
     Replaces the page that will not be used for the longest period of time in the future.
+
+    Next uses are precomputed (next_use_indices) and resident pages sit in a max-heap
+    keyed on their next use, so each reference costs O(log frame_size). A hit leaves
+    the page's old heap entry behind; such entries are recognised on pop and the
+    heap is rebuilt from the resident pages when they pile up.
     """
-    frames = []
+    if frame_size <= 0:
+        raise ValueError("frame_size must be positive.")
+    next_use = next_use_indices(reference_string)
+    resident: Dict[int, int] = {}  # page -> index of its next use
+    heap: List[Tuple[int, int]] = []  # (-next use, page)
     faults = 0
-    hits = 0
 
-    for i in range(len(reference_string)):
-        page = reference_string[i]
-        
-        if page in frames:
-            hits += 1
-        else:
+    for i, page in enumerate(reference_string):
+        upcoming = next_use[i]
+        if page not in resident:
             faults += 1
-            if len(frames) < frame_size:
-                frames.append(page)
-            else:
-                # Decide which page to replace
-                farthest_idx = -1
-                page_to_replace = -1
-                
-                for f in frames:
-                    try:
-                        # Find the next occurrence of f in the remainder of the reference string
-                        next_usage = reference_string.index(f, i + 1)
-                        if next_usage > farthest_idx:
-                            farthest_idx = next_usage
-                            page_to_replace = f
-                    except ValueError:
-                        # If page f is never used again, select it for replacement
-                        page_to_replace = f
+            if len(resident) == frame_size:
+                # Evict the resident page whose next use is farthest away
+                while True:
+                    key, victim = heapq.heappop(heap)
+                    if resident.get(victim) == -key:
+                        del resident[victim]
                         break
-                
-                frames[frames.index(page_to_replace)] = page
+        resident[page] = upcoming
+        heapq.heappush(heap, (-upcoming, page))
+        if len(heap) > 2 * frame_size + 16:
+            heap = [(-use, p) for p, use in resident.items()]
+            heapq.heapify(heap)
 
-    total = len(reference_string)
-    return {
-        "page_faults": faults,
-        "page_hits": hits,
-        "fault_ratio": round(faults / total, 2) if total > 0 else 0
-    }
\ No newline at end of file
+    return _result(faults, len(reference_string))
@@ -0,0 +1,313 @@
+import contextlib
+import csv
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+from os_simulator.memory_management.page_replacement import _result
+from os_simulator.memory_management.replacement_policies import ALGORITHMS, simulate_replacement
+from os_simulator.memory_management.stack_distance import (
+    OPT_STACK_FRAME_LIMIT, fault_curve, lru_stack_distances, opt_stack_distances
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; reference strings may be any int sequence
+    np = None
+
+logger = logging.getLogger("Replacement-Batch")
+
+# Reference trace: an 8-byte magic, the byte length of a JSON index (uint64), the
+# index {"names": [...], "lengths": [...]} padded to 8 bytes, then every reference
+# string back to back as little-endian int64 pages.
+REFERENCE_MAGIC = b"OSPAGES1"
+_HEADER = struct.Struct("<Q")
+_PAGE_SIZE = 8
+
+# Measured cost of one LRU stack-distance pass (a Fenwick tree walk per reference)
+# in lru_replacement runs; the pass pays off only for more frame sizes than this
+_LRU_STACK_COST = 10
+
+References = Union[str, Mapping[str, Sequence[int]], Sequence[Sequence[int]]]
+
+def write_reference_trace(path: str, references: Mapping[str, Sequence[int]]) -> int:
+    """
+    Writes named reference strings (lists, arrays or NumPy arrays) to one binary
+    reference trace that ReferenceTraceReader can memory-map.
+
+    Returns:
+        The number of reference strings written.
+    """
+    names = [str(name) for name in references]
+    columns = []
+    for pages in references.values():
+        if np is not None and isinstance(pages, np.ndarray):
+            columns.append(np.ascontiguousarray(pages, dtype="<i8").tobytes())
+        else:
+            values = array("q", pages)
+            if sys.byteorder != "little":
+                values.byteswap()
+            columns.append(values.tobytes())
+
+    index = json.dumps({"names": names, "lengths": [len(c) // _PAGE_SIZE for c in columns]}).encode()
+    index += b" " * (-len(index) % _PAGE_SIZE)
+    with open(path, "wb") as f:
+        f.write(REFERENCE_MAGIC)
+        f.write(_HEADER.pack(len(index)))
+        f.write(index)
+        for column in columns:
+            f.write(column)
+    logger.info(f"Wrote {len(names)} reference strings to {path}")
+    return len(names)
+
+class ReferenceTraceReader:
+    """
+    Memory-mapped view of a binary reference trace. reader[name] is a zero-copy
+    int64 memoryview over the mapping, so strings are paged in by the OS as a
+    policy walks them and never converted to lists.
+
+    Views borrow the mapping: release them (or drop every reference to them)
+    before close(), or copy them with list() / array("q", view) to keep the pages.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is not a reference trace.") from None
+        if self._data[:len(REFERENCE_MAGIC)] != REFERENCE_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a reference trace.")
+
+        index_start = len(REFERENCE_MAGIC) + _HEADER.size
+        (index_size,) = _HEADER.unpack_from(self._data, len(REFERENCE_MAGIC))
+        index = json.loads(bytes(self._data[index_start:index_start + index_size]))
+        self._spans: Dict[str, Tuple[int, int]] = {}
+        offset = index_start + index_size
+        for name, length in zip(index["names"], index["lengths"]):
+            self._spans[name] = (offset, length)
+            offset += length * _PAGE_SIZE
+        self._view = memoryview(self._data)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._spans)
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __getitem__(self, name: str) -> Sequence[int]:
+        offset, length = self._spans[name]
+        pages = self._view[offset:offset + length * _PAGE_SIZE].cast("q")
+        if sys.byteorder != "little":
+            swapped = array("q")
+            swapped.frombytes(pages.tobytes())
+            swapped.byteswap()
+            return swapped
+        return pages
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._spans)
+
+    def close(self) -> None:
+        """
+        Unmaps the trace and closes the file.
+
+        Raises:
+            BufferError: If a view from reader[name] is still alive. The file is
+                         closed regardless; the mapping is freed with the last view.
+        """
+        try:
+            self._view.release()
+            self._data.close()
+        finally:
+            self._file.close()
+
+    def __enter__(self) -> "ReferenceTraceReader":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        # Views kept alive by the propagating traceback must not mask its error
+        with contextlib.suppress(BufferError):
+            self.close()
+
+def as_page_sequence(pages: Sequence[int]) -> Sequence[int]:
+    """
+    Returns pages in a form the replacement loops iterate at Python-int speed.
+    NumPy arrays become a zero-copy memoryview instead of yielding NumPy scalars.
+    """
+    if np is not None and isinstance(pages, np.ndarray):
+        return memoryview(np.ascontiguousarray(pages, dtype=np.int64))
+    return pages
+
+def evaluate_reference_string(
+    pages: Sequence[int],
+    frame_sizes: Sequence[int],
+    policies: Sequence[str]
+) -> List[Dict[str, Any]]:
+    """
+    Runs every (policy, frame size) pair on one reference string.
+
+    LRU and Optimal are stack algorithms, so their fault counts for every frame
+    size can come from one stack-distance pass instead of one simulation per
+    size. The pass is used only when it is cheaper (see _use_stack_pass).
+
+    Returns:
+        One row per pair with policy, frames, references, page_faults,
+        page_hits and fault_ratio, policies outermost.
+    """
+    pages = as_page_sequence(pages)
+    total = len(pages)
+    rows = []
+    for policy in policies:
+        if _use_stack_pass(policy, frame_sizes):
+            max_frames = max(frame_sizes)
+            if policy == "lru":
+                distances = lru_stack_distances(pages)
+            else:
+                distances = opt_stack_distances(pages, max_frames)
+            faults = fault_curve(distances, max_frames)
+            results = [_result(faults[frames - 1], total) for frames in frame_sizes]
+        else:
+            results = [simulate_replacement(pages, frames, policy) for frames in frame_sizes]
+        for frames, result in zip(frame_sizes, results):
+            row: Dict[str, Any] = {"policy": policy, "frames": frames, "references": total}
+            row.update(result)
+            rows.append(row)
+    return rows
+
+def _use_stack_pass(policy: str, frame_sizes: Sequence[int]) -> bool:
+    """
+    Whether one stack-distance pass beats simulating each frame size. An LRU pass
+    costs about _LRU_STACK_COST simulations; an OPT pass is O(n * max_frames),
+    roughly 2 + max_frames / 16 simulations, and is never used past OPT_STACK_FRAME_LIMIT.
+    """
+    if policy == "lru":
+        return len(frame_sizes) > _LRU_STACK_COST
+    if policy == "optimal":
+        max_frames = max(frame_sizes)
+        return max_frames <= OPT_STACK_FRAME_LIMIT and len(frame_sizes) > 2 + max_frames // 16
+    return False
+
+# Reference strings (or a trace path) shipped once to each pool worker
+_worker_references: Union[str, Mapping[str, Sequence[int]]] = {}
+
+def _init_worker(references: Union[str, Mapping[str, Sequence[int]]]) -> None:
+    """Pool initializer: receives the trace path, or the in-memory strings once."""
+    global _worker_references
+    _worker_references = references
+    logging.disable(logging.INFO)
+
+def _run_job(job: Tuple[str, Sequence[int], Sequence[str]]) -> List[Dict[str, Any]]:
+    name, frame_sizes, policies = job
+    if isinstance(_worker_references, str):
+        # Mapped per job so the file is closed when the job ends; pool workers
+        # exit without running atexit hooks
+        with ReferenceTraceReader(_worker_references) as reader:
+            return evaluate_reference_string(reader[name], frame_sizes, policies)
+    return evaluate_reference_string(_worker_references[name], frame_sizes, policies)
+
+class ReplacementBatch:
+    """
+    Evaluates page replacement policies over many reference strings and a grid
+    of frame sizes, one pool job per reference string, and collects a tidy
+    result table with one row per (reference string, policy, frame size).
+
+    Reference strings are given as a mapping of name -> sequence (lists,
+    array('q') or NumPy arrays), a 2-D NumPy array or list of strings (named by
+    row number), or the path of a binary reference trace (write_reference_trace).
+    With a trace path each worker memory-maps the file itself, so the strings
+    are never pickled or copied into lists.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        """
+        Args:
+            workers: Worker processes; None or 1 runs in this process,
+                     0 uses one worker per CPU.
+        """
+        self.workers = (os.cpu_count() or 1) if workers == 0 else workers
+        self.rows: List[Dict[str, Any]] = []
+
+    def run(
+        self,
+        references: References,
+        frame_sizes: Sequence[int],
+        policies: Sequence[str] = ("fifo", "lru", "optimal")
+    ) -> List[Dict[str, Any]]:
+        """
+        Runs the full grid.
+
+        Args:
+            references: Reference strings or a reference trace path (see the class docstring).
+            frame_sizes: Frame counts to try.
+            policies: Names from ALGORITHMS.
+
+        Returns:
+            One row per combination with trace, policy, frames, references,
+            page_faults, page_hits and fault_ratio, in trace order.
+        """
+        frame_sizes = sorted(set(frame_sizes))
+        if not frame_sizes or frame_sizes[0] <= 0:
+            raise ValueError("frame_sizes must be positive.")
+        for policy in policies:
+            if policy not in ALGORITHMS:
+                raise ValueError(f"Unknown page replacement algorithm: {policy}. Choose from {ALGORITHMS}.")
+
+        reader = None
+        if isinstance(references, str):
+            reader = ReferenceTraceReader(references)
+            names = reader.names
+            local = reader
+        else:
+            if not isinstance(references, Mapping):
+                references = {str(i): pages for i, pages in enumerate(references)}
+            names = list(references)
+            local = references
+        jobs = [(name, frame_sizes, tuple(policies)) for name in names]
+
+        try:
+            if self.workers is None or self.workers <= 1 or len(jobs) <= 1:
+                outcomes = [evaluate_reference_string(local[name], frame_sizes, policies) for name in names]
+            else:
+                logger.info(f"Evaluating {len(jobs)} reference strings on {self.workers} worker processes...")
+                with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker, initargs=(references,)) as pool:
+                    chunksize = max(1, len(jobs) // (self.workers * 4))
+                    outcomes = list(pool.map(_run_job, jobs, chunksize=chunksize))
+        except BaseException:
+            if reader is not None:
+                # The traceback may still hold page views; keep the original error
+                with contextlib.suppress(BufferError):
+                    reader.close()
+            raise
+        if reader is not None:
+            reader.close()
+
+        self.rows = []
+        for name, rows in zip(names, outcomes):
+            for row in rows:
+                self.rows.append({"trace": name, **row})
+        logger.info(f"Replacement batch finished: {len(self.rows)} results.")
+        return self.rows
+
+    def to_csv(self, filepath: str) -> None:
+        """Writes the result rows to a CSV file."""
+        if not self.rows:
+            logger.error("No replacement results to export.")
+            return
+        with open(filepath, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(self.rows[0]))
+            writer.writeheader()
+            writer.writerows(self.rows)
+        logger.info(f"Replacement results exported to {filepath}")
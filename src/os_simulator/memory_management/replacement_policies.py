@@ -0,0 +1,388 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Type
+from os_simulator.memory_management.page_replacement import (
+    _result, fifo_replacement, lru_replacement, optimal_replacement
+)
+
+class ReplacementPolicy(ABC):
+    """
+    Online page replacement policy, fed one page reference at a time.
+
+    Subclasses keep whatever bookkeeping they need so that access() is O(1)
+    (amortized) regardless of the number of frames. run() replays a whole
+    reference string and returns the same result dict as the functions in
+    page_replacement: page_faults, page_hits and fault_ratio.
+    """
+
+    def __init__(self, frame_size: int):
+        if frame_size <= 0:
+            raise ValueError("frame_size must be positive.")
+        self.frame_size = frame_size
+        self.reset()
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Empties memory."""
+        pass
+
+    @abstractmethod
+    def access(self, page: int) -> bool:
+        """
+        References a page, loading it (and evicting another) on a fault.
+
+        Returns:
+            True on a hit, False on a page fault.
+        """
+        pass
+
+    def run(self, reference_string: Sequence[int]) -> Dict[str, Any]:
+        """Replays a reference string from empty memory."""
+        self.reset()
+        access = self.access
+        hits = 0
+        for page in reference_string:
+            if access(page):
+                hits += 1
+        return _result(len(reference_string) - hits, len(reference_string))
+
+class FIFOPolicy(ReplacementPolicy):
+    """First-In-First-Out: evicts the page loaded earliest."""
+
+    def reset(self) -> None:
+        self._queue: Deque[int] = deque()
+        self._resident = set()
+
+    def access(self, page: int) -> bool:
+        if page in self._resident:
+            return True
+        if len(self._queue) == self.frame_size:
+            self._resident.discard(self._queue.popleft())
+        self._queue.append(page)
+        self._resident.add(page)
+        return False
+
+    def run(self, reference_string: Sequence[int]) -> Dict[str, Any]:
+        # The loop-based function is faster than replaying access()
+        return fifo_replacement(reference_string, self.frame_size)
+
+class LRUPolicy(ReplacementPolicy):
+    """Least Recently Used: evicts the page unused for the longest time."""
+
+    def reset(self) -> None:
+        self._frames: "OrderedDict[int, None]" = OrderedDict()
+
+    def access(self, page: int) -> bool:
+        if page in self._frames:
+            self._frames.move_to_end(page)
+            return True
+        if len(self._frames) == self.frame_size:
+            self._frames.popitem(last=False)
+        self._frames[page] = None
+        return False
+
+    def run(self, reference_string: Sequence[int]) -> Dict[str, Any]:
+        return lru_replacement(reference_string, self.frame_size)
+
+class ClockPolicy(ReplacementPolicy):
+    """
+    CLOCK: frames form a circle with one reference bit each. A hit sets the bit;
+    on a fault the hand sweeps forward clearing set bits and replaces the first
+    page whose bit is already clear.
+    """
+
+    def reset(self) -> None:
+        self._pages: List[Optional[int]] = [None] * self.frame_size
+        self._referenced = [False] * self.frame_size
+        self._slot: Dict[int, int] = {}
+        self._hand = 0
+
+    def access(self, page: int) -> bool:
+        slot = self._slot.get(page)
+        if slot is not None:
+            self._referenced[slot] = True
+            return True
+
+        referenced = self._referenced
+        hand = self._hand
+        while referenced[hand]:
+            referenced[hand] = False
+            hand = (hand + 1) % self.frame_size
+        victim = self._pages[hand]
+        if victim is not None:
+            del self._slot[victim]
+        self._pages[hand] = page
+        self._slot[page] = hand
+        # A newly loaded page starts with a clear bit, as in the classic formulation
+        self._hand = (hand + 1) % self.frame_size
+        return False
+
+class SecondChancePolicy(ReplacementPolicy):
+    """
+    Second-Chance FIFO: the oldest page is evicted unless its reference bit is
+    set, in which case the bit is cleared and the page moves to the back of the
+    queue. Evicts the same pages as CLOCK; this is the queue formulation.
+    """
+
+    def reset(self) -> None:
+        self._queue: Deque[int] = deque()
+        self._referenced: Dict[int, bool] = {}
+
+    def access(self, page: int) -> bool:
+        referenced = self._referenced
+        if page in referenced:
+            referenced[page] = True
+            return True
+        if len(self._queue) == self.frame_size:
+            queue = self._queue
+            while True:
+                oldest = queue.popleft()
+                if referenced[oldest]:
+                    referenced[oldest] = False
+                    queue.append(oldest)
+                else:
+                    del referenced[oldest]
+                    break
+        self._queue.append(page)
+        referenced[page] = False
+        return False
+
+class LFUPolicy(ReplacementPolicy):
+    """
+    Least Frequently Used with O(1) frequency buckets. Pages are grouped by
+    reference count; the victim is the least recently used page of the lowest
+    count. Counts are forgotten when a page is evicted.
+    """
+
+    def reset(self) -> None:
+        self._count: Dict[int, int] = {}
+        self._buckets: Dict[int, "OrderedDict[int, None]"] = {}
+        self._min_count = 0
+
+    def _bump(self, page: int, count: int) -> None:
+        self._count[page] = count
+        bucket = self._buckets.get(count)
+        if bucket is None:
+            bucket = self._buckets[count] = OrderedDict()
+        bucket[page] = None
+
+    def access(self, page: int) -> bool:
+        count = self._count.get(page)
+        if count is not None:
+            bucket = self._buckets[count]
+            del bucket[page]
+            if not bucket:
+                del self._buckets[count]
+                if self._min_count == count:
+                    self._min_count = count + 1
+            self._bump(page, count + 1)
+            return True
+
+        if len(self._count) == self.frame_size:
+            bucket = self._buckets[self._min_count]
+            victim, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self._buckets[self._min_count]
+            del self._count[victim]
+        self._bump(page, 1)
+        self._min_count = 1
+        return False
+
+class ARCPolicy(ReplacementPolicy):
+    """
+    Adaptive Replacement Cache (Megiddo & Modha). Resident pages are split
+    between T1 (seen once recently) and T2 (seen at least twice); ghost lists
+    B1 and B2 remember recently evicted pages of each kind and steer the target
+    size p of T1, so the cache adapts between recency and frequency.
+    """
+
+    def reset(self) -> None:
+        self._t1: "OrderedDict[int, None]" = OrderedDict()
+        self._t2: "OrderedDict[int, None]" = OrderedDict()
+        self._b1: "OrderedDict[int, None]" = OrderedDict()
+        self._b2: "OrderedDict[int, None]" = OrderedDict()
+        self.p = 0.0
+
+    def _replace(self, in_b2: bool) -> None:
+        """Evicts from T1 or T2 into the matching ghost list."""
+        t1 = self._t1
+        if t1 and (len(t1) > self.p or (in_b2 and len(t1) == self.p)):
+            victim, _ = t1.popitem(last=False)
+            self._b1[victim] = None
+        else:
+            victim, _ = self._t2.popitem(last=False)
+            self._b2[victim] = None
+
+    def access(self, page: int) -> bool:
+        t1, t2, b1, b2 = self._t1, self._t2, self._b1, self._b2
+        c = self.frame_size
+        if page in t1:
+            del t1[page]
+            t2[page] = None
+            return True
+        if page in t2:
+            t2.move_to_end(page)
+            return True
+
+        if page in b1:
+            self.p = min(c, self.p + max(len(b2) / len(b1), 1))
+            self._replace(False)
+            del b1[page]
+            t2[page] = None
+            return False
+        if page in b2:
+            self.p = max(0.0, self.p - max(len(b1) / len(b2), 1))
+            self._replace(True)
+            del b2[page]
+            t2[page] = None
+            return False
+
+        l1 = len(t1) + len(b1)
+        if l1 == c:
+            if len(t1) < c:
+                b1.popitem(last=False)
+                self._replace(False)
+            else:
+                t1.popitem(last=False)
+        else:
+            total = l1 + len(t2) + len(b2)
+            if total >= c:
+                if total == 2 * c:
+                    b2.popitem(last=False)
+                self._replace(False)
+        t1[page] = None
+        return False
+
+class TwoQueuePolicy(ReplacementPolicy):
+    """
+    Full 2Q (Johnson & Shasha). New pages enter the FIFO A1in; pages evicted
+    from it are remembered in the ghost FIFO A1out, and a page referenced again
+    while in A1out is promoted to the LRU list Am. One-off scans therefore pass
+    through A1in without flushing the frequently used pages in Am.
+    """
+
+    def __init__(self, frame_size: int, in_fraction: float = 0.25, out_fraction: float = 0.5):
+        """
+        Args:
+            frame_size: Number of frames.
+            in_fraction: Share of the frames for A1in (Kin).
+            out_fraction: Size of the A1out ghost list relative to frame_size (Kout).
+        """
+        self.k_in = max(1, int(frame_size * in_fraction))
+        self.k_out = max(1, int(frame_size * out_fraction))
+        super().__init__(frame_size)
+
+    def reset(self) -> None:
+        self._a1in: "OrderedDict[int, None]" = OrderedDict()
+        self._a1out: "OrderedDict[int, None]" = OrderedDict()
+        self._am: "OrderedDict[int, None]" = OrderedDict()
+
+    def _reclaim(self) -> None:
+        """Frees one frame, preferring A1in once it exceeds Kin."""
+        if len(self._a1in) + len(self._am) < self.frame_size:
+            return
+        if len(self._a1in) > self.k_in or not self._am:
+            victim, _ = self._a1in.popitem(last=False)
+            self._a1out[victim] = None
+            if len(self._a1out) > self.k_out:
+                self._a1out.popitem(last=False)
+        else:
+            self._am.popitem(last=False)
+
+    def access(self, page: int) -> bool:
+        if page in self._am:
+            self._am.move_to_end(page)
+            return True
+        if page in self._a1in:
+            return True
+        # Checked before reclaiming, which may trim this very page off A1out's tail
+        in_out = page in self._a1out
+        self._reclaim()
+        if in_out:
+            self._a1out.pop(page, None)
+            self._am[page] = None
+        else:
+            self._a1in[page] = None
+        return False
+
+class WorkingSetPolicy(ReplacementPolicy):
+    """
+    Working-Set policy (Denning): a page stays resident while it has been
+    referenced within the last `window` references, the current one included,
+    so the working set never holds more than `window` pages. With a window
+    larger than frame_size, the least recently referenced page is evicted once
+    the working set outgrows the frames; with the default window of frame_size
+    that cap never binds, giving the pure working-set policy with tau = frame_size.
+    """
+
+    def __init__(self, frame_size: int, window: Optional[int] = None):
+        """
+        Args:
+            frame_size: Maximum number of resident pages.
+            window: Working-set window tau in references, counting the current
+                    one (default frame_size).
+        """
+        if window is not None and window <= 0:
+            raise ValueError("window must be positive.")
+        self.window = window or frame_size
+        super().__init__(frame_size)
+
+    def reset(self) -> None:
+        # page -> time of last reference, oldest first
+        self._last_use: "OrderedDict[int, int]" = OrderedDict()
+        self._time = 0
+
+    def access(self, page: int) -> bool:
+        last_use = self._last_use
+        horizon = self._time - self.window
+        # Pages not referenced within the window leave the working set
+        while last_use:
+            oldest, used = next(iter(last_use.items()))
+            if used > horizon:
+                break
+            del last_use[oldest]
+
+        hit = page in last_use
+        if hit:
+            last_use.move_to_end(page)
+        elif len(last_use) == self.frame_size:
+            last_use.popitem(last=False)
+        last_use[page] = self._time
+        self._time += 1
+        return hit
+
+# Online policy name -> policy class
+POLICIES: Dict[str, Type[ReplacementPolicy]] = {
+    "fifo": FIFOPolicy,
+    "lru": LRUPolicy,
+    "clock": ClockPolicy,
+    "second_chance": SecondChancePolicy,
+    "lfu": LFUPolicy,
+    "arc": ARCPolicy,
+    "2q": TwoQueuePolicy,
+    "working_set": WorkingSetPolicy,
+}
+
+# Every name simulate_replacement() accepts. Belady's optimal policy needs the
+# whole reference string in advance, so it is not an online ReplacementPolicy
+# and runs through optimal_replacement() instead.
+ALGORITHMS: List[str] = list(POLICIES) + ["optimal"]
+
+def simulate_replacement(reference_string: Sequence[int], frame_size: int, algorithm: str = "fifo", **options: Any) -> Dict[str, Any]:
+    """
+    Runs a named replacement policy over a reference string.
+
+    Args:
+        reference_string: Page references.
+        frame_size: Number of frames.
+        algorithm: One of ALGORITHMS.
+        options: Extra policy arguments (e.g. window for working_set).
+    """
+    if algorithm == "optimal":
+        if options:
+            raise ValueError(f"The optimal algorithm takes no options, got: {', '.join(sorted(options))}.")
+        return optimal_replacement(reference_string, frame_size)
+    policy_cls = POLICIES.get(algorithm)
+    if policy_cls is None:
+        raise ValueError(f"Unknown page replacement algorithm: {algorithm}. Choose from {ALGORITHMS}.")
+    return policy_cls(frame_size, **options).run(reference_string)
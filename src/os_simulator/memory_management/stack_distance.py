@@ -0,0 +1,162 @@
+from typing import Any, Dict, List, Optional, Sequence
+from os_simulator.memory_management.page_replacement import fault_ratio, next_use_indices
+
+# Stack distance recorded for the first reference to a page (a miss at every size)
+COLD_MISS = 0
+
+# Largest max_frames for which one opt_stack_distances pass is worth it: beyond this the
+# O(n * max_frames) priority update loses to running optimal_replacement once per size
+OPT_STACK_FRAME_LIMIT = 64
+
+def lru_stack_distances(reference_string: Sequence[int]) -> List[int]:
+    """
+    LRU stack distance of every reference (Mattson et al.): 1 + the number of distinct
+    pages referenced since the previous reference to the same page, or COLD_MISS.
+    A reference hits in an LRU memory of F frames exactly when 0 < distance <= F.
+
+    A Fenwick tree over time marks the latest reference to each page, so the
+    distinct-page count for a reuse is one prefix sum: O(n log n) overall.
+    """
+    n = len(reference_string)
+    tree = [0] * (n + 1)
+    last: Dict[int, int] = {}
+    distances = [COLD_MISS] * n
+
+    for i, page in enumerate(reference_string, start=1):
+        j = last.get(page)
+        if j is not None:
+            # Marks at positions <= j belong to pages not referenced since page was
+            seen_before = 0
+            k = j
+            while k:
+                seen_before += tree[k]
+                k &= k - 1
+            distances[i - 1] = len(last) - seen_before + 1
+            k = j
+            while k <= n:
+                tree[k] -= 1
+                k += k & -k
+        k = i
+        while k <= n:
+            tree[k] += 1
+            k += k & -k
+        last[page] = i
+    return distances
+
+def opt_stack_distances(reference_string: Sequence[int], max_frames: int) -> List[int]:
+    """
+    OPT (Belady) stack distance of every reference, up to max_frames.
+
+    OPT is a stack algorithm: the contents of an F-frame OPT memory are always the
+    top F entries of a single priority stack ordered by next use. On each reference
+    the page moves to the top and the displaced entries are pushed down, each level
+    keeping whichever candidate is needed sooner (Mattson's priority update). Only
+    the top max_frames levels are tracked. References deeper than max_frames are
+    recorded as max_frames + 1.
+
+    A reference costs O(max_frames) (the stack search plus the priority update),
+    so the pass is O(n * max_frames), not O(n log n) like lru_stack_distances.
+    On reference strings with little locality one pass already costs about
+    max_frames / 16 runs of optimal_replacement (O(n log F) each), so keep
+    max_frames small (see OPT_STACK_FRAME_LIMIT) and simulate larger memories
+    one size at a time.
+    """
+    if max_frames <= 0:
+        raise ValueError("max_frames must be positive.")
+    next_use = next_use_indices(reference_string)
+    stack: List[int] = []
+    priority: Dict[int, int] = {}  # page -> index of its next use (smaller = needed sooner)
+    seen = set()
+    distances = [COLD_MISS] * len(reference_string)
+
+    for i, page in enumerate(reference_string):
+        try:
+            depth = stack.index(page)
+            distances[i] = depth + 1
+        except ValueError:
+            if page in seen:
+                distances[i] = max_frames + 1
+            seen.add(page)
+            if len(stack) < max_frames:
+                # The page fills a new bottom level
+                stack.append(page)
+                depth = len(stack) - 1
+            else:
+                # Whatever is carried past the bottom level leaves the tracked stack
+                depth = max_frames
+
+        if depth > 0:
+            carried = stack[0]
+            stack[0] = page
+            for level in range(1, min(depth, len(stack))):
+                resident = stack[level]
+                if priority[carried] < priority[resident]:
+                    stack[level] = carried
+                    carried = resident
+            if depth < len(stack):
+                stack[depth] = carried
+        priority[page] = next_use[i]
+    return distances
+
+def fault_curve(distances: Sequence[int], max_frames: int) -> List[int]:
+    """
+    Page faults for every memory size from 1 to max_frames, from stack distances.
+
+    Returns:
+        A list whose entry F - 1 is the fault count with F frames.
+    """
+    total = len(distances)
+    hits_at = [0] * (max_frames + 2)
+    for d in distances:
+        if d != COLD_MISS and d <= max_frames:
+            hits_at[d] += 1
+    faults = []
+    hits = 0
+    for frames in range(1, max_frames + 1):
+        hits += hits_at[frames]
+        faults.append(total - hits)
+    return faults
+
+def miss_ratio_curve(
+    reference_string: Sequence[int],
+    policy: str = "lru",
+    max_frames: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Fault counts and fault ratios for every frame count at once, from one pass
+    over the reference string.
+
+    Args:
+        reference_string: Page references.
+        policy: "lru" or "opt".
+        max_frames: Largest memory size to report (default: the number of distinct
+                    pages, beyond which only cold misses remain). With "opt" the
+                    pass costs O(n * max_frames), so pass a small max_frames for
+                    reference strings over many distinct pages.
+
+    Returns:
+        {"frames": [1..max_frames], "page_faults": [...], "fault_ratio": [...],
+         "cold_misses": distinct pages}, with entry k describing k + 1 frames.
+        Ratios are rounded like every other replacement result.
+    """
+    distinct = len(set(reference_string))
+    if max_frames is None:
+        max_frames = max(distinct, 1)
+    if max_frames <= 0:
+        raise ValueError("max_frames must be positive.")
+
+    if policy == "lru":
+        distances = lru_stack_distances(reference_string)
+    elif policy == "opt":
+        distances = opt_stack_distances(reference_string, max_frames)
+    else:
+        raise ValueError(f"Unknown stack policy: {policy}. Choose 'lru' or 'opt'.")
+
+    total = len(reference_string)
+    faults = fault_curve(distances, max_frames)
+    return {
+        "frames": list(range(1, max_frames + 1)),
+        "page_faults": faults,
+        "fault_ratio": [fault_ratio(f, total) for f in faults],
+        "cold_misses": distinct
+    }
@@ -1,97 +1,292 @@
-from typing import List, Tuple, Dict, Any, Optional
+import math
+from typing import List, Tuple, Dict, Any, Optional, Sequence, Union
 from os_simulator.process import Process
+from os_simulator.process_table import ProcessTable
 from os_simulator.system_clock import SystemClock
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python path gives the same results
+    np = None
+
+# Percentiles reported for waiting, turnaround and response times
+PERCENTILES = (50, 95, 99)
+DISTRIBUTION_METRICS = ("waiting_time", "turnaround_time", "response_time")
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """
+    Nearest-rank percentile of an ascending list.
+
+    Args:
+        sorted_values: Non-empty values in ascending order.
+        q: Percentile in the range 0-100.
+    """
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+def histogram(sorted_values: Sequence[float], bins: int = 10) -> Tuple[List[float], List[int]]:
+    """
+    Equal-width histogram of an ascending list.
+
+    Returns:
+        (edges, counts) with bins + 1 edges spanning min to max; the last bin
+        includes its right edge.
+    """
+    low, high = sorted_values[0], sorted_values[-1]
+    if high == low:
+        return [low, high], [len(sorted_values)]
+    width = (high - low) / bins
+    edges = [low + i * width for i in range(bins)] + [high]
+    counts = [0] * bins
+    for value in sorted_values:
+        counts[min(int((value - low) / width), bins - 1)] += 1
+    return edges, counts
+
+def _jain_index(sum_x: float, sum_x_sq: float, n: int) -> float:
+    """Jain's index from the sum and sum of squares; 1.0 when everyone waited 0."""
+    return 1.0 if sum_x_sq == 0 else (sum_x ** 2) / (n * sum_x_sq)
+
+def _scalar(value: Any) -> Any:
+    """Converts NumPy scalars to plain Python numbers."""
+    return value.item() if hasattr(value, "item") else value
+
 class MetricsCalculator:
     """
-    Computes performance indicators for the OS simulator based on 
+    Computes performance indicators for the OS simulator based on
     simulation execution data.
+
+    Per-process values are gathered into columns (read directly from a
+    ProcessTable when one is given) and summarized in a single pass. When NumPy
+    is installed the columns are summarized with vectorized operations.
     """
 
-    def __init__(self):
+    def __init__(self, histogram_bins: int = 10, use_numpy: Optional[bool] = None):
+        """
+        Args:
+            histogram_bins: Number of bins for the waiting/turnaround/response histograms.
+            use_numpy: Force the NumPy (True) or pure-Python (False) path; None picks
+                       NumPy when it is installed.
+        """
+        if use_numpy and np is None:
+            raise ValueError("NumPy is not installed.")
+        self.histogram_bins = histogram_bins
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
         self.results: Dict[str, Any] = {}
+        self.histograms: Dict[str, Tuple[List[float], List[int]]] = {}
 
     def calculate(
-        self, 
-        process_list: List[Process], 
-        execution_timeline: List[Tuple[Any, int, int]], 
+        self,
+        process_list: Union[List[Process], ProcessTable],
+        execution_timeline: List[Tuple[Any, int, int]],
         system_clock: SystemClock
     ) -> Dict[str, Any]:
         """
         Calculates all key metrics from the simulation results.
-        
+
         Args:
-            process_list: Final list of processes after simulation.
+            process_list: Final list of processes (or ProcessTable) after simulation.
             execution_timeline: The sequence of execution segments.
             system_clock: The clock instance used during simulation.
-            
+
         Returns:
             A dictionary containing various metrics.
         """
-        if not process_list:
+        if not len(process_list):
             return {}
 
-        n = len(process_list)
-        total_wt = sum(p.waiting_time for p in process_list)
-        total_tat = sum(p.turnaround_time for p in process_list)
-        
-        # Calculate Response Times
-        response_times = self._get_response_times(process_list, execution_timeline)
-        avg_rt = sum(response_times.values()) / n if n > 0 else 0
-        
+        columns = self._columns(process_list, execution_timeline)
+        n = len(columns["pid"])
+        if self.use_numpy:
+            summary = self._summarize_numpy(columns)
+        else:
+            summary = self._summarize_python(columns)
+
         # Performance metrics
         total_time = system_clock.get_time()
         throughput = n / total_time if total_time > 0 else 0
         utilization = system_clock.get_cpu_utilization()
-        
-        # Fairness Index (Jain's Fairness Index on Waiting Times)
-        fairness = self._calculate_fairness(process_list)
+
+        # Jain's Fairness Index on Waiting Times
+        fairness = _jain_index(summary["waiting_sum"], summary["waiting_sum_sq"], n)
 
         self.results = {
-            "avg_waiting_time": round(total_wt / n, 2),
-            "avg_turnaround_time": round(total_tat / n, 2),
-            "avg_response_time": round(avg_rt, 2),
+            "avg_waiting_time": round(summary["waiting_time"]["sum"] / n, 2),
+            "avg_turnaround_time": round(summary["turnaround_time"]["sum"] / n, 2),
+            "avg_response_time": round(summary["response_time"]["sum"] / n, 2),
             "throughput": round(throughput, 4),
             "cpu_utilization": utilization,
             "fairness_index": round(fairness, 4),
             "total_processes": n,
             "simulation_duration": total_time
         }
-        
+        self.histograms = {}
+        for metric in DISTRIBUTION_METRICS:
+            stats = summary[metric]
+            for q in PERCENTILES:
+                self.results[f"p{q}_{metric}"] = stats[q]
+            # max_waiting_time doubles as the starvation indicator
+            self.results[f"max_{metric}"] = stats["max"]
+            self.histograms[metric] = stats["histogram"]
+        self.results.update(self._deadline_metrics(columns))
+
         return self.results
 
-    def _get_response_times(self, process_list: List[Process], timeline: List[Tuple[Any, int, int]]) -> Dict[int, int]:
+    def _columns(
+        self,
+        process_list: Union[List[Process], ProcessTable],
+        timeline: List[Tuple[Any, int, int]]
+    ) -> Dict[str, Sequence[Any]]:
+        """Gathers per-process values as columns, plus each process's first start time."""
+        if isinstance(process_list, ProcessTable):
+            columns = {
+                "pid": process_list.pid,
+                "arrival_time": process_list.arrival_time,
+                "waiting_time": process_list.waiting_time,
+                "turnaround_time": process_list.turnaround_time,
+                "completion_time": process_list.completion_time,
+                "deadline": process_list.deadline,
+            }
+        else:
+            columns = {
+                "pid": [p.pid for p in process_list],
+                "arrival_time": [p.arrival_time for p in process_list],
+                "waiting_time": [p.waiting_time for p in process_list],
+                "turnaround_time": [p.turnaround_time for p in process_list],
+                # -1 marks "no value", matching ProcessTable's columns
+                "completion_time": [-1 if p.completion_time is None else p.completion_time for p in process_list],
+                "deadline": [-1 if p.deadline is None else p.deadline for p in process_list],
+            }
+
+        if self.use_numpy:
+            columns["first_start"] = self._first_starts_numpy(columns["pid"], columns["arrival_time"], timeline)
+            return columns
+        first_starts = self._first_starts(timeline)
+        columns["first_start"] = [
+            first_starts.get(pid, arrival) # Fallback if not scheduled
+            for pid, arrival in zip(columns["pid"], columns["arrival_time"])
+        ]
+        return columns
+
+    def _first_starts(self, timeline: List[Tuple[Any, int, int]]) -> Dict[Any, int]:
+        """
+        Maps each label to the start of its first segment in the timeline.
+        Walking the timeline backwards lets the earliest segment overwrite later ones,
+        in a single C-level dict build; overhead labels ("CS", "MIG") are never looked up.
         """
-        Helper to find first CPU access for each process to calculate Response Time.
-        RT = First Start - Arrival
+        return {label: start for label, start, _ in reversed(timeline)}
+
+    def _first_starts_numpy(
+        self,
+        pids: Sequence[int],
+        arrivals: Sequence[int],
+        timeline: List[Tuple[Any, int, int]]
+    ) -> Any:
         """
-        first_starts = {}
-        for pid_or_msg, start, _ in timeline:
-            if isinstance(pid_or_msg, int) and pid_or_msg not in first_starts:
-                first_starts[pid_or_msg] = start
-        
-        response_times = {}
-        for p in process_list:
-            first_start = first_starts.get(p.pid, p.arrival_time) # Fallback if not scheduled
-            response_times[p.pid] = first_start - p.arrival_time
-            
-        return response_times
-
-    def _calculate_fairness(self, process_list: List[Process]) -> float:
+        Vectorized equivalent of _first_starts, aligned with the pid column.
+        np.unique gives the index of each pid's first segment; processes that
+        never ran fall back to their arrival time.
+        """
+        pids = np.asarray(pids, dtype=np.int64)
+        arrivals = np.asarray(arrivals, dtype=np.int64)
+        if not timeline:
+            return arrivals
+        labels, starts, _ = zip(*timeline)
+        # Overhead segments ("CS", "MIG") get the -1 sentinel and are dropped
+        labels = np.fromiter((label if label.__class__ is int else -1 for label in labels), dtype=np.int64, count=len(labels))
+        keep = labels != -1
+        seen, first_index = np.unique(labels[keep], return_index=True)
+        first_start = np.asarray(starts, dtype=np.int64)[keep][first_index]
+        if not len(seen):
+            return arrivals
+        position = np.minimum(np.searchsorted(seen, pids), len(seen) - 1)
+        return np.where(seen[position] == pids, first_start[position], arrivals)
+
+    def _summarize_python(self, columns: Dict[str, Sequence[Any]]) -> Dict[str, Any]:
+        """Sums, percentiles and histograms with the standard library."""
+        response = [start - arrival for start, arrival in zip(columns["first_start"], columns["arrival_time"])]
+        values = {
+            "waiting_time": list(columns["waiting_time"]),
+            "turnaround_time": list(columns["turnaround_time"]),
+            "response_time": response,
+        }
+        summary: Dict[str, Any] = {}
+        for metric, data in values.items():
+            ordered = sorted(data)
+            stats: Dict[Any, Any] = {q: percentile(ordered, q) for q in PERCENTILES}
+            stats["sum"] = sum(ordered)
+            stats["max"] = ordered[-1]
+            stats["histogram"] = histogram(ordered, self.histogram_bins)
+            summary[metric] = stats
+        summary["waiting_sum"] = summary["waiting_time"]["sum"]
+        summary["waiting_sum_sq"] = sum(x * x for x in values["waiting_time"])
+        return summary
+
+    def _summarize_numpy(self, columns: Dict[str, Sequence[Any]]) -> Dict[str, Any]:
+        """Vectorized equivalent of _summarize_python."""
+        arrival = np.asarray(columns["arrival_time"], dtype=np.int64)
+        values = {
+            "waiting_time": np.asarray(columns["waiting_time"], dtype=np.int64),
+            "turnaround_time": np.asarray(columns["turnaround_time"], dtype=np.int64),
+            "response_time": np.asarray(columns["first_start"], dtype=np.int64) - arrival,
+        }
+        n = len(arrival)
+        summary: Dict[str, Any] = {}
+        for metric, data in values.items():
+            ordered = np.sort(data)
+            stats: Dict[Any, Any] = {q: _scalar(percentile(ordered, q)) for q in PERCENTILES}
+            stats["sum"] = _scalar(ordered.sum())
+            stats["max"] = _scalar(ordered[-1])
+            low, high = _scalar(ordered[0]), stats["max"]
+            if low == high:
+                stats["histogram"] = ([low, high], [n])
+            else:
+                counts, edges = np.histogram(ordered, bins=self.histogram_bins, range=(low, high))
+                stats["histogram"] = (edges.tolist(), counts.tolist())
+            summary[metric] = stats
+        waiting = values["waiting_time"].astype(np.float64)
+        summary["waiting_sum"] = summary["waiting_time"]["sum"]
+        summary["waiting_sum_sq"] = _scalar(np.dot(waiting, waiting))
+        return summary
+
+    def _deadline_metrics(self, columns: Dict[str, Sequence[Any]]) -> Dict[str, Any]:
+        """
+        Deadline-miss ratio and lateness distribution over completed processes with a deadline.
+        Returns an empty dict when no process has a deadline.
+        """
+        lateness = sorted(
+            completion - (arrival + deadline)
+            for completion, arrival, deadline
+            in zip(columns["completion_time"], columns["arrival_time"], columns["deadline"])
+            if deadline != -1 and completion != -1
+        )
+        if not lateness:
+            return {}
+
+        missed = sum(1 for value in lateness if value > 0)
+        results = {
+            "deadline_jobs": len(lateness),
+            "deadlines_missed": missed,
+            "deadline_miss_ratio": round(missed / len(lateness), 4),
+        }
+        for q in PERCENTILES:
+            results[f"p{q}_lateness"] = percentile(lateness, q)
+        results["max_lateness"] = lateness[-1]
+        return results
+
+    def _calculate_fairness(self, process_list: Union[List[Process], ProcessTable]) -> float:
         """
         Calculates Jain's Fairness Index for process waiting times.
         JFI = (sum(xi))^2 / (n * sum(xi^2))
+        Kept for existing callers; calculate() reports the same value as fairness_index.
         """
-        x = [p.waiting_time for p in process_list]
-        n = len(x)
-        if n == 0: return 0.0
-        
-        sum_x = sum(x)
-        sum_x_sq = sum(val**2 for val in x)
-        
-        if sum_x_sq == 0: return 1.0 # Perfectly fair if everyone waited 0
-        
-        return (sum_x**2) / (n * sum_x_sq)
+        waiting = process_list.waiting_time if isinstance(process_list, ProcessTable) else [p.waiting_time for p in process_list]
+        n = len(waiting)
+        if n == 0:
+            return 0.0
+        if self.use_numpy:
+            x = np.asarray(waiting, dtype=np.float64)
+            return _jain_index(_scalar(x.sum()), _scalar(np.dot(x, x)), n)
+        return _jain_index(sum(waiting), sum(x * x for x in waiting), n)
 
     def pretty_print(self) -> None:
         """Prints a formatted summary of the calculated metrics."""
@@ -110,8 +305,20 @@ class MetricsCalculator:
         print(f"{'Throughput':<25} | {self.results['throughput']} proc/unit")
         print("-" * 40)
         print(f"{'Avg Waiting Time':<25} | {self.results['avg_waiting_time']} units")
+        print(f"{'Max Waiting Time':<25} | {self.results['max_waiting_time']} units")
         print(f"{'Avg Turnaround Time':<25} | {self.results['avg_turnaround_time']} units")
         print(f"{'Avg Response Time':<25} | {self.results['avg_response_time']} units")
         print("-" * 40)
+        for metric in DISTRIBUTION_METRICS:
+            label = metric.replace("_time", "").title() + " p50/p95/p99"
+            tails = " / ".join(str(self.results[f"p{q}_{metric}"]) for q in PERCENTILES)
+            print(f"{label:<25} | {tails} units")
+        print("-" * 40)
         print(f"{'Fairness Index (Jain)':<25} | {self.results['fairness_index']}")
+        if "deadline_jobs" in self.results:
+            print("-" * 40)
+            print(f"{'Deadlines Missed':<25} | {self.results['deadlines_missed']} / {self.results['deadline_jobs']}")
+            print(f"{'Deadline Miss Ratio':<25} | {self.results['deadline_miss_ratio']}")
+            print(f"{'Lateness p50/p95/p99':<25} | {self.results['p50_lateness']} / {self.results['p95_lateness']} / {self.results['p99_lateness']} units")
+            print(f"{'Max Lateness':<25} | {self.results['max_lateness']} units")
         print("="*40 + "\n")
@@ -1,5 +1,5 @@
 from enum import Enum, auto
-from typing import Optional
+from typing import List, Optional, Tuple
 
 class ProcessState(Enum):
     """Enumeration of possible process states."""
@@ -14,9 +14,16 @@ class Process:
     Represents a simulated Operating System process.
     
     This class encapsulates all necessary information for process scheduling and
-    lifecycle management within the simulator.
+    lifecycle management within the simulator. Attributes live in __slots__ to keep
+    large simulations compact; see ProcessTable for a column-oriented alternative.
     """
 
+    __slots__ = (
+        "pid", "name", "arrival_time", "burst_time", "priority", "memory_required",
+        "io_bursts", "period", "deadline", "state", "remaining_time",
+        "waiting_time", "turnaround_time", "completion_time"
+    )
+
     def __init__(
         self,
         pid: int,
@@ -24,7 +31,10 @@ class Process:
         arrival_time: int,
         burst_time: int,
         priority: int = 0,
-        memory_required: int = 0
+        memory_required: int = 0,
+        io_bursts: Optional[List[Tuple[int, int]]] = None,
+        deadline: Optional[int] = None,
+        period: Optional[int] = None
     ):
         """
         Initializes a new Process instance.
@@ -36,13 +46,27 @@ class Process:
             burst_time: Total CPU time required by the process.
             priority: Scheduling priority (default 0).
             memory_required: Amount of memory needed by the process (default 0).
+            io_bursts: Optional I/O phases as (cpu_offset, io_duration) pairs. The process
+                       blocks for io_duration units once it has executed cpu_offset units
+                       of its burst (default None, i.e. a pure CPU-bound process).
+            deadline: Optional relative deadline, counted from arrival_time (real-time processes).
+            period: Optional release period of a periodic real-time task. The relative
+                    deadline defaults to the period when only the period is given.
         """
+        if deadline is not None and deadline <= 0:
+            raise ValueError(f"Process {pid}: deadline must be positive.")
+        if period is not None and period <= 0:
+            raise ValueError(f"Process {pid}: period must be positive.")
+
         self.pid = pid
         self.name = name
         self.arrival_time = arrival_time
         self.burst_time = burst_time
         self.priority = priority
         self.memory_required = memory_required
+        self.io_bursts: Tuple[Tuple[int, int], ...] = tuple(io_bursts) if io_bursts else ()
+        self.period = period
+        self.deadline = deadline if deadline is not None else period
         
         # Runtime attributes
         self.state = ProcessState.NEW
@@ -85,20 +109,62 @@ class Process:
         """
         return self.remaining_time == 0
 
+    @property
+    def io_time(self) -> int:
+        """Total time the process spends blocked on I/O."""
+        return sum(duration for _, duration in self.io_bursts)
+
+    @property
+    def absolute_deadline(self) -> Optional[int]:
+        """Time by which the process must complete, or None if it has no deadline."""
+        if self.deadline is None:
+            return None
+        return self.arrival_time + self.deadline
+
+    @property
+    def lateness(self) -> Optional[int]:
+        """
+        Completion time minus absolute deadline (negative when the process finished early).
+        None if the process has no deadline or has not completed.
+        """
+        if self.deadline is None or self.completion_time is None:
+            return None
+        return self.completion_time - self.absolute_deadline
+
+    def clone(self) -> "Process":
+        """
+        Returns an independent copy of the process, including its runtime state and metrics.
+
+        Every field is immutable (io_bursts is a tuple), so a shallow field copy is
+        enough and far cheaper than copy.deepcopy.
+        """
+        clone = Process.__new__(Process)
+        for name in Process.__slots__:
+            setattr(clone, name, getattr(self, name))
+        return clone
+
+    def restore(self, snapshot: "Process") -> None:
+        """
+        Resets every field in place to the values held by snapshot (typically an
+        earlier clone()), so references to this process stay valid.
+        """
+        for name in Process.__slots__:
+            setattr(self, name, getattr(snapshot, name))
+
     def calculate_metrics(self, current_time: int) -> None:
         """
         Calculates and updates performance metrics for the process.
         Should be called when the process finishes execution.
 
         Turnaround Time = Completion Time - Arrival Time
-        Waiting Time = Turnaround Time - Burst Time
+        Waiting Time = Turnaround Time - Burst Time - I/O Time
 
         Args:
             current_time: The time at which the process completed.
         """
         self.completion_time = current_time
         self.turnaround_time = self.completion_time - self.arrival_time
-        self.waiting_time = self.turnaround_time - self.burst_time
+        self.waiting_time = self.turnaround_time - self.burst_time - self.io_time
 
     def __repr__(self) -> str:
         return (f"Process(pid={self.pid}, name='{self.name}', state={self.state.name}, "
@@ -0,0 +1,327 @@
+import hashlib
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from os_simulator.process import Process, ProcessState
+
+# Sentinel stored in integer columns for optional values that are None
+_NONE = -1
+_STATES = {state.value: state for state in ProcessState}
+# Process fields a view can write back (a row's name and I/O phases are fixed)
+_WRITABLE = tuple(name for name in Process.__slots__ if name not in ("name", "io_bursts"))
+
+class ProcessTable:
+    """
+    Column-oriented (struct-of-arrays) process table.
+
+    Every process attribute lives in its own typed array, so a million processes
+    cost a few dozen bytes each instead of a full object, and scans over one
+    attribute touch contiguous memory. Rows are accessed through ProcessView,
+    which behaves like a Process and can be passed to schedulers and the kernel.
+    Columns can be wrapped without copying, e.g. numpy.frombuffer(table.burst_time, dtype=numpy.int64).
+    """
+
+    INT_COLUMNS = (
+        "pid", "arrival_time", "burst_time", "priority", "memory_required",
+        "remaining_time", "waiting_time", "turnaround_time", "completion_time",
+        "deadline", "period"
+    )
+    # Columns describing the workload itself, as opposed to simulation results
+    INPUT_COLUMNS = ("pid", "arrival_time", "burst_time", "priority", "memory_required", "deadline", "period")
+    # Columns whose None value is stored as -1
+    OPTIONAL_COLUMNS = ("completion_time", "deadline", "period")
+
+    def __init__(self):
+        self.pid = array("q")
+        self.arrival_time = array("q")
+        self.burst_time = array("q")
+        self.priority = array("q")
+        self.memory_required = array("q")
+        self.remaining_time = array("q")
+        self.waiting_time = array("q")
+        self.turnaround_time = array("q")
+        self.completion_time = array("q")
+        self.deadline = array("q")
+        self.period = array("q")
+        self.state = array("b")
+        self.name: List[str] = []
+        # Sparse: most processes have no I/O phases
+        self.io_bursts: Dict[int, Tuple[Tuple[int, int], ...]] = {}
+
+    @classmethod
+    def from_processes(cls, processes: Sequence[Process]) -> "ProcessTable":
+        """Builds a table holding a copy of each process's current state."""
+        table = cls()
+        for p in processes:
+            table.append(p)
+        return table
+
+    @classmethod
+    def from_columns(
+        cls,
+        pid: Sequence[int],
+        arrival_time: Sequence[int],
+        burst_time: Sequence[int],
+        priority: Optional[Sequence[int]] = None,
+        memory_required: Optional[Sequence[int]] = None,
+        name: Optional[List[str]] = None,
+        deadline: Optional[Sequence[int]] = None,
+        period: Optional[Sequence[int]] = None
+    ) -> "ProcessTable":
+        """
+        Builds a table of NEW processes from whole columns at once, which is much
+        faster than add() for large generated workloads. Names default to "P<pid>";
+        deadline and period use -1 for "none" and are not validated.
+        """
+        n = len(pid)
+        columns = [arrival_time, burst_time, priority, memory_required, name, deadline, period]
+        if any(column is not None and len(column) != n for column in columns):
+            raise ValueError("All columns must have the same length.")
+
+        table = cls()
+        table.pid = array("q", pid)
+        table.arrival_time = array("q", arrival_time)
+        table.burst_time = array("q", burst_time)
+        table.priority = array("q", priority) if priority is not None else array("q", bytes(8 * n))
+        table.memory_required = array("q", memory_required) if memory_required is not None else array("q", bytes(8 * n))
+        table.remaining_time = table.burst_time[:]
+        table.waiting_time = array("q", bytes(8 * n))
+        table.turnaround_time = array("q", bytes(8 * n))
+        table.completion_time = array("q", [_NONE]) * n
+        table.deadline = array("q", deadline) if deadline is not None else array("q", [_NONE]) * n
+        table.period = array("q", period) if period is not None else array("q", [_NONE]) * n
+        table.state = array("b", [ProcessState.NEW.value]) * n
+        table.name = list(name) if name is not None else [f"P{p}" for p in table.pid]
+        return table
+
+    def add(
+        self,
+        pid: int,
+        name: str,
+        arrival_time: int,
+        burst_time: int,
+        priority: int = 0,
+        memory_required: int = 0,
+        io_bursts: Optional[List[Tuple[int, int]]] = None,
+        deadline: Optional[int] = None,
+        period: Optional[int] = None
+    ) -> "ProcessView":
+        """
+        Adds a NEW process row. Arguments match Process.__init__.
+
+        Returns:
+            A view of the added row.
+        """
+        if deadline is not None and deadline <= 0:
+            raise ValueError(f"Process {pid}: deadline must be positive.")
+        if period is not None and period <= 0:
+            raise ValueError(f"Process {pid}: period must be positive.")
+        if deadline is None:
+            deadline = period
+
+        index = len(self.name)
+        self.pid.append(pid)
+        self.name.append(name)
+        self.arrival_time.append(arrival_time)
+        self.burst_time.append(burst_time)
+        self.priority.append(priority)
+        self.memory_required.append(memory_required)
+        self.remaining_time.append(burst_time)
+        self.waiting_time.append(0)
+        self.turnaround_time.append(0)
+        self.completion_time.append(_NONE)
+        self.deadline.append(_NONE if deadline is None else deadline)
+        self.period.append(_NONE if period is None else period)
+        self.state.append(ProcessState.NEW.value)
+        if io_bursts:
+            self.io_bursts[index] = tuple(io_bursts)
+        return ProcessView(self, index)
+
+    def append(self, process: Process) -> "ProcessView":
+        """Copies a Process (including its runtime state and metrics) into a new row."""
+        view = self.add(
+            process.pid, process.name, process.arrival_time, process.burst_time,
+            priority=process.priority,
+            memory_required=process.memory_required,
+            io_bursts=list(process.io_bursts),
+            deadline=process.deadline,
+            period=process.period
+        )
+        view.state = process.state
+        view.remaining_time = process.remaining_time
+        view.waiting_time = process.waiting_time
+        view.turnaround_time = process.turnaround_time
+        view.completion_time = process.completion_time
+        return view
+
+    def to_processes(self) -> List[Process]:
+        """Materializes every row as an independent Process object."""
+        processes = []
+        for view in self:
+            p = Process(
+                view.pid, view.name, view.arrival_time, view.burst_time,
+                priority=view.priority,
+                memory_required=view.memory_required,
+                io_bursts=list(view.io_bursts),
+                deadline=view.deadline,
+                period=view.period
+            )
+            p.state = view.state
+            p.remaining_time = view.remaining_time
+            p.waiting_time = view.waiting_time
+            p.turnaround_time = view.turnaround_time
+            p.completion_time = view.completion_time
+            processes.append(p)
+        return processes
+
+    def snapshot(self) -> "ProcessTable":
+        """
+        Returns an independent copy of the table. Each column is copied as one block
+        of memory, so this is the cheap way to keep a pristine workload around.
+        """
+        table = ProcessTable.__new__(ProcessTable)
+        for name in self.INT_COLUMNS + ("state",):
+            setattr(table, name, getattr(self, name)[:])
+        table.name = self.name[:]
+        table.io_bursts = dict(self.io_bursts)
+        return table
+
+    def restore(self, snapshot: "ProcessTable") -> None:
+        """
+        Copies a snapshot's contents back into this table in place, so existing
+        views stay valid. Rows added after the snapshot was taken are dropped.
+        """
+        for name in self.INT_COLUMNS + ("state",):
+            getattr(self, name)[:] = getattr(snapshot, name)
+        self.name[:] = snapshot.name
+        self.io_bursts = dict(snapshot.io_bursts)
+
+    def views(self) -> List["ProcessView"]:
+        """Returns a view for every row, e.g. to hand the table to a scheduler."""
+        return [ProcessView(self, i) for i in range(len(self.name))]
+
+    def fingerprint(self) -> str:
+        """
+        SHA-256 of the workload definition (the input columns, names and I/O phases).
+        Runtime state and metrics are excluded, so a table hashes the same before and after a run.
+        """
+        digest = hashlib.sha256()
+        for name in self.INPUT_COLUMNS:
+            digest.update(getattr(self, name).tobytes())
+        digest.update("\0".join(self.name).encode())
+        digest.update(repr(sorted(self.io_bursts.items())).encode())
+        return digest.hexdigest()
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the numeric columns."""
+        columns = [getattr(self, name) for name in self.INT_COLUMNS] + [self.state]
+        return sum(column.itemsize * len(column) for column in columns)
+
+    def __getitem__(self, index: int) -> "ProcessView":
+        if index < 0:
+            index += len(self.name)
+        if not 0 <= index < len(self.name):
+            raise IndexError("ProcessTable index out of range")
+        return ProcessView(self, index)
+
+    def __iter__(self) -> Iterator["ProcessView"]:
+        for i in range(len(self.name)):
+            yield ProcessView(self, i)
+
+    def __len__(self) -> int:
+        return len(self.name)
+
+    def __repr__(self) -> str:
+        return f"ProcessTable(rows={len(self)}, nbytes={self.nbytes})"
+
+def _column(name: str) -> property:
+    """Property reading and writing one column of the view's row."""
+    def getter(view: "ProcessView"):
+        return getattr(view._table, name)[view._index]
+
+    def setter(view: "ProcessView", value) -> None:
+        getattr(view._table, name)[view._index] = value
+
+    return property(getter, setter)
+
+def _optional_column(name: str) -> property:
+    """Like _column, translating the -1 sentinel to and from None."""
+    def getter(view: "ProcessView"):
+        value = getattr(view._table, name)[view._index]
+        return None if value == _NONE else value
+
+    def setter(view: "ProcessView", value) -> None:
+        getattr(view._table, name)[view._index] = _NONE if value is None else value
+
+    return property(getter, setter)
+
+class ProcessView:
+    """
+    Lightweight handle on one ProcessTable row with the Process interface.
+    Reads and writes go straight to the table's columns.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: ProcessTable, index: int):
+        self._table = table
+        self._index = index
+
+    pid = _column("pid")
+    arrival_time = _column("arrival_time")
+    burst_time = _column("burst_time")
+    priority = _column("priority")
+    memory_required = _column("memory_required")
+    remaining_time = _column("remaining_time")
+    waiting_time = _column("waiting_time")
+    turnaround_time = _column("turnaround_time")
+    completion_time = _optional_column("completion_time")
+    deadline = _optional_column("deadline")
+    period = _optional_column("period")
+
+    @property
+    def index(self) -> int:
+        """Row number in the table."""
+        return self._index
+
+    @property
+    def name(self) -> str:
+        return self._table.name[self._index]
+
+    @property
+    def io_bursts(self) -> Tuple[Tuple[int, int], ...]:
+        return self._table.io_bursts.get(self._index, ())
+
+    @property
+    def state(self) -> ProcessState:
+        return _STATES[self._table.state[self._index]]
+
+    @state.setter
+    def state(self, value: ProcessState) -> None:
+        self._table.state[self._index] = value.value
+
+    # Behaviour is shared with Process, which only touches the attributes above
+    update_state = Process.update_state
+    execute_one_unit = Process.execute_one_unit
+    is_completed = Process.is_completed
+    io_time = Process.io_time
+    absolute_deadline = Process.absolute_deadline
+    lateness = Process.lateness
+    calculate_metrics = Process.calculate_metrics
+    # Detaches the row as a standalone Process
+    clone = Process.clone
+
+    def restore(self, snapshot: Process) -> None:
+        """Writes a snapshot's fields back into the row (see Process.restore)."""
+        for name in _WRITABLE:
+            setattr(self, name, getattr(snapshot, name))
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ProcessView) and other._table is self._table and other._index == self._index
+
+    def __hash__(self) -> int:
+        return hash((id(self._table), self._index))
+
+    def __repr__(self) -> str:
+        return (f"ProcessView(pid={self.pid}, name='{self.name}', state={self.state.name}, "
+                f"rem={self.remaining_time}, wait={self.waiting_time})")
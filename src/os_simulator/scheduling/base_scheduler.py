@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Tuple
 from os_simulator.process import Process
+from .ready_queue import ReadyQueue
 
 class BaseScheduler(ABC):
     """
@@ -34,4 +35,14 @@ class BaseScheduler(ABC):
         Args:
             process_list: List of Process objects that have completed execution.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def create_ready_queue(self) -> ReadyQueue:
+        """
+        Creates the online ready-queue policy equivalent to this algorithm,
+        used by the event-driven kernel (Kernel.simulate()).
+
+        Raises:
+            NotImplementedError: If the algorithm only supports precomputed timelines.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support event-driven simulation.")
@@ -0,0 +1,215 @@
+import heapq
+import math
+from typing import Any, Dict, List, Optional, Tuple
+from .base_scheduler import BaseScheduler
+from .ready_queue import ReadyQueue
+from os_simulator.process import Process
+
+# Linux sched_prio_to_weight: load weight for nice values -20..19 (nice 0 = 1024).
+# Each nice level is worth roughly 10% CPU relative to its neighbour.
+NICE_TO_WEIGHT = [
+    88761, 71755, 56483, 46273, 36291,
+    29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906,
+    3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423,
+    335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45,
+    36, 29, 23, 18, 15,
+]
+NICE_0_WEIGHT = 1024
+
+def priority_to_weight(priority: int) -> int:
+    """
+    Maps a simulator priority (higher value = higher priority) to a CFS load weight.
+    The priority is treated as a negated nice value and clamped to the nice range [-20, 19].
+    """
+    nice = min(max(-priority, -20), 19)
+    return NICE_TO_WEIGHT[nice + 20]
+
+def time_slice(weight: int, total_weight: int, nr_running: int, target_latency: int, min_granularity: int) -> int:
+    """
+    Computes a task's CFS time slice.
+
+    The scheduling period is target_latency, stretched to nr_running * min_granularity
+    when there are too many runnable tasks; each task gets a share of the period
+    proportional to its weight, but never less than min_granularity.
+    """
+    period = max(target_latency, nr_running * min_granularity)
+    return max(min_granularity, math.ceil(period * weight / total_weight))
+
+class CFSReadyQueue(ReadyQueue):
+    """
+    CFS run queue for the event-driven kernel.
+
+    vruntime is charged from the CPU time a process consumed since dispatch, when it
+    comes back to the queue or blocks for I/O. Processes arriving or waking from I/O
+    are placed no lower than the current minimum vruntime.
+    """
+
+    def __init__(self, target_latency: int = 20, min_granularity: int = 4):
+        self.target_latency = target_latency
+        self.min_granularity = min_granularity
+        self._heap: List[Tuple[float, int, Process]] = []
+        self._counter = 0
+        self._queued_weight = 0
+        self._min_vruntime = 0.0
+        self._vruntime: Dict[int, float] = {}
+        # pid -> (remaining time at dispatch, time slice)
+        self._dispatched: Dict[int, Tuple[int, int]] = {}
+
+    def _charge(self, process: Process, weight: int) -> Optional[float]:
+        """Adds the CPU time used since dispatch to vruntime; None if not dispatched here."""
+        dispatched = self._dispatched.pop(process.pid, None)
+        if dispatched is None:
+            return None
+        vruntime = self._vruntime.get(process.pid, 0.0) + (dispatched[0] - process.remaining_time) * NICE_0_WEIGHT / weight
+        self._vruntime[process.pid] = vruntime
+        return vruntime
+
+    def push(self, process: Process, current_time: int) -> None:
+        weight = priority_to_weight(process.priority)
+        vruntime = self._charge(process, weight)
+        if vruntime is None:
+            # New or waking process: no credit for time spent away from the run queue
+            vruntime = max(self._vruntime.get(process.pid, 0.0), self._min_vruntime)
+        self._vruntime[process.pid] = vruntime
+
+        self._counter += 1
+        heapq.heappush(self._heap, (vruntime, self._counter, process))
+        self._queued_weight += weight
+        self._min_vruntime = max(self._min_vruntime, self._heap[0][0])
+
+    def pop(self, current_time: int) -> Process:
+        _, _, process = heapq.heappop(self._heap)
+        weight = priority_to_weight(process.priority)
+        self._queued_weight -= weight
+        slice_len = time_slice(
+            weight, self._queued_weight + weight, len(self._heap) + 1,
+            self.target_latency, self.min_granularity
+        )
+        self._dispatched[process.pid] = (process.remaining_time, slice_len)
+        return process
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def time_slice(self, process: Process) -> Optional[int]:
+        return self._dispatched[process.pid][1]
+
+    def block(self, process: Process, current_time: int) -> None:
+        # Charge the slice now so the wakeup push is treated as a waking process
+        self._charge(process, priority_to_weight(process.priority))
+
+    def steal(self, current_time: int) -> Tuple[Process, Any]:
+        process = self.pop(current_time)
+        del self._dispatched[process.pid]
+        # vruntime relative to this queue's minimum, as Linux does on migration
+        return process, self._vruntime.pop(process.pid) - self._min_vruntime
+
+    def adopt(self, process: Process, state: Any, current_time: int) -> None:
+        self._vruntime[process.pid] = self._min_vruntime + state
+        self.push(process, current_time)
+
+    def forget(self, process: Process) -> None:
+        self._vruntime.pop(process.pid, None)
+        self._dispatched.pop(process.pid, None)
+
+class CFSScheduler(BaseScheduler):
+    """
+    Completely Fair Scheduler (CFS) implementation.
+
+    Every process accumulates virtual runtime (vruntime) at a rate inversely
+    proportional to its weight, and the runnable process with the smallest
+    vruntime always runs next. The run queue is a binary heap keyed on vruntime,
+    giving O(log n) picks. Newly arrived processes start at the queue's current
+    minimum vruntime so they cannot monopolize the CPU.
+    """
+
+    def __init__(self, target_latency: int = 20, min_granularity: int = 4):
+        """
+        Initializes CFS.
+
+        Args:
+            target_latency: Period within which every runnable process should run once.
+            min_granularity: Smallest time slice handed to a process.
+        """
+        if target_latency <= 0 or min_granularity <= 0:
+            raise ValueError("target_latency and min_granularity must be positive.")
+        self.target_latency = target_latency
+        self.min_granularity = min_granularity
+
+    def schedule(self, process_list: List[Process]) -> List[Tuple[int, int, int]]:
+        """
+        Calculates execution timeline using CFS logic.
+        """
+        if not process_list:
+            return []
+
+        incoming = sorted(process_list, key=lambda x: x.arrival_time)
+        n = len(incoming)
+        weights = [priority_to_weight(p.priority) for p in incoming]
+        remaining = [p.burst_time for p in incoming]
+        vruntime = [0.0] * n
+
+        run_queue: List[Tuple[float, int]] = []
+        total_weight = 0
+        min_vruntime = 0.0
+        next_idx = 0
+        timeline = []
+        current_time = 0
+
+        while next_idx < n or run_queue:
+            while next_idx < n and incoming[next_idx].arrival_time <= current_time:
+                vruntime[next_idx] = min_vruntime
+                heapq.heappush(run_queue, (min_vruntime, next_idx))
+                total_weight += weights[next_idx]
+                next_idx += 1
+
+            if not run_queue:
+                # CPU Idle
+                current_time = incoming[next_idx].arrival_time
+                continue
+
+            _, idx = heapq.heappop(run_queue)
+            p = incoming[idx]
+            slice_len = time_slice(
+                weights[idx], total_weight, len(run_queue) + 1,
+                self.target_latency, self.min_granularity
+            )
+            exec_time = min(slice_len, remaining[idx])
+
+            start = current_time
+            current_time += exec_time
+            remaining[idx] -= exec_time
+            vruntime[idx] += exec_time * NICE_0_WEIGHT / weights[idx]
+
+            # Extend the previous segment if the same process simply keeps the CPU
+            if timeline and timeline[-1][0] == p.pid and timeline[-1][2] == start:
+                timeline[-1] = (p.pid, timeline[-1][1], current_time)
+            else:
+                timeline.append((p.pid, start, current_time))
+
+            if remaining[idx] == 0:
+                total_weight -= weights[idx]
+                p.calculate_metrics(current_time)
+            else:
+                heapq.heappush(run_queue, (vruntime[idx], idx))
+
+            # min_vruntime only ever moves forward
+            if run_queue:
+                min_vruntime = max(min_vruntime, run_queue[0][0])
+
+        return timeline
+
+    def calculate_metrics(self, process_list: List[Process]) -> None:
+        """
+        Metrics (TAT, WT) are derived automatically when process finishes in schedule().
+        """
+        pass
+
+    def create_ready_queue(self) -> ReadyQueue:
+        """
+        Returns the equivalent online ready queue for event-driven simulation.
+        """
+        return CFSReadyQueue(target_latency=self.target_latency, min_granularity=self.min_granularity)
@@ -1,5 +1,6 @@
 from typing import List, Tuple
 from .base_scheduler import BaseScheduler
+from .ready_queue import ReadyQueue, FIFOReadyQueue
 from os_simulator.process import Process
 
 class FCFSScheduler(BaseScheduler):
@@ -40,4 +41,10 @@ class FCFSScheduler(BaseScheduler):
         Metrics are already calculated during the schedule() phase for non-preemptive FCFS.
         This method is kept for interface compliance.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def create_ready_queue(self) -> ReadyQueue:
+        """
+        Returns the equivalent online ready queue for event-driven simulation.
+        """
+        return FIFOReadyQueue()
@@ -0,0 +1,104 @@
+from typing import Any, Dict, Hashable, List, Tuple
+
+class IndexedHeap:
+    """
+    Binary min-heap with a position index for each item.
+
+    Besides the usual push/pop, the index allows the key of an item that is
+    already queued to be changed (decrease-key / increase-key) or the item to be
+    removed in O(log n), without rebuilding the heap.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[Any, Hashable]] = []
+        self._pos: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._pos
+
+    def push(self, item: Hashable, key: Any) -> None:
+        """
+        Adds an item with the given key.
+
+        Raises:
+            KeyError: If the item is already in the heap.
+        """
+        if item in self._pos:
+            raise KeyError(f"Item {item!r} is already in the heap.")
+        self._heap.append((key, item))
+        self._pos[item] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+
+    def peek(self) -> Tuple[Hashable, Any]:
+        """Returns the (item, key) pair with the smallest key without removing it."""
+        key, item = self._heap[0]
+        return item, key
+
+    def pop(self) -> Tuple[Hashable, Any]:
+        """Removes and returns the (item, key) pair with the smallest key."""
+        key, item = self._heap[0]
+        self._remove_at(0)
+        return item, key
+
+    def key_of(self, item: Hashable) -> Any:
+        """Returns the current key of a queued item."""
+        return self._heap[self._pos[item]][0]
+
+    def update(self, item: Hashable, key: Any) -> None:
+        """Changes the key of a queued item, restoring heap order in O(log n)."""
+        idx = self._pos[item]
+        old_key = self._heap[idx][0]
+        self._heap[idx] = (key, item)
+        if key < old_key:
+            self._sift_up(idx)
+        else:
+            self._sift_down(idx)
+
+    def remove(self, item: Hashable) -> None:
+        """Removes a queued item regardless of its position."""
+        self._remove_at(self._pos[item])
+
+    def _remove_at(self, idx: int) -> None:
+        heap = self._heap
+        _, item = heap[idx]
+        del self._pos[item]
+        last = heap.pop()
+        if idx < len(heap):
+            heap[idx] = last
+            self._pos[last[1]] = idx
+            self._sift_down(idx)
+            self._sift_up(idx)
+
+    def _sift_up(self, idx: int) -> None:
+        heap, pos = self._heap, self._pos
+        entry = heap[idx]
+        while idx > 0:
+            parent = (idx - 1) >> 1
+            if not entry[0] < heap[parent][0]:
+                break
+            heap[idx] = heap[parent]
+            pos[heap[idx][1]] = idx
+            idx = parent
+        heap[idx] = entry
+        pos[entry[1]] = idx
+
+    def _sift_down(self, idx: int) -> None:
+        heap, pos = self._heap, self._pos
+        size = len(heap)
+        entry = heap[idx]
+        while True:
+            child = 2 * idx + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1][0] < heap[child][0]:
+                child += 1
+            if not heap[child][0] < entry[0]:
+                break
+            heap[idx] = heap[child]
+            pos[heap[idx][1]] = idx
+            idx = child
+        heap[idx] = entry
+        pos[entry[1]] = idx
@@ -0,0 +1,108 @@
+from typing import Deque, List, Optional, Sequence, Tuple
+from collections import deque
+from .base_scheduler import BaseScheduler
+from .ready_queue import ReadyQueue, MLFQReadyQueue
+from os_simulator.process import Process
+
+class MLFQScheduler(BaseScheduler):
+    """
+    Multi-Level Feedback Queue (MLFQ) Scheduling implementation.
+
+    Processes enter the top level and are demoted one level each time they use up
+    the quantum of their current level. The highest non-empty level always runs
+    next, Round Robin within a level. An optional periodic boost moves every process
+    back to the top level so long-running jobs cannot starve.
+    A running slice is never cut short by arrivals.
+    """
+
+    def __init__(self, quanta: Optional[Sequence[Optional[int]]] = None, boost_interval: Optional[int] = None):
+        """
+        Initializes MLFQ.
+
+        Args:
+            quanta: Time quantum per level, highest priority first (default [2, 4, 8]).
+                    The last level may use None to run processes to completion (FCFS).
+            boost_interval: Period of the priority boost. None disables boosting.
+        """
+        self.quanta: List[Optional[int]] = list(quanta) if quanta is not None else [2, 4, 8]
+        if not self.quanta:
+            raise ValueError("MLFQ needs at least one level.")
+        for level, quantum in enumerate(self.quanta):
+            if quantum is None and level != len(self.quanta) - 1:
+                raise ValueError("Only the lowest MLFQ level may have an unlimited quantum.")
+            if quantum is not None and quantum <= 0:
+                raise ValueError(f"Quantum for level {level} must be positive.")
+        if boost_interval is not None and boost_interval <= 0:
+            raise ValueError("boost_interval must be positive.")
+        self.boost_interval = boost_interval
+
+    def schedule(self, process_list: List[Process]) -> List[Tuple[int, int, int]]:
+        """
+        Calculates execution timeline using MLFQ logic.
+        """
+        if not process_list:
+            return []
+
+        timeline = []
+        arrival_queue: Deque[Process] = deque(sorted(process_list, key=lambda x: x.arrival_time))
+        levels: List[Deque[Process]] = [deque() for _ in self.quanta]
+        lowest = len(levels) - 1
+        next_boost = self.boost_interval
+
+        current_time = 0
+        completed_count = 0
+        n = len(process_list)
+
+        while completed_count < n:
+            # New processes always enter the top level
+            while arrival_queue and arrival_queue[0].arrival_time <= current_time:
+                levels[0].append(arrival_queue.popleft())
+
+            if next_boost is not None and current_time >= next_boost:
+                for level in levels[1:]:
+                    levels[0].extend(level)
+                    level.clear()
+                next_boost += ((current_time - next_boost) // self.boost_interval + 1) * self.boost_interval
+
+            level_idx = next((i for i, level in enumerate(levels) if level), None)
+            if level_idx is None:
+                if arrival_queue:
+                    current_time = arrival_queue[0].arrival_time
+                    continue
+                else:
+                    break
+
+            p = levels[level_idx].popleft()
+            quantum = self.quanta[level_idx]
+            exec_time = p.remaining_time if quantum is None else min(p.remaining_time, quantum)
+
+            start = current_time
+            current_time += exec_time
+            p.remaining_time -= exec_time
+
+            timeline.append((p.pid, start, current_time))
+
+            # Add processes that arrive DURING this execution segment
+            while arrival_queue and arrival_queue[0].arrival_time <= current_time:
+                levels[0].append(arrival_queue.popleft())
+
+            if p.remaining_time > 0:
+                # The full quantum was used: demote
+                levels[min(level_idx + 1, lowest)].append(p)
+            else:
+                p.calculate_metrics(current_time)
+                completed_count += 1
+
+        return timeline
+
+    def calculate_metrics(self, process_list: List[Process]) -> None:
+        """
+        Metrics (TAT, WT) are derived automatically when process finishes in schedule().
+        """
+        pass
+
+    def create_ready_queue(self) -> ReadyQueue:
+        """
+        Returns the equivalent online ready queue for event-driven simulation.
+        """
+        return MLFQReadyQueue(self.quanta, boost_interval=self.boost_interval)
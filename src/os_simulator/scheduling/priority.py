@@ -1,13 +1,44 @@
-from typing import List, Tuple
+import heapq
+from typing import List, Optional, Tuple
 from .base_scheduler import BaseScheduler
+from .indexed_heap import IndexedHeap
+from .ready_queue import ReadyQueue, PriorityReadyQueue
 from os_simulator.process import Process
 
 class PriorityScheduler(BaseScheduler):
     """
-    Non-Preemptive Priority Scheduling implementation.
+    Priority Scheduling implementation.
     Executes processes based on their priority level (assuming higher value = higher priority).
+
+    Non-preemptive by default. Optionally preempts the running process when a
+    higher-priority process arrives, and ages waiting processes to prevent starvation.
     """
 
+    def __init__(
+        self,
+        preemptive: bool = False,
+        aging_interval: Optional[int] = None,
+        aging_step: int = 1,
+        max_priority: Optional[int] = None
+    ):
+        """
+        Initializes the Priority scheduler.
+
+        Args:
+            preemptive: Preempt the running process when a process with a strictly
+                        higher priority arrives.
+            aging_interval: Time units a process must wait in the ready queue to gain
+                            aging_step priority. None disables aging.
+            aging_step: Priority added per elapsed aging interval.
+            max_priority: Optional ceiling for aged priorities.
+        """
+        if aging_interval is not None and aging_interval <= 0:
+            raise ValueError("aging_interval must be a positive number of time units.")
+        self.preemptive = preemptive
+        self.aging_interval = aging_interval
+        self.aging_step = aging_step
+        self.max_priority = max_priority
+
     def schedule(self, process_list: List[Process]) -> List[Tuple[int, int, int]]:
         """
         Calculates execution timeline using Priority logic.
@@ -15,35 +46,124 @@ class PriorityScheduler(BaseScheduler):
         if not process_list:
             return []
 
+        if self.preemptive or self.aging_interval is not None:
+            return self._schedule_dynamic(process_list)
+
         # Note: Non-preemptive priority also needs to consider arrival time.
-        # We process whatever is available at current_time with highest priority.
-        
-        remaining = sorted(process_list, key=lambda x: x.arrival_time)
+        # Arrived processes sit in a max-heap on priority; ties are broken by
+        # position in the arrival-sorted list (i.e. FCFS within a priority level).
+        incoming = sorted(process_list, key=lambda x: x.arrival_time)
+        n = len(incoming)
+        ready: List[Tuple[int, int, Process]] = []
+        next_idx = 0
         timeline = []
         current_time = 0
-        completed = []
 
-        while remaining:
-            # Get processes that have arrived
-            available = [p for p in remaining if p.arrival_time <= current_time]
-            
-            if not available:
+        while next_idx < n or ready:
+            # Move processes that have arrived into the heap
+            while next_idx < n and incoming[next_idx].arrival_time <= current_time:
+                p = incoming[next_idx]
+                heapq.heappush(ready, (-p.priority, next_idx, p))
+                next_idx += 1
+
+            if not ready:
                 # CPU Idle
-                current_time = remaining[0].arrival_time
+                current_time = incoming[next_idx].arrival_time
                 continue
-            
+
             # Select highest priority from available
-            # (If priorities are equal, FCFS within that group is implicit by initial sort)
-            p = max(available, key=lambda x: x.priority)
-            
+            p = heapq.heappop(ready)[-1]
+
             start = current_time
             current_time += p.burst_time
-            
+
             timeline.append((p.pid, start, current_time))
             p.calculate_metrics(current_time)
-            
-            remaining.remove(p)
-            completed.append(p)
+
+        return timeline
+
+    def _schedule_dynamic(self, process_list: List[Process]) -> List[Tuple[int, int, int]]:
+        """
+        Preemptive and/or aging variant.
+
+        Ready processes live in an IndexedHeap keyed on (-effective_priority, arrival index),
+        so aging raises a waiting process's priority with a single O(log n) key update.
+        Aging is applied lazily at decision points from a min-heap of due times; an
+        effective priority is kept when a process is preempted, but it only grows while
+        the process waits. Preemption is only considered when a process arrives.
+        """
+        incoming = sorted(process_list, key=lambda x: x.arrival_time)
+        n = len(incoming)
+        remaining = [p.burst_time for p in incoming]
+        effective = [p.priority for p in incoming]
+        ready = IndexedHeap()
+
+        aging = self.aging_interval is not None
+        interval = self.aging_interval
+        aging_due: List[Tuple[int, int]] = []
+        next_due = [0] * n
+
+        def enqueue(idx: int, time: int) -> None:
+            ready.push(idx, (-effective[idx], idx))
+            if aging and (self.max_priority is None or effective[idx] < self.max_priority):
+                next_due[idx] = time + interval
+                heapq.heappush(aging_due, (next_due[idx], idx))
+
+        def apply_aging(time: int) -> None:
+            while aging_due and aging_due[0][0] <= time:
+                due, idx = heapq.heappop(aging_due)
+                if idx not in ready or next_due[idx] != due:
+                    continue  # Stale entry: the process ran since it was queued
+                intervals = (time - due) // interval + 1
+                aged = effective[idx] + intervals * self.aging_step
+                if self.max_priority is not None:
+                    aged = min(aged, self.max_priority)
+                effective[idx] = aged
+                ready.update(idx, (-aged, idx))
+                if self.max_priority is None or aged < self.max_priority:
+                    next_due[idx] = due + intervals * interval
+                    heapq.heappush(aging_due, (next_due[idx], idx))
+
+        next_idx = 0
+        timeline = []
+        current_time = 0
+
+        while next_idx < n or ready:
+            while next_idx < n and incoming[next_idx].arrival_time <= current_time:
+                enqueue(next_idx, incoming[next_idx].arrival_time)
+                next_idx += 1
+
+            if not ready:
+                # CPU Idle
+                current_time = incoming[next_idx].arrival_time
+                continue
+
+            if aging:
+                apply_aging(current_time)
+
+            idx, _ = ready.pop()
+            p = incoming[idx]
+            start = current_time
+            end = current_time + remaining[idx]
+
+            if self.preemptive:
+                # Run until completion or the first arrival that outranks this process
+                while next_idx < n and incoming[next_idx].arrival_time < end:
+                    arrived = incoming[next_idx]
+                    enqueue(next_idx, arrived.arrival_time)
+                    next_idx += 1
+                    if arrived.priority > effective[idx]:
+                        end = arrived.arrival_time
+                        break
+
+            remaining[idx] -= end - start
+            current_time = end
+            timeline.append((p.pid, start, end))
+
+            if remaining[idx] == 0:
+                p.calculate_metrics(current_time)
+            else:
+                enqueue(idx, current_time)
 
         return timeline
 
@@ -51,4 +171,15 @@ class PriorityScheduler(BaseScheduler):
         """
         Calculates metrics for the process list.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def create_ready_queue(self) -> ReadyQueue:
+        """
+        Returns the equivalent online ready queue for event-driven simulation.
+        """
+        return PriorityReadyQueue(
+            preemptive=self.preemptive,
+            aging_interval=self.aging_interval,
+            aging_step=self.aging_step,
+            max_priority=self.max_priority
+        )
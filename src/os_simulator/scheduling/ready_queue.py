@@ -0,0 +1,316 @@
+import heapq
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+from os_simulator.process import Process
+from .indexed_heap import IndexedHeap
+
+class ReadyQueue(ABC):
+    """
+    Online ready-queue policy used by the event-driven kernel.
+
+    Unlike BaseScheduler.schedule(), which precomputes a whole timeline, a
+    ReadyQueue is consulted only at decision points: when a process becomes
+    ready, when the CPU needs a new process, and when a newly ready process
+    might preempt the running one.
+    """
+
+    @abstractmethod
+    def push(self, process: Process, current_time: int) -> None:
+        """
+        Adds a process that has just become ready.
+
+        Args:
+            process: The Process entering the ready state.
+            current_time: Simulation time of the transition.
+        """
+        pass
+
+    @abstractmethod
+    def pop(self, current_time: int) -> Process:
+        """
+        Removes and returns the next process to run.
+
+        Args:
+            current_time: Simulation time of the dispatch decision.
+        """
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    def time_slice(self, process: Process) -> Optional[int]:
+        """
+        Returns the maximum CPU time granted to a dispatched process.
+        None means the process runs until it blocks or terminates.
+        """
+        return None
+
+    def should_preempt(self, running: Process, arrived: Process, current_time: int) -> bool:
+        """
+        Decides whether a newly ready process preempts the running one.
+        The running process's remaining_time is up to date when this is called.
+        """
+        return False
+
+    def block(self, process: Process, current_time: int) -> None:
+        """
+        Notes that the running process left the CPU to wait for I/O.
+        It is pushed again when the I/O completes.
+        """
+        pass
+
+    def steal(self, current_time: int) -> Tuple[Process, Any]:
+        """
+        Removes a waiting process so another core can run it (work stealing).
+        Defaults to the process that would have run next here.
+
+        Returns:
+            The process and the per-process state this queue kept for it
+            (None if it keeps none), to be handed to the thief's adopt().
+        """
+        return self.pop(current_time), None
+
+    def adopt(self, process: Process, state: Any, current_time: int) -> None:
+        """
+        Queues a process stolen from another queue of the same policy, restoring
+        the state steal() returned so migrating does not reset it.
+        """
+        self.push(process, current_time)
+
+    def forget(self, process: Process) -> None:
+        """
+        Drops any per-process bookkeeping once a process has terminated,
+        so long simulations keep memory proportional to active processes.
+        """
+        pass
+
+class FIFOReadyQueue(ReadyQueue):
+    """
+    First-in, first-out ready queue.
+    Behaves like FCFS without a quantum and like Round Robin with one.
+    """
+
+    def __init__(self, quantum: Optional[int] = None):
+        self.quantum = quantum
+        self._queue: Deque[Process] = deque()
+
+    def push(self, process: Process, current_time: int) -> None:
+        self._queue.append(process)
+
+    def pop(self, current_time: int) -> Process:
+        return self._queue.popleft()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def time_slice(self, process: Process) -> Optional[int]:
+        return self.quantum
+
+class PriorityReadyQueue(ReadyQueue):
+    """
+    Binary-heap ready queue ordered by priority (higher value = higher priority).
+    Ties are broken by arrival time, then by the order processes first became
+    ready, so a preempted process keeps its place among equals as in
+    PriorityScheduler.
+
+    With an aging_interval, waiting processes gain aging_step priority per full
+    interval spent in the queue, as in PriorityScheduler. Ready processes then sit
+    in an IndexedHeap so an aged priority is a single key update; aging is applied
+    lazily when the CPU asks for a process, and the effective priority survives
+    preemption and I/O but only grows while the process waits.
+    """
+
+    def __init__(
+        self,
+        preemptive: bool = False,
+        aging_interval: Optional[int] = None,
+        aging_step: int = 1,
+        max_priority: Optional[int] = None
+    ):
+        self.preemptive = preemptive
+        self.aging_interval = aging_interval
+        self.aging_step = aging_step
+        self.max_priority = max_priority
+        self._heap: List[Tuple[int, int, int, Process]] = []
+        self._counter = 0
+        self._order: Dict[int, int] = {}
+        # Aging state: ready processes by pid, effective priorities and due times
+        self._ready = IndexedHeap()
+        self._processes: Dict[int, Process] = {}
+        self._effective: Dict[int, int] = {}
+        self._next_due: Dict[int, int] = {}
+        self._aging_due: List[Tuple[int, int]] = []
+
+    def push(self, process: Process, current_time: int) -> None:
+        pid = process.pid
+        order = self._order.get(pid)
+        if order is None:
+            self._counter += 1
+            order = self._order[pid] = self._counter
+        if self.aging_interval is None:
+            heapq.heappush(self._heap, (-process.priority, process.arrival_time, order, process))
+            return
+        effective = self._effective.setdefault(pid, process.priority)
+        self._processes[pid] = process
+        self._ready.push(pid, (-effective, process.arrival_time, order))
+        if self.max_priority is None or effective < self.max_priority:
+            self._next_due[pid] = current_time + self.aging_interval
+            heapq.heappush(self._aging_due, (self._next_due[pid], pid))
+
+    def pop(self, current_time: int) -> Process:
+        if self.aging_interval is None:
+            return heapq.heappop(self._heap)[-1]
+        self._apply_aging(current_time)
+        pid, _ = self._ready.pop()
+        self._next_due.pop(pid, None)
+        return self._processes.pop(pid)
+
+    def __len__(self) -> int:
+        return len(self._heap) if self.aging_interval is None else len(self._ready)
+
+    def should_preempt(self, running: Process, arrived: Process, current_time: int) -> bool:
+        if not self.preemptive:
+            return False
+        return self._effective.get(arrived.pid, arrived.priority) > self._effective.get(running.pid, running.priority)
+
+    def steal(self, current_time: int) -> Tuple[Process, Any]:
+        process = self.pop(current_time)
+        self._order.pop(process.pid, None)
+        # The aged priority travels with the process
+        return process, self._effective.pop(process.pid, None)
+
+    def adopt(self, process: Process, state: Any, current_time: int) -> None:
+        if state is not None:
+            self._effective[process.pid] = state
+        self.push(process, current_time)
+
+    def forget(self, process: Process) -> None:
+        self._order.pop(process.pid, None)
+        self._effective.pop(process.pid, None)
+
+    def _apply_aging(self, current_time: int) -> None:
+        """Raises the priority of every process whose aging interval has elapsed."""
+        interval = self.aging_interval
+        while self._aging_due and self._aging_due[0][0] <= current_time:
+            due, pid = heapq.heappop(self._aging_due)
+            if self._next_due.get(pid) != due:
+                continue  # Stale entry: the process ran since it was queued
+            intervals = (current_time - due) // interval + 1
+            aged = self._effective[pid] + intervals * self.aging_step
+            if self.max_priority is not None:
+                aged = min(aged, self.max_priority)
+            self._effective[pid] = aged
+            _, arrival_time, order = self._ready.key_of(pid)
+            self._ready.update(pid, (-aged, arrival_time, order))
+            if self.max_priority is None or aged < self.max_priority:
+                self._next_due[pid] = due + intervals * interval
+                heapq.heappush(self._aging_due, (self._next_due[pid], pid))
+            else:
+                del self._next_due[pid]
+
+class ShortestJobReadyQueue(ReadyQueue):
+    """
+    Binary-heap ready queue ordered by remaining CPU time (SJF / SRTF).
+    Ties are broken by arrival time, then by the order processes became ready.
+    """
+
+    def __init__(self, preemptive: bool = False):
+        self.preemptive = preemptive
+        self._heap: List[Tuple[int, int, int, Process]] = []
+        self._counter = 0
+
+    def push(self, process: Process, current_time: int) -> None:
+        self._counter += 1
+        heapq.heappush(self._heap, (process.remaining_time, process.arrival_time, self._counter, process))
+
+    def pop(self, current_time: int) -> Process:
+        return heapq.heappop(self._heap)[-1]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def should_preempt(self, running: Process, arrived: Process, current_time: int) -> bool:
+        return self.preemptive and arrived.remaining_time < running.remaining_time
+
+class MLFQReadyQueue(ReadyQueue):
+    """
+    Multi-level feedback ready queue with one FIFO deque per level.
+
+    A process is demoted when it comes back having used its whole quantum; one that
+    blocked on I/O earlier keeps its level. Boosts are tracked with an epoch counter,
+    so levels of processes that are running or blocked are reset lazily on their next push.
+    """
+
+    def __init__(self, quanta: Sequence[Optional[int]], boost_interval: Optional[int] = None):
+        self.quanta = list(quanta)
+        self.boost_interval = boost_interval
+        self._levels: List[Deque[Process]] = [deque() for _ in self.quanta]
+        self._size = 0
+        self._epoch = 0
+        self._next_boost = boost_interval
+        # pid -> (level, boost epoch) and pid -> (level, remaining time) at dispatch
+        self._level_of: Dict[int, Tuple[int, int]] = {}
+        self._dispatched: Dict[int, Tuple[int, int]] = {}
+
+    def push(self, process: Process, current_time: int) -> None:
+        self._maybe_boost(current_time)
+        level, epoch = self._level_of.get(process.pid, (0, self._epoch))
+        if epoch != self._epoch:
+            level = 0
+
+        dispatched = self._dispatched.pop(process.pid, None)
+        if dispatched is not None and epoch == self._epoch:
+            run_level, remaining_at_dispatch = dispatched
+            quantum = self.quanta[run_level]
+            if quantum is not None and remaining_at_dispatch - process.remaining_time >= quantum:
+                level = min(run_level + 1, len(self.quanta) - 1)
+
+        self._level_of[process.pid] = (level, self._epoch)
+        self._levels[level].append(process)
+        self._size += 1
+
+    def pop(self, current_time: int) -> Process:
+        self._maybe_boost(current_time)
+        level = next(i for i, queue in enumerate(self._levels) if queue)
+        process = self._levels[level].popleft()
+        self._size -= 1
+        self._dispatched[process.pid] = (level, process.remaining_time)
+        return process
+
+    def __len__(self) -> int:
+        return self._size
+
+    def time_slice(self, process: Process) -> Optional[int]:
+        return self.quanta[self._dispatched[process.pid][0]]
+
+    def steal(self, current_time: int) -> Tuple[Process, Any]:
+        process = self.pop(current_time)
+        level, _ = self._dispatched.pop(process.pid)
+        del self._level_of[process.pid]
+        return process, level
+
+    def adopt(self, process: Process, state: Any, current_time: int) -> None:
+        # Keep the demoted level; the boost epoch is local to this queue
+        self._maybe_boost(current_time)
+        self._level_of[process.pid] = (state, self._epoch)
+        self.push(process, current_time)
+
+    def forget(self, process: Process) -> None:
+        self._level_of.pop(process.pid, None)
+        self._dispatched.pop(process.pid, None)
+
+    def _maybe_boost(self, current_time: int) -> None:
+        """Moves every queued process to the top level once a boost is due."""
+        if self._next_boost is None or current_time < self._next_boost:
+            return
+        top = self._levels[0]
+        for queue in self._levels[1:]:
+            top.extend(queue)
+            queue.clear()
+        self._epoch += 1
+        for process in top:
+            self._level_of[process.pid] = (0, self._epoch)
+        elapsed = current_time - self._next_boost
+        self._next_boost += (elapsed // self.boost_interval + 1) * self.boost_interval
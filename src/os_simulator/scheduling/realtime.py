@@ -0,0 +1,164 @@
+import heapq
+import math
+from typing import Callable, List, Tuple
+from .base_scheduler import BaseScheduler
+from .ready_queue import ReadyQueue
+from os_simulator.process import Process
+
+def release_periodic_jobs(tasks: List[Process], horizon: int, first_pid: int = 1) -> List[Process]:
+    """
+    Expands periodic tasks into the individual jobs released before the horizon.
+
+    A task with a period releases a job at arrival_time + k * period for every k
+    with a release time below the horizon; a task without a period releases one job.
+    Jobs are new Process objects numbered from first_pid in release order and named
+    "<task name>#<k>". Each job inherits the task's burst, priority, memory, I/O
+    phases, relative deadline and period.
+
+    Args:
+        tasks: Task templates. They are not modified.
+        horizon: Simulation length; no job is released at or after this time.
+        first_pid: PID of the first released job.
+    """
+    releases: List[Tuple[int, int, int, Process]] = []
+    for order, task in enumerate(tasks):
+        if task.period is None:
+            if task.arrival_time < horizon:
+                releases.append((task.arrival_time, order, 0, task))
+            continue
+        for k, release in enumerate(range(task.arrival_time, horizon, task.period)):
+            releases.append((release, order, k, task))
+    releases.sort(key=lambda r: (r[0], r[1]))
+
+    jobs = []
+    for pid, (release, _, k, task) in enumerate(releases, start=first_pid):
+        jobs.append(Process(
+            pid, f"{task.name}#{k}", release, task.burst_time,
+            priority=task.priority,
+            memory_required=task.memory_required,
+            io_bursts=list(task.io_bursts),
+            deadline=task.deadline,
+            period=task.period
+        ))
+    return jobs
+
+class RealTimeReadyQueue(ReadyQueue):
+    """
+    Binary-heap ready queue for preemptive real-time policies.
+    Ordered by a policy key (smaller = more urgent), then by arrival time,
+    then by the order processes became ready.
+    """
+
+    def __init__(self, priority_key: Callable[[Process], float]):
+        self.priority_key = priority_key
+        self._heap: List[Tuple[float, int, int, Process]] = []
+        self._counter = 0
+
+    def push(self, process: Process, current_time: int) -> None:
+        self._counter += 1
+        heapq.heappush(self._heap, (self.priority_key(process), process.arrival_time, self._counter, process))
+
+    def pop(self, current_time: int) -> Process:
+        return heapq.heappop(self._heap)[-1]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def should_preempt(self, running: Process, arrived: Process, current_time: int) -> bool:
+        return self.priority_key(arrived) < self.priority_key(running)
+
+class EDFScheduler(BaseScheduler):
+    """
+    Earliest Deadline First (EDF) Scheduling implementation.
+
+    Preemptive dynamic-priority scheduling: the ready job with the earliest
+    absolute deadline always runs, and an arriving job with an earlier deadline
+    preempts the running one. Processes without a deadline run only when no
+    job with a deadline is ready. Late jobs still run to completion; misses
+    are reported by MetricsCalculator.
+    """
+
+    def _key(self, process: Process) -> float:
+        """Urgency of a process (smaller runs first)."""
+        deadline = process.absolute_deadline
+        return math.inf if deadline is None else deadline
+
+    def schedule(self, process_list: List[Process]) -> List[Tuple[int, int, int]]:
+        """
+        Calculates execution timeline using the real-time policy.
+        """
+        if not process_list:
+            return []
+
+        # Ready jobs sit in a min-heap keyed on (urgency, arrival index)
+        incoming = sorted(process_list, key=lambda x: x.arrival_time)
+        n = len(incoming)
+        keys = [self._key(p) for p in incoming]
+        remaining = [p.burst_time for p in incoming]
+        ready: List[Tuple[float, int]] = []
+        next_idx = 0
+        timeline = []
+        current_time = 0
+
+        while next_idx < n or ready:
+            while next_idx < n and incoming[next_idx].arrival_time <= current_time:
+                heapq.heappush(ready, (keys[next_idx], next_idx))
+                next_idx += 1
+
+            if not ready:
+                # CPU Idle
+                current_time = incoming[next_idx].arrival_time
+                continue
+
+            key, idx = heapq.heappop(ready)
+            p = incoming[idx]
+            start = current_time
+            end = current_time + remaining[idx]
+
+            # Only arrivals can produce a more urgent job, so jump from one arrival to the next
+            while next_idx < n and incoming[next_idx].arrival_time < end:
+                arrival = incoming[next_idx].arrival_time
+                while next_idx < n and incoming[next_idx].arrival_time == arrival:
+                    heapq.heappush(ready, (keys[next_idx], next_idx))
+                    next_idx += 1
+                if ready[0][0] < key:
+                    heapq.heappush(ready, (key, idx))
+                    end = arrival
+                    break
+
+            current_time = end
+            remaining[idx] -= end - start
+            timeline.append((p.pid, start, end))
+
+            if remaining[idx] == 0:
+                p.calculate_metrics(current_time)
+
+        return timeline
+
+    def calculate_metrics(self, process_list: List[Process]) -> None:
+        """
+        Metrics (TAT, WT, lateness) are derived automatically when a job finishes in schedule().
+        """
+        pass
+
+    def create_ready_queue(self) -> ReadyQueue:
+        """
+        Returns the equivalent online ready queue for event-driven simulation.
+        """
+        return RealTimeReadyQueue(self._key)
+
+class RateMonotonicScheduler(EDFScheduler):
+    """
+    Rate-Monotonic (RM) Scheduling implementation.
+
+    Preemptive fixed-priority scheduling where the task with the shortest period
+    has the highest priority. Processes without a period are ranked by their
+    relative deadline (deadline-monotonic), and processes with neither run last.
+    """
+
+    def _key(self, process: Process) -> float:
+        if process.period is not None:
+            return process.period
+        if process.deadline is not None:
+            return process.deadline
+        return math.inf
@@ -1,19 +1,33 @@
 from typing import List, Tuple, Deque
 from collections import deque
 from .base_scheduler import BaseScheduler
+from .ready_queue import ReadyQueue, FIFOReadyQueue
 from os_simulator.process import Process
 
 class RoundRobinScheduler(BaseScheduler):
     """
     Round Robin (RR) Scheduling implementation.
     A preemptive algorithm using a fixed time quantum.
+
+    With merge_segments=True the schedule is unchanged but computed in batches:
+    a process that is alone in the ready queue runs all its quanta up to the next
+    arrival as one segment, and once the ready set has been stable for a full round,
+    whole rounds are batched until a process could finish or arrive. Batching skips
+    the per-quantum queue rotation and arrival/completion checks, but the timeline
+    still gets one segment per quantum, since the processes' turns interleave.
     """
 
-    def __init__(self, quantum: int = 2):
+    def __init__(self, quantum: int = 2, merge_segments: bool = False):
         """
         Initializes RR with a time quantum.
+
+        Args:
+            quantum: Time slice per turn.
+            merge_segments: Collapse consecutive quanta of the same process into one
+                            timeline segment and batch stable rounds.
         """
         self.quantum = quantum
+        self.merge_segments = merge_segments
 
     def schedule(self, process_list: List[Process]) -> List[Tuple[int, int, int]]:
         """
@@ -30,11 +44,15 @@ class RoundRobinScheduler(BaseScheduler):
         current_time = 0
         completed_count = 0
         n = len(process_list)
+        quantum = self.quantum
+        # Consecutive slices without arrivals or completions (merge_segments only)
+        stable_slices = 0
 
         while completed_count < n:
             # Add arriving processes to ready queue
             while arrival_queue and arrival_queue[0].arrival_time <= current_time:
                 ready_queue.append(arrival_queue.popleft())
+                stable_slices = 0
 
             if not ready_queue:
                 if arrival_queue:
@@ -43,24 +61,60 @@ class RoundRobinScheduler(BaseScheduler):
                 else:
                     break
 
+            if self.merge_segments and stable_slices >= len(ready_queue) > 1:
+                # Stable ready set: batch whole rounds while no process can finish
+                # and nothing arrives. The O(m) check is paid once per m slices;
+                # emitting the segments themselves stays O(rounds * m).
+                stable_slices = 0
+                round_length = len(ready_queue) * quantum
+                rounds = (min(q.remaining_time for q in ready_queue) - 1) // quantum
+                if arrival_queue:
+                    rounds = min(rounds, (arrival_queue[0].arrival_time - current_time - 1) // round_length)
+                if rounds > 0:
+                    pids = [q.pid for q in ready_queue]
+                    m = len(pids)
+                    start = current_time
+                    timeline.extend(
+                        (pids[k % m], start + k * quantum, start + (k + 1) * quantum)
+                        for k in range(rounds * m)
+                    )
+                    current_time += rounds * round_length
+                    for q in ready_queue:
+                        q.remaining_time -= rounds * quantum
+                    continue
+
             p = ready_queue.popleft()
-            exec_time = min(p.remaining_time, self.quantum)
+            exec_time = min(p.remaining_time, quantum)
+            if self.merge_segments and not ready_queue:
+                # Sole runnable process: it keeps the CPU for every quantum that ends
+                # before the next arrival, so run them as one stretch
+                if arrival_queue:
+                    quanta = max(1, -(-(arrival_queue[0].arrival_time - current_time) // quantum))
+                    exec_time = min(p.remaining_time, quanta * quantum)
+                else:
+                    exec_time = p.remaining_time
             
             start = current_time
             current_time += exec_time
             p.remaining_time -= exec_time
             
-            timeline.append((p.pid, start, current_time))
+            if self.merge_segments and timeline and timeline[-1][0] == p.pid and timeline[-1][2] == start:
+                timeline[-1] = (p.pid, timeline[-1][1], current_time)
+            else:
+                timeline.append((p.pid, start, current_time))
 
             # Add processes that arrive DURING this execution segment
             while arrival_queue and arrival_queue[0].arrival_time <= current_time:
                 ready_queue.append(arrival_queue.popleft())
+                stable_slices = 0
 
             if p.remaining_time > 0:
                 ready_queue.append(p)
+                stable_slices += 1
             else:
                 p.calculate_metrics(current_time)
                 completed_count += 1
+                stable_slices = 0
 
         return timeline
 
@@ -69,3 +123,9 @@ class RoundRobinScheduler(BaseScheduler):
         Metrics (TAT, WT) are derived automatically when process finishes in schedule().
         """
         pass
+
+    def create_ready_queue(self) -> ReadyQueue:
+        """
+        Returns the equivalent online ready queue for event-driven simulation.
+        """
+        return FIFOReadyQueue(quantum=self.quantum)
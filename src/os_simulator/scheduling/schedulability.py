@@ -0,0 +1,229 @@
+import math
+import random
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+# Tolerance for floating-point task parameters produced by UUniFast
+_EPS = 1e-9
+
+# Iteration cap for the busy-period fixed point, which converges slowly (if at
+# all) when utilization is within rounding of 1
+_MAX_BUSY_ITERATIONS = 100000
+
+class PeriodicTask(NamedTuple):
+    """
+    A periodic real-time task for analytical schedulability tests.
+
+    Attributes:
+        wcet: Worst-case execution time per job.
+        period: Release period.
+        deadline: Relative deadline (None means equal to the period).
+    """
+    wcet: float
+    period: float
+    deadline: Optional[float] = None
+
+    @property
+    def relative_deadline(self) -> float:
+        return self.period if self.deadline is None else self.deadline
+
+    @property
+    def utilization(self) -> float:
+        return self.wcet / self.period
+
+def total_utilization(tasks: Sequence[PeriodicTask]) -> float:
+    """Sum of wcet / period over the task set."""
+    return sum(t.wcet / t.period for t in tasks)
+
+def liu_layland_bound(n: int) -> float:
+    """Rate-Monotonic utilization bound n * (2^(1/n) - 1)."""
+    if n <= 0:
+        return 1.0
+    return n * (2 ** (1 / n) - 1)
+
+def rm_utilization_test(tasks: Sequence[PeriodicTask]) -> bool:
+    """
+    Liu & Layland test for Rate-Monotonic with implicit deadlines.
+    Sufficient only: False means "unknown", not "unschedulable".
+    """
+    return total_utilization(tasks) <= liu_layland_bound(len(tasks)) + _EPS
+
+def hyperbolic_bound_test(tasks: Sequence[PeriodicTask]) -> bool:
+    """
+    Bini's hyperbolic bound for Rate-Monotonic: prod(U_i + 1) <= 2.
+    Sufficient only, but tighter than the Liu & Layland bound.
+    """
+    product = 1.0
+    for t in tasks:
+        product *= t.wcet / t.period + 1
+        if product > 2 + _EPS:
+            return False
+    return True
+
+def response_time_analysis(tasks: Sequence[PeriodicTask]) -> List[Optional[float]]:
+    """
+    Exact worst-case response times under deadline-monotonic fixed priorities
+    (identical to Rate-Monotonic for implicit deadlines), for constrained deadlines.
+
+    Iterates R = C_i + sum_{j in hp(i)} ceil(R / T_j) * C_j to a fixed point.
+
+    Returns:
+        The response time of each task in input order, or None for tasks whose
+        response time exceeds their deadline.
+    """
+    order = sorted(range(len(tasks)), key=lambda i: (tasks[i].relative_deadline, tasks[i].period))
+    results: List[Optional[float]] = [None] * len(tasks)
+    higher: List[PeriodicTask] = []
+
+    for i in order:
+        task = tasks[i]
+        deadline = task.relative_deadline
+        response = task.wcet + sum(t.wcet for t in higher)
+        while response <= deadline + _EPS:
+            demand = task.wcet + sum(math.ceil(response / t.period - _EPS) * t.wcet for t in higher)
+            if demand <= response + _EPS:
+                results[i] = demand
+                break
+            response = demand
+        higher.append(task)
+
+    return results
+
+def _busy_period(tasks: Sequence[PeriodicTask]) -> float:
+    """
+    Length of the synchronous busy period (requires utilization <= 1), or
+    math.inf if the fixed point is not reached within _MAX_BUSY_ITERATIONS.
+    """
+    length = sum(t.wcet for t in tasks)
+    for _ in range(_MAX_BUSY_ITERATIONS):
+        demand = sum(math.ceil(length / t.period - _EPS) * t.wcet for t in tasks)
+        if demand <= length + _EPS:
+            return length
+        length = demand
+    return math.inf
+
+def edf_demand_test(tasks: Sequence[PeriodicTask]) -> bool:
+    """
+    Exact EDF test for a single processor.
+
+    Implicit (or later-than-period) deadlines reduce to utilization <= 1. Constrained
+    deadlines are checked with the processor demand criterion at every absolute
+    deadline up to the shorter of the La bound and the synchronous busy period.
+    """
+    utilization = total_utilization(tasks)
+    if utilization > 1 + _EPS:
+        return False
+    if all(t.relative_deadline >= t.period for t in tasks):
+        return True
+
+    if utilization > 1:
+        # Within rounding of 1 but above it: demand outgrows time, so the busy period never ends
+        return False
+
+    horizon = _busy_period(tasks)
+    if utilization < 1 - _EPS:
+        la = sum((t.period - t.relative_deadline) * t.utilization for t in tasks) / (1 - utilization)
+        horizon = min(horizon, max(la, max(t.relative_deadline for t in tasks)))
+    if math.isinf(horizon):
+        # No finite set of deadlines to check: not provably schedulable
+        return False
+
+    checkpoints = set()
+    for t in tasks:
+        d = t.relative_deadline
+        while d <= horizon + _EPS:
+            checkpoints.add(d)
+            d += t.period
+
+    for point in sorted(checkpoints):
+        demand = 0.0
+        for t in tasks:
+            if point + _EPS >= t.relative_deadline:
+                demand += (math.floor((point - t.relative_deadline) / t.period + _EPS) + 1) * t.wcet
+        if demand > point + _EPS:
+            return False
+    return True
+
+def is_schedulable(tasks: Sequence[PeriodicTask], policy: str = "rm") -> bool:
+    """
+    Decides whether a task set is schedulable on one processor.
+
+    Cheap bounds are tried first and the exact test runs only when they are
+    inconclusive, which keeps bulk screening fast.
+
+    Args:
+        tasks: The periodic task set.
+        policy: "rm" (Rate/Deadline-Monotonic) or "edf".
+    """
+    if not tasks:
+        return True
+    if total_utilization(tasks) > 1 + _EPS:
+        return False
+
+    if policy == "edf":
+        return edf_demand_test(tasks)
+    if policy == "rm":
+        implicit = all(t.relative_deadline == t.period for t in tasks)
+        if implicit and hyperbolic_bound_test(tasks):
+            return True
+        return all(r is not None for r in response_time_analysis(tasks))
+    raise ValueError(f"Unknown real-time policy: {policy}")
+
+def uunifast(n: int, utilization: float, rng: random.Random) -> List[float]:
+    """
+    UUniFast: draws n task utilizations summing to utilization, uniformly distributed
+    over the valid simplex (Bini & Buttazzo).
+    """
+    utilizations = []
+    remaining = utilization
+    for i in range(1, n):
+        next_remaining = remaining * rng.random() ** (1 / (n - i))
+        utilizations.append(remaining - next_remaining)
+        remaining = next_remaining
+    utilizations.append(remaining)
+    return utilizations
+
+def generate_task_sets(
+    count: int,
+    n: int,
+    utilization: float,
+    period_range: Tuple[int, int] = (10, 1000),
+    seed: Optional[int] = None
+) -> List[List[PeriodicTask]]:
+    """
+    Generates random implicit-deadline task sets for schedulability screening.
+
+    Utilizations come from UUniFast and integer periods are drawn log-uniformly
+    from period_range, so short and long periods are equally represented.
+
+    Args:
+        count: Number of task sets.
+        n: Tasks per set.
+        utilization: Total utilization of every set.
+        period_range: Inclusive (min, max) period.
+        seed: Seed for reproducible task sets.
+    """
+    if n <= 0 or count < 0:
+        raise ValueError("count must be non-negative and n positive.")
+    low, high = period_range
+    if low <= 0 or high < low:
+        raise ValueError(f"Invalid period range: {period_range}")
+
+    rng = random.Random(seed)
+    log_low, log_high = math.log(low), math.log(high + 1)
+    task_sets = []
+    for _ in range(count):
+        tasks = []
+        for u in uunifast(n, utilization, rng):
+            period = min(high, int(math.exp(rng.uniform(log_low, log_high))))
+            tasks.append(PeriodicTask(u * period, period))
+        task_sets.append(tasks)
+    return task_sets
+
+def screen_task_sets(task_sets: Sequence[Sequence[PeriodicTask]], policy: str = "rm") -> List[bool]:
+    """
+    Runs is_schedulable over many task sets.
+
+    Returns:
+        One schedulability verdict per task set, in input order.
+    """
+    return [is_schedulable(tasks, policy) for tasks in task_sets]
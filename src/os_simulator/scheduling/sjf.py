@@ -1,48 +1,86 @@
-from typing import List
-from .base_scheduler import BaseScheduler, logger
-from .models import Process, GanttEntry
+import heapq
+from typing import List, Tuple
+from .base_scheduler import BaseScheduler
+from .ready_queue import ReadyQueue, ShortestJobReadyQueue
+from os_simulator.process import Process
 
 class SJFScheduler(BaseScheduler):
     """
     Shortest Job First (SJF) Scheduling implementation.
-    Non-preemptive algorithm that selects the process with the smallest burst time.
+
+    Non-preemptive by default: the arrived process with the smallest burst time runs
+    to completion. With preemptive=True it becomes Shortest-Remaining-Time-First (SRTF),
+    re-evaluated only when new processes arrive.
     """
-    
-    def run(self) -> List[GanttEntry]:
-        self.gantt_chart = []
-        if not self.processes:
+
+    def __init__(self, preemptive: bool = False):
+        """
+        Initializes the SJF scheduler.
+
+        Args:
+            preemptive: Use Shortest-Remaining-Time-First instead of plain SJF.
+        """
+        self.preemptive = preemptive
+
+    def schedule(self, process_list: List[Process]) -> List[Tuple[int, int, int]]:
+        """
+        Calculates execution timeline using SJF (or SRTF) logic.
+        """
+        if not process_list:
             return []
 
-        # We'll use a copy to avoid mutating the original arrival order during selection
-        ready_queue = []
-        incoming = sorted(self.processes, key=lambda x: x.arrival_time)
-        
+        # Arrived processes sit in a min-heap keyed on (remaining burst, arrival index),
+        # so ties go to whichever process arrived first.
+        incoming = sorted(process_list, key=lambda x: x.arrival_time)
+        n = len(incoming)
+        ready: List[Tuple[int, int]] = []
+        next_idx = 0
+        timeline = []
         current_time = 0
-        completed_count = 0
-        n = len(self.processes)
-
-        while completed_count < n:
-            # Handle new arrivals
-            while incoming and incoming[0].arrival_time <= current_time:
-                ready_queue.append(incoming.pop(0))
 
-            if not ready_queue:
-                if incoming:
-                    current_time = incoming[0].arrival_time
-                    continue
-                else: break
+        while next_idx < n or ready:
+            while next_idx < n and incoming[next_idx].arrival_time <= current_time:
+                heapq.heappush(ready, (incoming[next_idx].burst_time, next_idx))
+                next_idx += 1
 
-            # SJF Logic: Sort ready queue by burst time
-            ready_queue.sort(key=lambda x: x.burst_time)
-            p = ready_queue.pop(0)
+            if not ready:
+                # CPU Idle
+                current_time = incoming[next_idx].arrival_time
+                continue
 
+            remaining, idx = heapq.heappop(ready)
+            p = incoming[idx]
             start = current_time
-            current_time += p.burst_time
-            
-            self.gantt_chart.append(GanttEntry(pid=p.pid, start_time=start, end_time=current_time))
-            p.completion_time = current_time
-            completed_count += 1
-            logger.info(f"Task completed in simulation: {p.pid}")
-
-        self.calculate_metrics()
-        return self.gantt_chart
\ No newline at end of file
+            end = current_time + remaining
+
+            if self.preemptive:
+                # Only arrivals can produce a shorter job, so jump from one arrival to the next
+                while next_idx < n and incoming[next_idx].arrival_time < end:
+                    arrival = incoming[next_idx].arrival_time
+                    while next_idx < n and incoming[next_idx].arrival_time == arrival:
+                        heapq.heappush(ready, (incoming[next_idx].burst_time, next_idx))
+                        next_idx += 1
+                    if ready[0][0] < end - arrival:
+                        heapq.heappush(ready, (end - arrival, idx))
+                        end = arrival
+                        break
+
+            current_time = end
+            timeline.append((p.pid, start, end))
+
+            if end - start == remaining:
+                p.calculate_metrics(current_time)
+
+        return timeline
+
+    def calculate_metrics(self, process_list: List[Process]) -> None:
+        """
+        Metrics (TAT, WT) are derived automatically when a process finishes in schedule().
+        """
+        pass
+
+    def create_ready_queue(self) -> ReadyQueue:
+        """
+        Returns the equivalent online ready queue for event-driven simulation.
+        """
+        return ShortestJobReadyQueue(preemptive=self.preemptive)
@@ -0,0 +1,260 @@
+import math
+from typing import Any, Callable, Dict, List, Optional, Protocol
+from os_simulator.process import Process
+from os_simulator.metrics import PERCENTILES, DISTRIBUTION_METRICS
+
+class MetricsSink(Protocol):
+    """Receives simulation output incrementally, as the kernel produces it."""
+    def record_segment(self, label: Any, start: int, end: int) -> None:
+        """Called for every execution or overhead segment ("CS", "MIG")."""
+        ...
+
+    def record_completion(self, process: Process) -> None:
+        """Called once per process, after its metrics have been calculated."""
+        ...
+
+class CompositeSink:
+    """Forwards everything it receives to several sinks (e.g. StreamingMetrics and a TimelineWriter)."""
+
+    def __init__(self, *sinks: MetricsSink):
+        self.sinks = sinks
+
+    def record_segment(self, label: Any, start: int, end: int) -> None:
+        for sink in self.sinks:
+            sink.record_segment(label, start, end)
+
+    def record_completion(self, process: Process) -> None:
+        for sink in self.sinks:
+            sink.record_completion(process)
+
+class RunningStats:
+    """
+    Constant-memory count, mean, variance, min and max (Welford's algorithm).
+    """
+
+    __slots__ = ("count", "mean", "_m2", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the values seen so far."""
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
+
+class P2Quantile:
+    """
+    Constant-memory quantile estimate using the P-square algorithm (Jain & Chlamtac).
+
+    Five markers track the minimum, the target quantile, the maximum and two points
+    in between; marker heights are adjusted with piecewise-parabolic interpolation.
+    The estimate is exact for the first five observations.
+    """
+
+    __slots__ = ("q", "_heights", "_positions", "_desired", "_increments", "_count")
+
+    def __init__(self, q: float):
+        """
+        Args:
+            q: Target quantile in the range 0-1 (e.g. 0.95).
+        """
+        if not 0 < q < 1:
+            raise ValueError("Quantile must be strictly between 0 and 1.")
+        self.q = q
+        self._heights: List[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * q, 1 + 4 * q, 3 + 2 * q, 5]
+        self._increments = [0, q / 2, q, (1 + q) / 2, 1]
+        self._count = 0
+
+    def update(self, value: float) -> None:
+        self._count += 1
+        heights = self._heights
+        if self._count <= 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        # Find the first marker above the value, extending the extremes if needed
+        if value < heights[0]:
+            heights[0] = value
+            first = 1
+        elif value >= heights[4]:
+            heights[4] = value
+            first = 4
+        elif value < heights[1]:
+            first = 1
+        elif value < heights[2]:
+            first = 2
+        elif value < heights[3]:
+            first = 3
+        else:
+            first = 4
+
+        positions = self._positions
+        for i in range(first, 5):
+            positions[i] += 1
+        desired = self._desired
+        increments = self._increments
+        desired[1] += increments[1]
+        desired[2] += increments[2]
+        desired[3] += increments[3]
+        desired[4] += 1
+
+        # Move the three middle markers towards their desired positions
+        for i in (1, 2, 3):
+            d = desired[i] - positions[i]
+            if (d >= 1 and positions[i + 1] - positions[i] > 1) or (d <= -1 and positions[i - 1] - positions[i] < -1):
+                step = 1 if d > 0 else -1
+                candidate = self._parabolic(i, step)
+                if not heights[i - 1] < candidate < heights[i + 1]:
+                    candidate = heights[i] + step * (heights[i + step] - heights[i]) / (positions[i + step] - positions[i])
+                heights[i] = candidate
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        h, n = self._heights, self._positions
+        return h[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def value(self) -> Optional[float]:
+        """Current estimate, or None before the first observation."""
+        if not self._count:
+            return None
+        if self._count <= 5:
+            # Nearest rank on the few exact values
+            rank = max(1, math.ceil(self.q * self._count))
+            return self._heights[rank - 1]
+        return self._heights[2]
+
+class StreamingMetrics:
+    """
+    Incremental metrics sink fed segment-by-segment by the kernel.
+
+    Memory stays constant in the number of completed processes: waiting,
+    turnaround and response times are folded into running statistics and
+    P-square quantile estimators, and only processes that have started but not
+    finished are remembered (for their response time). snapshot() reports the
+    same keys as MetricsCalculator at any point during or after a run; the
+    percentiles are estimates.
+    """
+
+    def __init__(
+        self,
+        num_cores: int = 1,
+        report_interval: Optional[int] = None,
+        on_report: Optional[Callable[[Dict[str, Any]], None]] = None
+    ):
+        """
+        Args:
+            num_cores: Cores the busy time is spread over, for utilization.
+            report_interval: Call on_report with a snapshot every this many completions.
+            on_report: Callback receiving live snapshots during a run.
+        """
+        if report_interval is not None and report_interval <= 0:
+            raise ValueError("report_interval must be positive.")
+        self.num_cores = num_cores
+        self.report_interval = report_interval
+        self.on_report = on_report
+
+        self.stats: Dict[str, RunningStats] = {metric: RunningStats() for metric in DISTRIBUTION_METRICS}
+        self.quantiles: Dict[str, Dict[int, P2Quantile]] = {
+            metric: {q: P2Quantile(q / 100) for q in PERCENTILES} for metric in DISTRIBUTION_METRICS
+        }
+        self.lateness = RunningStats()
+        self.lateness_quantiles: Dict[int, P2Quantile] = {q: P2Quantile(q / 100) for q in PERCENTILES}
+        self.deadlines_missed = 0
+        self.segments = 0
+        self.busy_time = 0
+        self.elapsed = 0
+        self._waiting_sum_sq = 0.0
+        self._first_start: Dict[int, int] = {}
+
+    def record_segment(self, label: Any, start: int, end: int) -> None:
+        self.segments += 1
+        self.busy_time += end - start
+        if end > self.elapsed:
+            self.elapsed = end
+        if label.__class__ is int and label not in self._first_start:
+            self._first_start[label] = start
+
+    def record_completion(self, process: Process) -> None:
+        first_start = self._first_start.pop(process.pid, process.arrival_time)
+        values = {
+            "waiting_time": process.waiting_time,
+            "turnaround_time": process.turnaround_time,
+            "response_time": first_start - process.arrival_time,
+        }
+        for metric, value in values.items():
+            self.stats[metric].update(value)
+            for estimator in self.quantiles[metric].values():
+                estimator.update(value)
+        self._waiting_sum_sq += process.waiting_time ** 2
+
+        lateness = process.lateness
+        if lateness is not None:
+            self.lateness.update(lateness)
+            for estimator in self.lateness_quantiles.values():
+                estimator.update(lateness)
+            if lateness > 0:
+                self.deadlines_missed += 1
+
+        completed = self.stats["waiting_time"].count
+        if self.on_report and self.report_interval and completed % self.report_interval == 0:
+            self.on_report(self.snapshot())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current metrics over the processes completed so far."""
+        waiting = self.stats["waiting_time"]
+        n = waiting.count
+        if not n:
+            return {}
+
+        sum_x = waiting.mean * n
+        fairness = 1.0 if self._waiting_sum_sq == 0 else (sum_x ** 2) / (n * self._waiting_sum_sq)
+        capacity = self.elapsed * self.num_cores
+        results = {
+            "avg_waiting_time": round(waiting.mean, 2),
+            "max_waiting_time": waiting.max,
+            "avg_turnaround_time": round(self.stats["turnaround_time"].mean, 2),
+            "avg_response_time": round(self.stats["response_time"].mean, 2),
+            "throughput": round(n / self.elapsed, 4) if self.elapsed else 0,
+            "cpu_utilization": round(self.busy_time / capacity * 100, 2) if capacity else 0.0,
+            "fairness_index": round(fairness, 4),
+            "total_processes": n,
+            "simulation_duration": self.elapsed
+        }
+        for metric in DISTRIBUTION_METRICS:
+            for q, estimator in self.quantiles[metric].items():
+                results[f"p{q}_{metric}"] = round(estimator.value(), 2)
+            results[f"max_{metric}"] = self.stats[metric].max
+            results[f"std_{metric}"] = round(self.stats[metric].stddev, 2)
+
+        if self.lateness.count:
+            results["deadline_jobs"] = self.lateness.count
+            results["deadlines_missed"] = self.deadlines_missed
+            results["deadline_miss_ratio"] = round(self.deadlines_missed / self.lateness.count, 4)
+            for q, estimator in self.lateness_quantiles.items():
+                results[f"p{q}_lateness"] = round(estimator.value(), 2)
+            results["max_lateness"] = self.lateness.max
+        return results
@@ -0,0 +1,190 @@
+import csv
+import itertools
+import json
+import logging
+import os
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Type
+from os_simulator.comparator import Workload, as_table, run_jobs
+from os_simulator.kernel import Scheduler
+
+logger = logging.getLogger("Parameter-Sweep")
+
+# Scheduler grid entry: (scheduler class, {constructor argument: values to try})
+SchedulerGrid = Mapping[str, Tuple[Type[Scheduler], Mapping[str, Sequence[Any]]]]
+
+def expand_grid(params: Mapping[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """Cartesian product of parameter values, as one dict of arguments per combination."""
+    names = list(params)
+    return [dict(zip(names, values)) for values in itertools.product(*(params[name] for name in names))]
+
+def find_knee(xs: Sequence[float], ys: Sequence[float]) -> Optional[float]:
+    """
+    Locates the knee of a monotone curve: the x whose point lies farthest from the
+    straight line joining the first and last points, after scaling both axes to [0, 1].
+
+    Returns:
+        The x value at the knee, or None with fewer than three points.
+    """
+    if len(xs) < 3:
+        return None
+    points = sorted(zip(xs, ys))
+    x0, y0 = points[0]
+    x1, y1 = points[-1]
+    x_span = (x1 - x0) or 1
+    y_span = (max(y for _, y in points) - min(y for _, y in points)) or 1
+    # Distance to the chord, up to a constant factor
+    dx, dy = (x1 - x0) / x_span, (y1 - y0) / y_span
+    best_x, best_distance = None, -1.0
+    for x, y in points:
+        nx, ny = (x - x0) / x_span, (y - y0) / y_span
+        distance = abs(dx * ny - dy * nx)
+        if distance > best_distance:
+            best_x, best_distance = x, distance
+    return best_x
+
+class ParameterSweep:
+    """
+    Runs scheduler parameter grids against workloads and collects a tidy result table.
+
+    Every (workload, scheduler configuration, context switch time, core count)
+    combination becomes one row. Results are cached on the workload's fingerprint
+    and the configuration, so re-running a sweep with an extended grid only
+    simulates the new points; with a cache_path the cache persists across runs.
+    """
+
+    def __init__(self, workers: Optional[int] = None, cache_path: Optional[str] = None):
+        """
+        Args:
+            workers: Worker processes for uncached runs (see AlgorithmComparator).
+                     0 uses one worker per CPU.
+            cache_path: Optional JSON-lines file to load and extend with results.
+        """
+        self.workers = (os.cpu_count() or 1) if workers == 0 else workers
+        self.cache_path = cache_path
+        self.cache: Dict[str, Dict[str, Any]] = {}
+        self.rows: List[Dict[str, Any]] = []
+        self.cache_hits = 0
+        self.cache_misses = 0
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path) as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self.cache[entry["key"]] = entry["metrics"]
+            logger.info(f"Loaded {len(self.cache)} cached results from {cache_path}")
+
+    @staticmethod
+    def config_key(
+        workload_hash: str,
+        scheduler_cls: Type[Scheduler],
+        params: Mapping[str, Any],
+        context_switch_time: int,
+        num_cores: int
+    ) -> str:
+        """Cache key for one simulation: workload fingerprint plus the full configuration."""
+        config = json.dumps(
+            [scheduler_cls.__qualname__, params, context_switch_time, num_cores],
+            sort_keys=True, default=list
+        )
+        return f"{workload_hash}|{config}"
+
+    def run(
+        self,
+        workloads: Mapping[str, Workload],
+        scheduler_grid: SchedulerGrid,
+        context_switch_times: Sequence[int] = (0,),
+        core_counts: Sequence[int] = (1,)
+    ) -> List[Dict[str, Any]]:
+        """
+        Runs the full grid.
+
+        Args:
+            workloads: Named workloads, as process lists or ProcessTables.
+            scheduler_grid: Label -> (scheduler class, parameter grid), e.g.
+                            {"RR": (RoundRobinScheduler, {"quantum": range(1, 65)})}.
+            context_switch_times: Context switch overheads to try.
+            core_counts: Core counts to try.
+
+        Returns:
+            One row per combination with workload, scheduler, each parameter,
+            context_switch_time, num_cores and every metric, in grid order.
+        """
+        tables = {name: as_table(workload) for name, workload in workloads.items()}
+        hashes = {name: table.fingerprint() for name, table in tables.items()}
+
+        combos = []
+        for workload_name in tables:
+            for label, (scheduler_cls, param_grid) in scheduler_grid.items():
+                for params in expand_grid(param_grid):
+                    for cs in context_switch_times:
+                        for cores in core_counts:
+                            key = self.config_key(hashes[workload_name], scheduler_cls, params, cs, cores)
+                            combos.append((key, workload_name, label, scheduler_cls, params, cs, cores))
+
+        pending = {}
+        for key, workload_name, _, scheduler_cls, params, cs, cores in combos:
+            if key not in self.cache and key not in pending:
+                pending[key] = (workload_name, scheduler_cls(**params), cs, cores)
+        self.cache_misses = len(pending)
+        self.cache_hits = len(combos) - len(pending)
+        logger.info(f"Sweep: {len(combos)} points, {self.cache_hits} cached, {len(pending)} to simulate.")
+
+        outcomes = run_jobs(list(pending.values()), tables, self.workers)
+        new_entries = dict(zip(pending, outcomes))
+        self.cache.update(new_entries)
+        if self.cache_path and new_entries:
+            with open(self.cache_path, "a") as f:
+                for key, metrics in new_entries.items():
+                    f.write(json.dumps({"key": key, "metrics": metrics}) + "\n")
+
+        self.rows = []
+        for key, workload_name, label, _, params, cs, cores in combos:
+            row: Dict[str, Any] = {"workload": workload_name, "scheduler": label}
+            row.update(params)
+            row["context_switch_time"] = cs
+            row["num_cores"] = cores
+            row.update(self.cache[key])
+            self.rows.append(row)
+        return self.rows
+
+    def _fieldnames(self) -> List[str]:
+        """Union of row columns in first-seen order (parameters differ per scheduler)."""
+        return list(dict.fromkeys(name for row in self.rows for name in row))
+
+    def to_csv(self, filepath: str) -> None:
+        """Writes the result rows to a CSV file (parameters a row lacks are left empty)."""
+        if not self.rows:
+            logger.error("No sweep results to export.")
+            return
+        with open(filepath, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=self._fieldnames())
+            writer.writeheader()
+            for row in self.rows:
+                writer.writerow({k: json.dumps(v) if isinstance(v, (list, tuple)) else v for k, v in row.items()})
+        logger.info(f"Sweep results exported to {filepath}")
+
+    def to_parquet(self, filepath: str) -> None:
+        """Writes the result rows to a Parquet file. Requires pandas with pyarrow or fastparquet."""
+        if not self.rows:
+            logger.error("No sweep results to export.")
+            return
+        try:
+            import pandas as pd
+        except ImportError:
+            logger.error("Parquet export needs pandas (and pyarrow or fastparquet); use to_csv() instead.")
+            return
+        frame = pd.DataFrame(self.rows, columns=self._fieldnames())
+        # List-valued parameters (e.g. MLFQ quanta) are stored as JSON text
+        for column in frame.columns:
+            if frame[column].map(lambda v: isinstance(v, (list, tuple))).any():
+                frame[column] = frame[column].map(lambda v: json.dumps(v) if isinstance(v, (list, tuple)) else v)
+        frame.to_parquet(filepath)
+        logger.info(f"Sweep results exported to {filepath}")
+
+    def knee(self, metric: str, parameter: str, **filters: Any) -> Optional[float]:
+        """
+        Knee of metric as a function of one parameter, over the rows matching filters
+        (e.g. sweep.knee("avg_response_time", "quantum", scheduler="RR", context_switch_time=1)).
+        """
+        rows = [r for r in self.rows if all(r.get(k) == v for k, v in filters.items()) and parameter in r]
+        return find_knee([r[parameter] for r in rows], [r[metric] for r in rows])
@@ -8,8 +8,17 @@ class SystemClock:
     Tracks global simulation time and CPU states (busy vs. idle).
     """
 
-    def __init__(self):
-        """Initializes the clock with zeroed counters."""
+    def __init__(self, num_cores: int = 1):
+        """
+        Initializes the clock with zeroed counters.
+
+        Args:
+            num_cores: Number of CPU cores the busy/idle counters are summed over.
+                       With several cores, busy and idle time are measured in core-units.
+        """
+        if num_cores < 1:
+            raise ValueError("A system clock needs at least one core.")
+        self.num_cores = num_cores
         self.global_time: int = 0
         self.busy_time: int = 0
         self.idle_time: int = 0
@@ -31,6 +40,51 @@ class SystemClock:
         
         logger.debug(f"Clock Tick: {self.global_time} (Busy: {is_busy})")
 
+    def advance(self, units: int, is_busy: bool = True) -> None:
+        """
+        Advances the simulation clock by several time units at once.
+
+        Equivalent to calling tick() `units` times with the same busy flag,
+        but runs in constant time regardless of the span being skipped.
+
+        Args:
+            units: Number of time units to advance (must be non-negative).
+            is_busy: Boolean indicating if the CPU was busy (True) or idle (False)
+                     for the whole span.
+        """
+        if units < 0:
+            raise ValueError(f"Cannot advance clock by a negative amount ({units}).")
+        if units == 0:
+            return
+
+        self.global_time += units
+        if is_busy:
+            self.busy_time += units
+        else:
+            self.idle_time += units
+
+        # Lazy formatting: advance() is called once per segment on large runs
+        logger.debug("Clock Advance: +%d -> %d (Busy: %s)", units, self.global_time, is_busy)
+
+    def advance_cores(self, units: int, busy_units: int) -> None:
+        """
+        Advances the wall-clock time of a multi-core system.
+
+        Args:
+            units: Wall-clock time units to advance.
+            busy_units: Core-units spent busy during the span (0 to units * num_cores);
+                        the rest is counted as idle.
+        """
+        capacity = units * self.num_cores
+        if units < 0 or not 0 <= busy_units <= capacity:
+            raise ValueError(f"Invalid multi-core advance: {units} units, {busy_units} busy core-units.")
+
+        self.global_time += units
+        self.busy_time += busy_units
+        self.idle_time += capacity - busy_units
+
+        logger.debug("Clock Advance: +%d -> %d (Busy core-units: %d)", units, self.global_time, busy_units)
+
     def reset(self) -> None:
         """Resets all clock counters to initial state."""
         self.global_time = 0
@@ -55,11 +109,11 @@ class SystemClock:
         Calculates the CPU utilization as a percentage.
         
         Returns:
-            The percentage of time the CPU was busy (0.0 to 100.0).
+            The percentage of time the CPU was busy (0.0 to 100.0), averaged over all cores.
         """
         if self.global_time == 0:
             return 0.0
-        return round((self.busy_time / self.global_time) * 100, 2)
+        return round((self.busy_time / (self.global_time * self.num_cores)) * 100, 2)
 
     def __str__(self) -> str:
         """Returns a string representation of the clock state."""
@@ -0,0 +1,185 @@
+import logging
+import mmap
+import struct
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+from os_simulator.process import Process
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; TimelineReader.columns() falls back to lists
+    np = None
+
+logger = logging.getLogger("Timeline-File")
+
+# Binary timeline: an 8-byte magic followed by 32-byte little-endian records of
+# segment kind (int8), 7 padding bytes, pid, start and end (int64, pid 0 for overhead).
+# Version 1 files (OSTLINE1) stored pid as int32 and are no longer readable.
+TIMELINE_MAGIC = b"OSTLINE2"
+_LEGACY_MAGIC = b"OSTLINE1"
+_RECORD = struct.Struct("<b7xqqq")
+
+# Segment kind codes replacing the timeline's string labels
+SEGMENT_PROCESS = 0
+SEGMENT_CS = 1
+SEGMENT_MIG = 2
+_KINDS = {"CS": SEGMENT_CS, "MIG": SEGMENT_MIG}
+_LABELS = {code: label for label, code in _KINDS.items()}
+
+if np is not None:
+    TIMELINE_DTYPE = np.dtype({
+        "names": ["kind", "pid", "start", "end"],
+        "formats": ["i1", "<i8", "<i8", "<i8"],
+        "offsets": [0, 8, 16, 24],
+        "itemsize": _RECORD.size
+    })
+
+def _pack(label: Any, start: int, end: int) -> bytes:
+    if label.__class__ is int:
+        return _RECORD.pack(SEGMENT_PROCESS, label, start, end)
+    try:
+        return _RECORD.pack(_KINDS[label], 0, start, end)
+    except KeyError:
+        raise ValueError(f"Unsupported timeline segment label: {label!r}") from None
+
+def _unpack(kind: int, pid: int, start: int, end: int) -> Tuple[Any, int, int]:
+    return (pid if kind == SEGMENT_PROCESS else _LABELS[kind], start, end)
+
+class TimelineWriter:
+    """
+    Metrics sink that appends every segment to a binary timeline file as the
+    kernel produces it, so the timeline never has to be held in memory:
+
+        with TimelineWriter("run.tl") as writer:
+            kernel = Kernel(metrics_sink=writer)
+            kernel.simulate(process_stream=..., keep_timeline=False)
+
+    Combine it with StreamingMetrics through CompositeSink.
+    """
+
+    def __init__(self, path: str, buffer_segments: int = 4096):
+        """
+        Args:
+            path: File to create (overwritten if it exists).
+            buffer_segments: Segments buffered in memory between writes.
+        """
+        self.path = path
+        self.segments = 0
+        self._flush_size = buffer_segments * _RECORD.size
+        self._buffer = bytearray()
+        self._file = open(path, "wb")
+        self._file.write(TIMELINE_MAGIC)
+
+    def record_segment(self, label: Any, start: int, end: int) -> None:
+        self._buffer += _pack(label, start, end)
+        self.segments += 1
+        if len(self._buffer) >= self._flush_size:
+            self.flush()
+
+    def record_completion(self, process: Process) -> None:
+        pass
+
+    def flush(self) -> None:
+        """Writes buffered segments to the file."""
+        self._file.write(self._buffer)
+        self._buffer.clear()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+            logger.info(f"Wrote {self.segments} timeline segments to {self.path}")
+
+    def __enter__(self) -> "TimelineWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+def write_timeline(path: str, timeline: Sequence[Tuple[Any, int, int]]) -> int:
+    """
+    Converts a timeline in tuple form (e.g. Kernel.execution_order) to a binary file.
+
+    Returns:
+        The number of segments written.
+    """
+    with TimelineWriter(path) as writer:
+        for label, start, end in timeline:
+            writer.record_segment(label, start, end)
+    return writer.segments
+
+class TimelineReader:
+    """
+    Memory-mapped view of a binary timeline file. Segments are decoded on access,
+    so files much larger than RAM can be scanned; columns() loads them as arrays.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is not a binary timeline.") from None
+        magic = self._data[:len(TIMELINE_MAGIC)]
+        if magic != TIMELINE_MAGIC:
+            self.close()
+            if magic == _LEGACY_MAGIC:
+                raise ValueError(f"{path} uses the old 32-bit pid timeline format; write it again.")
+            raise ValueError(f"{path} is not a binary timeline.")
+        self._count = (len(self._data) - len(TIMELINE_MAGIC)) // _RECORD.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Tuple[Any, int, int]:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Timeline index out of range")
+        return _unpack(*_RECORD.unpack_from(self._data, len(TIMELINE_MAGIC) + index * _RECORD.size))
+
+    def _records(self) -> Iterator[Tuple[int, int, int, int]]:
+        unpack = _RECORD.unpack_from
+        data = self._data
+        for offset in range(len(TIMELINE_MAGIC), len(TIMELINE_MAGIC) + self._count * _RECORD.size, _RECORD.size):
+            yield unpack(data, offset)
+
+    def __iter__(self) -> Iterator[Tuple[Any, int, int]]:
+        for record in self._records():
+            yield _unpack(*record)
+
+    def to_list(self) -> List[Tuple[Any, int, int]]:
+        """Converts the file back to the kernel's (pid_or_label, start, end) tuple form."""
+        return list(self)
+
+    def columns(self) -> Dict[str, Any]:
+        """
+        Returns the kind, pid, start and end columns. With NumPy they are copied out of
+        one structured array in a few vectorized operations; otherwise they are lists.
+        """
+        if np is not None:
+            records = np.frombuffer(self._data, dtype=TIMELINE_DTYPE, count=self._count, offset=len(TIMELINE_MAGIC))
+            return {name: records[name].copy() for name in TIMELINE_DTYPE.names}
+        columns: Dict[str, Any] = {"kind": [], "pid": [], "start": [], "end": []}
+        for kind, pid, start, end in self._records():
+            columns["kind"].append(kind)
+            columns["pid"].append(pid)
+            columns["start"].append(start)
+            columns["end"].append(end)
+        return columns
+
+    def close(self) -> None:
+        self._data.close()
+        self._file.close()
+
+    def __enter__(self) -> "TimelineReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+def read_timeline(path: str) -> List[Tuple[Any, int, int]]:
+    """Loads a binary timeline file in tuple form."""
+    with TimelineReader(path) as reader:
+        return reader.to_list()
@@ -0,0 +1,188 @@
+import csv
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Iterable, Iterator, Optional
+from os_simulator.process import Process
+from os_simulator.process_table import ProcessTable
+
+logger = logging.getLogger("Trace-Loader")
+
+# Binary trace: an 8-byte magic followed by fixed-width little-endian records of
+# pid, arrival_time, burst_time, priority, memory_required, deadline, period,
+# with -1 for no deadline/period. Names default to "P<pid>"; I/O phases are not stored.
+BINARY_MAGIC = b"OSTRACE1"
+_RECORD = struct.Struct("<7q")
+_FIELDS = ("pid", "arrival_time", "burst_time", "priority", "memory_required", "deadline", "period")
+_NONE = -1
+
+_EXTENSIONS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".bin": "binary", ".trace": "binary"}
+
+def trace_format(path: str, format: Optional[str] = None) -> str:
+    """Returns format, or infers "csv", "jsonl" or "binary" from the file extension."""
+    if format is None:
+        format = _EXTENSIONS.get(os.path.splitext(path)[1].lower())
+        if format is None:
+            raise ValueError(f"Cannot infer the trace format of {path}; pass format='csv', 'jsonl' or 'binary'.")
+    if format not in ("csv", "jsonl", "binary"):
+        raise ValueError(f"Unknown trace format: {format}")
+    return format
+
+def _optional_int(value: Any) -> Optional[int]:
+    return None if value is None or value == "" else int(value)
+
+def process_from_record(record: Dict[str, Any], default_pid: int) -> Process:
+    """Builds a Process from a CSV row or JSON object keyed by Process field names."""
+    try:
+        pid = _optional_int(record.get("pid"))
+        pid = default_pid if pid is None else pid
+        io_bursts = record.get("io_bursts") or None
+        if isinstance(io_bursts, str):
+            io_bursts = json.loads(io_bursts)
+        return Process(
+            pid,
+            record.get("name") or f"P{pid}",
+            int(record["arrival_time"]),
+            int(record["burst_time"]),
+            priority=_optional_int(record.get("priority")) or 0,
+            memory_required=_optional_int(record.get("memory_required")) or 0,
+            io_bursts=[tuple(phase) for phase in io_bursts] if io_bursts else None,
+            deadline=_optional_int(record.get("deadline")),
+            period=_optional_int(record.get("period"))
+        )
+    except KeyError as e:
+        raise ValueError(f"Trace record {default_pid} is missing the {e.args[0]} field.") from None
+
+def _read_csv(path: str) -> Iterator[Process]:
+    with open(path, newline="") as f:
+        for i, row in enumerate(csv.DictReader(f), start=1):
+            yield process_from_record(row, i)
+
+def _read_jsonl(path: str) -> Iterator[Process]:
+    with open(path) as f:
+        i = 0
+        for line in f:
+            if line.strip():
+                i += 1
+                yield process_from_record(json.loads(line), i)
+
+def _check_binary_size(path: str, size: int) -> None:
+    """Rejects files too short for the magic and files ending in a partial record."""
+    if size < len(BINARY_MAGIC):
+        raise ValueError(f"{path} is not a binary process trace ({size} bytes).")
+    partial = (size - len(BINARY_MAGIC)) % _RECORD.size
+    if partial:
+        raise ValueError(f"{path} is truncated: its last record has {partial} of {_RECORD.size} bytes.")
+
+def _read_binary(path: str) -> Iterator[Process]:
+    with open(path, "rb") as f:
+        _check_binary_size(path, os.fstat(f.fileno()).st_size)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:len(BINARY_MAGIC)] != BINARY_MAGIC:
+                raise ValueError(f"{path} is not a binary process trace.")
+            unpack = _RECORD.unpack_from
+            # The mapping is paged in by the OS as records are read, never loaded whole
+            for offset in range(len(BINARY_MAGIC), len(data), _RECORD.size):
+                pid, arrival, burst, priority, memory, deadline, period = unpack(data, offset)
+                yield Process(
+                    pid, f"P{pid}", arrival, burst, priority=priority, memory_required=memory,
+                    deadline=None if deadline == _NONE else deadline,
+                    period=None if period == _NONE else period
+                )
+
+_READERS = {"csv": _read_csv, "jsonl": _read_jsonl, "binary": _read_binary}
+
+def read_trace(path: str, format: Optional[str] = None, check_order: bool = True) -> Iterator[Process]:
+    """
+    Streams processes from a trace file, one record at a time.
+
+    CSV and JSONL records use Process field names (arrival_time and burst_time are
+    required; pid defaults to the record number and name to "P<pid>"). In CSV,
+    io_bursts is a JSON list such as [[2, 3]]. Binary traces are memory-mapped.
+
+    Args:
+        path: Trace file.
+        format: "csv", "jsonl" or "binary"; inferred from the extension when omitted.
+        check_order: Raise ValueError if arrival times decrease, since
+                     Kernel.simulate(process_stream=...) consumes processes in arrival order.
+    """
+    reader = _READERS[trace_format(path, format)]
+    if not check_order:
+        return reader(path)
+    return _in_arrival_order(reader(path), path)
+
+def _in_arrival_order(processes: Iterable[Process], path: str) -> Iterator[Process]:
+    last = None
+    for p in processes:
+        if last is not None and p.arrival_time < last:
+            raise ValueError(f"{path}: process {p.pid} arrives at {p.arrival_time}, before the previous arrival at {last}.")
+        last = p.arrival_time
+        yield p
+
+def load_trace_table(path: str, format: Optional[str] = None) -> ProcessTable:
+    """
+    Loads a whole trace into a ProcessTable. Binary traces are read column by column
+    without creating Process objects.
+    """
+    if trace_format(path, format) != "binary":
+        return ProcessTable.from_processes(read_trace(path, format, check_order=False))
+
+    with open(path, "rb") as f:
+        _check_binary_size(path, os.fstat(f.fileno()).st_size)
+        if f.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+            raise ValueError(f"{path} is not a binary process trace.")
+        values = array("q")
+        values.frombytes(f.read())
+    if sys.byteorder != "little":
+        values.byteswap()
+    width = len(_FIELDS)
+    columns = {name: values[i::width] for i, name in enumerate(_FIELDS)}
+    return ProcessTable.from_columns(**columns)
+
+def write_trace(path: str, processes: Iterable[Any], format: Optional[str] = None) -> int:
+    """
+    Writes processes (Process objects or ProcessTable rows) to a trace file,
+    streaming from the iterable. Binary traces drop names and I/O phases.
+
+    Returns:
+        The number of processes written.
+    """
+    format = trace_format(path, format)
+    count = 0
+    if format == "binary":
+        with open(path, "wb") as f:
+            f.write(BINARY_MAGIC)
+            for p in processes:
+                f.write(_RECORD.pack(
+                    p.pid, p.arrival_time, p.burst_time, p.priority, p.memory_required,
+                    _NONE if p.deadline is None else p.deadline,
+                    _NONE if p.period is None else p.period
+                ))
+                count += 1
+    elif format == "csv":
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("pid", "name") + _FIELDS[1:] + ("io_bursts",))
+            for p in processes:
+                writer.writerow((
+                    p.pid, p.name, p.arrival_time, p.burst_time, p.priority, p.memory_required,
+                    "" if p.deadline is None else p.deadline,
+                    "" if p.period is None else p.period,
+                    json.dumps([list(phase) for phase in p.io_bursts]) if p.io_bursts else ""
+                ))
+                count += 1
+    else:
+        with open(path, "w") as f:
+            for p in processes:
+                record = {"pid": p.pid, "name": p.name}
+                record.update({name: getattr(p, name) for name in _FIELDS[1:]})
+                if p.io_bursts:
+                    record["io_bursts"] = [list(phase) for phase in p.io_bursts]
+                f.write(json.dumps(record) + "\n")
+                count += 1
+    logger.info(f"Wrote {count} processes to {path} ({format}).")
+    return count
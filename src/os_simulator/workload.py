@@ -0,0 +1,358 @@
+import bisect
+import itertools
+import math
+import random
+from array import array
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+from os_simulator.process import Process
+from os_simulator.process_table import ProcessTable
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python backend generates the same kinds of workload
+    np = None
+
+class _PythonBackend:
+    """Sampling primitives on plain lists, driven by random.Random."""
+
+    name = "python"
+    math = math
+
+    def __init__(self, seed: Optional[int]):
+        self.rng = random.Random(seed)
+
+    def exponential(self, mean: float, n: int) -> List[float]:
+        draw, rate = self.rng.expovariate, 1 / mean
+        return [draw(rate) for _ in range(n)]
+
+    def lognormal(self, mu: float, sigma: float, n: int) -> List[float]:
+        draw = self.rng.lognormvariate
+        return [draw(mu, sigma) for _ in range(n)]
+
+    def pareto(self, alpha: float, minimum: float, n: int) -> List[float]:
+        draw = self.rng.paretovariate
+        return [minimum * draw(alpha) for _ in range(n)]
+
+    def uniform(self, low: float, high: float, n: int) -> List[float]:
+        draw = self.rng.uniform
+        return [draw(low, high) for _ in range(n)]
+
+    def integers(self, low: int, high: int, n: int) -> List[int]:
+        draw = self.rng.randint
+        return [draw(low, high) for _ in range(n)]
+
+    def full(self, value: float, n: int) -> List[float]:
+        return [value] * n
+
+    def mix(self, first: List[float], second: List[float], second_fraction: float) -> List[float]:
+        draw = self.rng.random
+        return [b if draw() < second_fraction else a for a, b in zip(first, second)]
+
+    def cumsum(self, gaps: List[float], start: float) -> List[float]:
+        return list(itertools.accumulate(gaps, initial=start))[1:]
+
+    def below(self, ascending: List[float], limit: float) -> List[float]:
+        return ascending[:bisect.bisect_left(ascending, limit)]
+
+    def thin(self, values: List[float], keep_probability: Callable[[Any], Any]) -> List[float]:
+        draw = self.rng.random
+        return [v for v in values if draw() < keep_probability(v)]
+
+    def concat(self, parts: List[List[float]]) -> List[float]:
+        return [v for part in parts for v in part]
+
+    def to_column(self, values: List[float], minimum: int = 0, floor: bool = False) -> array:
+        if floor:
+            return array("q", (max(minimum, int(v)) for v in values))
+        return array("q", (max(minimum, int(v + 0.5)) for v in values))
+
+class _NumpyBackend:
+    """The same primitives, vectorized on NumPy arrays."""
+
+    name = "numpy"
+    math = np
+
+    def __init__(self, seed: Optional[int]):
+        self.rng = np.random.default_rng(seed)
+
+    def exponential(self, mean: float, n: int):
+        return self.rng.exponential(mean, n)
+
+    def lognormal(self, mu: float, sigma: float, n: int):
+        return self.rng.lognormal(mu, sigma, n)
+
+    def pareto(self, alpha: float, minimum: float, n: int):
+        # NumPy draws the Lomax (shifted) form
+        return minimum * (self.rng.pareto(alpha, n) + 1)
+
+    def uniform(self, low: float, high: float, n: int):
+        return self.rng.uniform(low, high, n)
+
+    def integers(self, low: int, high: int, n: int):
+        return self.rng.integers(low, high, n, endpoint=True)
+
+    def full(self, value: float, n: int):
+        return np.full(n, value, dtype=float)
+
+    def mix(self, first, second, second_fraction: float):
+        return np.where(self.rng.random(len(first)) < second_fraction, second, first)
+
+    def cumsum(self, gaps, start: float):
+        return np.cumsum(gaps) + start
+
+    def below(self, ascending, limit: float):
+        return ascending[:np.searchsorted(ascending, limit)]
+
+    def thin(self, values, keep_probability: Callable[[Any], Any]):
+        return values[self.rng.random(len(values)) < keep_probability(values)]
+
+    def concat(self, parts):
+        return np.concatenate(parts) if parts else np.empty(0)
+
+    def to_column(self, values, minimum: int = 0, floor: bool = False) -> array:
+        ints = np.floor(values) if floor else np.floor(np.asarray(values) + 0.5)
+        column = array("q")
+        column.frombytes(np.maximum(ints, minimum).astype(np.int64).tobytes())
+        return column
+
+Backend = Union[_PythonBackend, _NumpyBackend]
+
+# --- Value distributions (burst time, priority, memory) ---
+
+class Constant(NamedTuple):
+    """Every process gets the same value."""
+    value: float
+
+    def sample(self, backend: Backend, n: int):
+        return backend.full(self.value, n)
+
+class Uniform(NamedTuple):
+    """Continuous uniform values in [low, high]."""
+    low: float
+    high: float
+
+    def sample(self, backend: Backend, n: int):
+        return backend.uniform(self.low, self.high, n)
+
+class UniformInt(NamedTuple):
+    """Integers drawn uniformly from low to high inclusive (e.g. priority levels)."""
+    low: int
+    high: int
+
+    def sample(self, backend: Backend, n: int):
+        return backend.integers(self.low, self.high, n)
+
+class Exponential(NamedTuple):
+    """Exponentially distributed values with the given mean."""
+    mean: float
+
+    def sample(self, backend: Backend, n: int):
+        return backend.exponential(self.mean, n)
+
+class Pareto(NamedTuple):
+    """
+    Heavy-tailed Pareto values of at least minimum. The mean is
+    alpha * minimum / (alpha - 1) for alpha > 1; the variance is infinite for alpha <= 2.
+    """
+    alpha: float
+    minimum: float = 1.0
+
+    def sample(self, backend: Backend, n: int):
+        return backend.pareto(self.alpha, self.minimum, n)
+
+class LogNormal(NamedTuple):
+    """Log-normal values: exp of a normal with mean mu and standard deviation sigma."""
+    mu: float
+    sigma: float
+
+    def sample(self, backend: Backend, n: int):
+        return backend.lognormal(self.mu, self.sigma, n)
+
+class Bimodal(NamedTuple):
+    """
+    Mixture of two distributions, e.g. many short interactive bursts and a few
+    long batch jobs: Bimodal(Exponential(2), Exponential(200), long_fraction=0.05).
+    """
+    short: Any
+    long: Any
+    long_fraction: float
+
+    def sample(self, backend: Backend, n: int):
+        return backend.mix(self.short.sample(backend, n), self.long.sample(backend, n), self.long_fraction)
+
+Distribution = Union[Constant, Uniform, UniformInt, Exponential, Pareto, LogNormal, Bimodal]
+
+# --- Arrival processes ---
+# sample(backend, n, state) returns n ascending arrival times and the state to
+# continue from, so a workload can be generated in chunks.
+
+class Poisson(NamedTuple):
+    """Poisson arrivals: exponential inter-arrival gaps at rate arrivals per time unit."""
+    rate: float
+
+    def sample(self, backend: Backend, n: int, state: Optional[float]) -> Tuple[Any, float]:
+        start = state or 0.0
+        times = backend.cumsum(backend.exponential(1 / self.rate, n), start)
+        return times, (float(times[-1]) if n else start)
+
+class MMPP(NamedTuple):
+    """
+    Bursty arrivals from a Markov-modulated Poisson process. The source cycles
+    through phases; phase i emits Poisson arrivals at rates[i] and lasts an
+    exponentially distributed time with mean mean_dwell[i]. E.g. MMPP((5.0, 0.1), (20, 200))
+    alternates short bursts with long quiet periods.
+    """
+    rates: Tuple[float, ...]
+    mean_dwell: Tuple[float, ...]
+
+    def sample(self, backend: Backend, n: int, state: Optional[Tuple[int, float, float]]) -> Tuple[Any, Tuple[int, float, float]]:
+        if not self.rates or len(self.rates) != len(self.mean_dwell):
+            raise ValueError("MMPP needs one mean dwell time per rate.")
+        if min(self.rates) < 0 or max(self.rates) <= 0:
+            raise ValueError("MMPP rates must be non-negative with at least one positive.")
+        if min(self.mean_dwell) <= 0:
+            raise ValueError("MMPP mean dwell times must be positive.")
+        if state is None:
+            state = (0, backend.exponential(self.mean_dwell[0], 1)[0], 0.0)
+        phase, phase_end, t = state
+        parts = []
+        collected = 0
+        while collected < n:
+            rate = self.rates[phase]
+            if rate > 0:
+                need = n - collected
+                expected = int(rate * (phase_end - t))
+                k = min(need, expected + expected // 8 + 16)
+                times = backend.below(backend.cumsum(backend.exponential(1 / rate, k), t), phase_end)
+                parts.append(times)
+                collected += len(times)
+                if len(times) == k:
+                    # The phase may hold more arrivals; gaps are memoryless, so resume from the last one
+                    t = float(times[-1])
+                    continue
+            t = phase_end
+            phase = (phase + 1) % len(self.rates)
+            phase_end = t + backend.exponential(self.mean_dwell[phase], 1)[0]
+        return backend.concat(parts), (phase, phase_end, t)
+
+class Diurnal(NamedTuple):
+    """
+    Non-homogeneous Poisson arrivals whose rate follows a daily cycle:
+    base_rate * (1 + amplitude * sin(2 * pi * t / period)), with amplitude in [0, 1].
+    Generated by thinning a Poisson process at the peak rate.
+    """
+    base_rate: float
+    amplitude: float = 0.5
+    period: float = 1440.0
+
+    def sample(self, backend: Backend, n: int, state: Optional[float]) -> Tuple[Any, float]:
+        if not 0 <= self.amplitude <= 1:
+            raise ValueError("Diurnal amplitude must be between 0 and 1.")
+        peak = self.base_rate * (1 + self.amplitude)
+        m = backend.math
+        omega = 2 * m.pi / self.period
+
+        def keep_probability(t):
+            return (1 + self.amplitude * m.sin(omega * t)) / (1 + self.amplitude)
+
+        t = state or 0.0
+        parts = []
+        collected = 0
+        while collected < n:
+            need = n - collected
+            candidates = backend.cumsum(backend.exponential(1 / peak, int(need * (1 + self.amplitude) * 1.1) + 16), t)
+            kept = backend.thin(candidates, keep_probability)[:need]
+            parts.append(kept)
+            collected += len(kept)
+            t = float(kept[-1]) if len(kept) == need else float(candidates[-1])
+        return backend.concat(parts), t
+
+ArrivalProcess = Union[Poisson, MMPP, Diurnal]
+
+class WorkloadGenerator:
+    """
+    Generates large synthetic process sets from an arrival process and
+    distributions for burst time, priority and memory.
+
+    Output is reproducible: the same seed, settings, size and chunk size always give the
+    same workload. NumPy is used when installed; the pure-Python backend produces
+    workloads with the same distributions (but different values for a given seed).
+    Times are whole units: arrivals are rounded down, everything else to the nearest
+    integer, and bursts are at least 1. The defaults (Poisson arrivals at 0.08 per
+    unit, exponential bursts of mean 10) offer a single CPU a load of 0.8, so the
+    queue stays stable however many processes are generated.
+    """
+
+    def __init__(
+        self,
+        arrivals: ArrivalProcess = Poisson(0.08),
+        burst: Distribution = Exponential(10),
+        priority: Distribution = Constant(0),
+        memory: Distribution = Constant(0),
+        seed: Optional[int] = None,
+        backend: Optional[str] = None
+    ):
+        """
+        Args:
+            arrivals: Arrival process (Poisson, MMPP or Diurnal).
+            burst: Distribution of CPU burst times.
+            priority: Distribution of priorities (e.g. UniformInt(0, 9)).
+            memory: Distribution of memory requirements.
+            seed: Seed for reproducible workloads.
+            backend: "numpy", "python", or None to use NumPy when it is installed.
+        """
+        if backend not in (None, "numpy", "python"):
+            raise ValueError(f"Unknown workload backend: {backend}")
+        if backend == "numpy" and np is None:
+            raise ValueError("NumPy is not installed.")
+        self.arrivals = arrivals
+        self.burst = burst
+        self.priority = priority
+        self.memory = memory
+        self.seed = seed
+        self.backend = backend or ("numpy" if np is not None else "python")
+
+    def _chunks(self, n: int, chunk_size: int, first_pid: int) -> Iterator[Dict[str, array]]:
+        """Yields the workload as column chunks of at most chunk_size processes."""
+        if n < 0 or chunk_size <= 0:
+            raise ValueError("n must be non-negative and chunk_size positive.")
+        backend = _NumpyBackend(self.seed) if self.backend == "numpy" else _PythonBackend(self.seed)
+        state = None
+        pid = first_pid
+        for offset in range(0, n, chunk_size):
+            size = min(chunk_size, n - offset)
+            times, state = self.arrivals.sample(backend, size, state)
+            yield {
+                "pid": array("q", range(pid, pid + size)),
+                "arrival_time": backend.to_column(times, floor=True),
+                "burst_time": backend.to_column(self.burst.sample(backend, size), minimum=1),
+                "priority": backend.to_column(self.priority.sample(backend, size)),
+                "memory_required": backend.to_column(self.memory.sample(backend, size)),
+            }
+            pid += size
+
+    def generate(self, n: int, chunk_size: int = 1 << 16, first_pid: int = 1) -> ProcessTable:
+        """
+        Generates n processes in arrival order.
+
+        Returns:
+            A ProcessTable (use to_processes() for Process objects).
+        """
+        columns: Dict[str, array] = {}
+        for chunk in self._chunks(n, chunk_size, first_pid):
+            for name, column in chunk.items():
+                columns.setdefault(name, array("q")).extend(column)
+        if not columns:
+            return ProcessTable()
+        return ProcessTable.from_columns(**columns)
+
+    def stream(self, n: int, chunk_size: int = 1 << 16, first_pid: int = 1) -> Iterator[Process]:
+        """
+        Yields the same processes as generate() one at a time, holding only one chunk
+        in memory. Suitable for Kernel.simulate(process_stream=...).
+        """
+        for chunk in self._chunks(n, chunk_size, first_pid):
+            for pid, arrival, burst, priority, memory in zip(
+                chunk["pid"], chunk["arrival_time"], chunk["burst_time"], chunk["priority"], chunk["memory_required"]
+            ):
+                yield Process(pid, f"P{pid}", arrival, burst, priority=priority, memory_required=memory)
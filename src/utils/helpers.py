@@ -7,9 +7,10 @@ logger = logging.getLogger("Helpers")
 def deep_copy_process_list(process_list: List[Any]) -> List[Any]:
     """
     Creates a deep copy of a list of Process objects to avoid state leakage
-    between different simulation runs.
+    between different simulation runs. Processes are copied with Process.clone();
+    other objects fall back to copy.deepcopy.
     """
-    return copy.deepcopy(process_list)
+    return [p.clone() if hasattr(p, "clone") else copy.deepcopy(p) for p in process_list]
 
 def format_timeline(timeline: List[tuple]) -> str:
     """
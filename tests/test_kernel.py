@@ -0,0 +1,538 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from os_simulator.kernel import Kernel
+from os_simulator.process import Process, ProcessState
+from os_simulator.system_clock import SystemClock
+from os_simulator.process_table import ProcessTable
+from os_simulator.event_engine import EventEngine
+from os_simulator.timeline_file import TimelineReader, TimelineWriter, read_timeline, write_timeline
+from os_simulator.streaming_metrics import CompositeSink, StreamingMetrics
+from os_simulator.trace import read_trace, write_trace, load_trace_table
+from os_simulator.workload import WorkloadGenerator, Poisson, MMPP, Diurnal, Bimodal, Exponential, Pareto, UniformInt
+from os_simulator.scheduling.fcfs import FCFSScheduler
+from os_simulator.scheduling.round_robin import RoundRobinScheduler
+from os_simulator.scheduling.sjf import SJFScheduler
+from os_simulator.scheduling.mlfq import MLFQScheduler
+from os_simulator.scheduling.cfs import CFSScheduler
+from os_simulator.scheduling.priority import PriorityScheduler
+from os_simulator.scheduling.ready_queue import PriorityReadyQueue
+
+class TestSystemClock(unittest.TestCase):
+    def test_advance_matches_ticks(self):
+        """Tests that a bulk advance produces the same counters as repeated ticks."""
+        ticked = SystemClock()
+        for _ in range(7):
+            ticked.tick(is_busy=True)
+        for _ in range(3):
+            ticked.tick(is_busy=False)
+
+        advanced = SystemClock()
+        advanced.advance(7, is_busy=True)
+        advanced.advance(3, is_busy=False)
+        advanced.advance(0)
+
+        self.assertEqual(advanced.get_time(), ticked.get_time())
+        self.assertEqual(advanced.get_busy_time(), ticked.get_busy_time())
+        self.assertEqual(advanced.get_idle_time(), ticked.get_idle_time())
+        self.assertEqual(advanced.get_cpu_utilization(), 70.0)
+
+    def test_advance_rejects_negative(self):
+        """Tests that the clock cannot be moved backwards."""
+        clock = SystemClock()
+        with self.assertRaises(ValueError):
+            clock.advance(-1)
+
+class TestKernelDispatch(unittest.TestCase):
+    def test_dispatch_with_idle_and_context_switch(self):
+        """Tests clock accounting for idle gaps and context switch overhead."""
+        # P1: 0-5, idle 5-10, CS 10-12, P2: 12-16
+        kernel = Kernel(context_switch_time=2)
+        kernel.set_scheduler(FCFSScheduler())
+        kernel.add_process(Process(1, "P1", 0, 5))
+        kernel.add_process(Process(2, "P2", 10, 4))
+
+        timeline = kernel.run()
+
+        self.assertEqual(timeline, [(1, 0, 5), ("CS", 10, 12), (2, 12, 16)])
+        self.assertEqual(kernel.system_clock.get_time(), 16)
+        self.assertEqual(kernel.system_clock.get_busy_time(), 11)
+        self.assertEqual(kernel.system_clock.get_idle_time(), 5)
+
+    def test_dispatch_long_bursts(self):
+        """Tests that very long bursts are accounted for without per-unit ticking."""
+        burst = 10 ** 9
+        kernel = Kernel()
+        kernel.set_scheduler(FCFSScheduler())
+        kernel.add_process(Process(1, "Long", 0, burst))
+
+        timeline = kernel.run()
+
+        self.assertEqual(timeline, [(1, 0, burst)])
+        self.assertEqual(kernel.system_clock.get_busy_time(), burst)
+
+class TestEventDrivenKernel(unittest.TestCase):
+    def setUp(self):
+        self.processes = [Process(1, "P1", 0, 5, 3), Process(2, "P2", 1, 3, 1), Process(3, "P3", 2, 4, 2)]
+
+    def test_matches_precomputed_round_robin(self):
+        """Tests that the event core reproduces the Round Robin timeline and metrics."""
+        kernel = Kernel()
+        kernel.set_scheduler(RoundRobinScheduler(quantum=2))
+        for p in self.processes:
+            kernel.add_process(p)
+
+        timeline = kernel.run(event_driven=True)
+
+        expected_timeline = [
+            (1, 0, 2), (2, 2, 4), (3, 4, 6),
+            (1, 6, 8), (2, 8, 9), (3, 9, 11), (1, 11, 12)
+        ]
+        self.assertEqual(timeline, expected_timeline)
+        self.assertEqual([p.turnaround_time for p in self.processes], [12, 8, 9])
+        self.assertTrue(all(p.state == ProcessState.TERMINATED for p in self.processes))
+
+    def test_matches_dispatch_with_context_switch(self):
+        """Tests that FCFS with context switch overhead matches Kernel.dispatch()."""
+        kernel = Kernel(context_switch_time=1)
+        kernel.set_scheduler(FCFSScheduler())
+        for p in self.processes:
+            kernel.add_process(p)
+
+        expected = kernel.run()
+        expected_time = kernel.system_clock.get_time()
+        kernel.reset()
+        timeline = kernel.run(event_driven=True)
+
+        self.assertEqual(timeline, expected)
+        self.assertEqual(kernel.system_clock.get_time(), expected_time)
+
+    def test_matches_precomputed_srtf(self):
+        """Tests that the SRTF ready queue preempts exactly like SJFScheduler(preemptive=True)."""
+        procs = [Process(1, "P1", 0, 8), Process(2, "P2", 1, 4), Process(3, "P3", 2, 9), Process(4, "P4", 3, 5)]
+        expected = SJFScheduler(preemptive=True).schedule(procs)
+        for p in procs:
+            p.remaining_time = p.burst_time
+
+        engine = EventEngine(SJFScheduler(preemptive=True).create_ready_queue())
+        self.assertEqual(engine.run(procs), expected)
+
+    def test_matches_precomputed_priority_aging(self):
+        """Tests that the priority ready queue ages and preempts like PriorityScheduler."""
+        def workload():
+            return [Process(0, "Low", 0, 2, 0)] + [Process(i, f"H{i}", 2 * (i - 1), 2, 5) for i in range(1, 11)] + \
+                   [Process(11, "A", 3, 5, 2), Process(12, "B", 3, 4, 2), Process(13, "C", 5, 3, 6)]
+
+        for settings in ({"aging_interval": 3, "aging_step": 2}, {"preemptive": True, "aging_interval": 2, "max_priority": 5}):
+            expected = PriorityScheduler(**settings).schedule(workload())
+            procs = workload()
+            engine = EventEngine(PriorityScheduler(**settings).create_ready_queue())
+            self.assertEqual(engine.run(procs), expected)
+
+    def test_matches_precomputed_cfs(self):
+        """Tests that the CFS run queue hands out the same slices as CFSScheduler."""
+        procs = [Process(1, "A", 0, 20), Process(2, "B", 0, 20)]
+        engine = EventEngine(CFSScheduler().create_ready_queue())
+
+        self.assertEqual(engine.run(procs), [(1, 0, 10), (2, 10, 20), (1, 20, 30), (2, 30, 40)])
+
+    def test_cfs_sleeper_is_clamped(self):
+        """Tests that a process waking from a long sleep cannot monopolize the CPU with stale vruntime."""
+        sleeper = Process(1, "Sleeper", 0, 50, io_bursts=[(2, 100)])
+        hogs = [Process(2, "Hog1", 0, 300), Process(3, "Hog2", 0, 300)]
+        timeline = EventEngine(CFSScheduler().create_ready_queue()).run([sleeper] + hogs)
+
+        # The sleeper wakes at 102 and needs 48 more units; the hogs must run in between
+        sleeper_end = max(end for pid, _, end in timeline if pid == 1)
+        hog_pids = {pid for pid, start, _ in timeline if 102 <= start < sleeper_end}
+        self.assertEqual(hog_pids - {1}, {2, 3})
+
+    def test_steal_carries_queue_state(self):
+        """Tests that a stolen process keeps its MLFQ level and CFS vruntime lag on the thief's queue."""
+        victim, thief = MLFQScheduler(quanta=[2, 8]).create_ready_queue(), MLFQScheduler(quanta=[2, 8]).create_ready_queue()
+        hog = Process(1, "Hog", 0, 10)
+        victim.push(hog, 0)
+        victim.pop(0)
+        hog.remaining_time = 8  # Used its whole level-0 quantum: demoted
+        victim.push(hog, 2)
+        stolen, state = victim.steal(2)
+        thief.adopt(stolen, state, 2)
+        self.assertIs(thief.pop(2), hog)
+        self.assertEqual(thief.time_slice(hog), 8)
+
+        victim, thief = CFSScheduler().create_ready_queue(), CFSScheduler().create_ready_queue()
+        hog, light = Process(1, "Hog", 0, 100), Process(2, "Light", 0, 100)
+        victim.push(hog, 0)
+        victim.push(light, 0)
+        victim.pop(0)
+        hog.remaining_time = 70  # Ran 30 units before going back to the queue
+        victim.push(hog, 30)
+        victim.steal(30)  # Light, the leftmost task
+        stolen, lag = victim.steal(30)
+        self.assertIs(stolen, hog)
+        self.assertEqual(lag, 30)
+        thief.adopt(stolen, lag, 30)
+        self.assertEqual(thief._vruntime[hog.pid], 30)
+
+    def test_mlfq_io_keeps_level(self):
+        """Tests that a process blocking before its quantum expires keeps its MLFQ level."""
+        # P1 blocks after 1 unit (0-1) and returns at 3, still on level 0.
+        # P2 uses its whole level-0 quantum (1-3) and is demoted, so P1 runs first at 3.
+        p1 = Process(1, "Interactive", 0, 2, io_bursts=[(1, 2)])
+        p2 = Process(2, "Batch", 0, 8)
+        engine = EventEngine(MLFQScheduler(quanta=[2, 8]).create_ready_queue())
+
+        timeline = engine.run([p1, p2])
+
+        self.assertEqual(timeline, [(1, 0, 1), (2, 1, 3), (1, 3, 4), (2, 4, 10)])
+
+    def test_io_phases(self):
+        """Tests that a process blocks on I/O while another uses the CPU."""
+        # P1 runs 0-2, blocks until 6; P2 runs 2-5; idle 5-6; P1 runs 6-8
+        p1 = Process(1, "IO-Bound", 0, 4, io_bursts=[(2, 4)])
+        p2 = Process(2, "CPU-Bound", 0, 3)
+        engine = EventEngine(FCFSScheduler().create_ready_queue())
+
+        timeline = engine.run([p1, p2])
+
+        self.assertEqual(timeline, [(1, 0, 2), (2, 2, 5), (1, 6, 8)])
+        self.assertEqual(p1.turnaround_time, 8)
+        self.assertEqual(p1.waiting_time, 0)
+        self.assertEqual(engine.system_clock.get_idle_time(), 1)
+
+    def test_preemption_on_arrival(self):
+        """Tests that a higher-priority arrival preempts the running process."""
+        low = Process(1, "Low", 0, 6, priority=1)
+        high = Process(2, "High", 2, 2, priority=5)
+        engine = EventEngine(PriorityReadyQueue(preemptive=True))
+
+        timeline = engine.run([low, high])
+
+        self.assertEqual(timeline, [(1, 0, 2), (2, 2, 4), (1, 4, 8)])
+        self.assertEqual(low.waiting_time, 2)
+
+    def test_invalid_io_phases(self):
+        """Tests that I/O phases outside the CPU burst are rejected."""
+        engine = EventEngine(FCFSScheduler().create_ready_queue())
+        with self.assertRaises(ValueError):
+            engine.run([Process(1, "P1", 0, 3, io_bursts=[(3, 1)])])
+
+class TestMultiCoreKernel(unittest.TestCase):
+    def test_arrivals_spread_across_cores(self):
+        """Tests that arrivals are balanced over per-core run queues."""
+        kernel = Kernel(num_cores=2)
+        for pid in range(1, 5):
+            kernel.add_process(Process(pid, f"P{pid}", 0, 4))
+        kernel.set_scheduler(FCFSScheduler())
+
+        timeline = kernel.run()
+
+        self.assertEqual(kernel.core_timelines, [[(1, 0, 4), (3, 4, 8)], [(2, 0, 4), (4, 4, 8)]])
+        self.assertEqual(timeline, [(1, 0, 4), (2, 0, 4), (3, 4, 8), (4, 4, 8)])
+        self.assertEqual(kernel.system_clock.get_time(), 8)
+        self.assertEqual(kernel.system_clock.get_cpu_utilization(), 100.0)
+        self.assertEqual([clock.get_busy_time() for clock in kernel.core_clocks], [8, 8])
+
+    def test_work_stealing(self):
+        """Tests that an idle core takes waiting work from a busy core's queue."""
+        def workload():
+            return [Process(1, "Long", 0, 10), Process(2, "Short", 0, 2), Process(3, "Queued", 0, 2)]
+
+        without = EventEngine([FCFSScheduler().create_ready_queue() for _ in range(2)])
+        without.run(workload())
+        self.assertEqual(without.core_timelines[0], [(1, 0, 10), (3, 10, 12)])
+
+        stealing = EventEngine([FCFSScheduler().create_ready_queue() for _ in range(2)], work_stealing=True)
+        stealing.run(workload())
+        self.assertEqual(stealing.core_timelines, [[(1, 0, 10)], [(2, 0, 2), (3, 2, 4)]])
+
+    def test_migration_cost(self):
+        """Tests that resuming on another core charges migration overhead."""
+        kernel = Kernel(num_cores=2, migration_cost=1, work_stealing=True)
+        io_bound = Process(1, "IO", 0, 4, io_bursts=[(2, 5)])
+        kernel.add_process(io_bound)
+        kernel.add_process(Process(2, "Short", 0, 3))
+        kernel.add_process(Process(3, "Long", 0, 20))
+        kernel.set_scheduler(FCFSScheduler())
+
+        kernel.run()
+
+        self.assertEqual(kernel.core_timelines[1], [(2, 0, 3), ("MIG", 7, 8), (1, 8, 10)])
+        self.assertEqual(io_bound.waiting_time, 1)
+        self.assertEqual(kernel.system_clock.get_busy_time(), 28)
+        self.assertEqual(kernel.system_clock.get_cpu_utilization(), 63.64)
+
+    def test_dispatch_rejects_multiple_cores(self):
+        """Tests that the single-CPU post-processing path refuses multi-core kernels."""
+        kernel = Kernel(num_cores=4)
+        kernel.set_scheduler(FCFSScheduler())
+        with self.assertRaises(ValueError):
+            kernel.dispatch()
+
+    def test_rejects_clock_with_other_core_count(self):
+        """Tests that a shared clock must track as many cores as the kernel."""
+        with self.assertRaises(ValueError):
+            Kernel(system_clock=SystemClock(), num_cores=4)
+        self.assertEqual(Kernel(system_clock=SystemClock(num_cores=4), num_cores=4).system_clock.num_cores, 4)
+
+class TestProcessTable(unittest.TestCase):
+    def test_round_trip(self):
+        """Tests that processes survive conversion to columns and back."""
+        original = [Process(1, "A", 0, 5, priority=2, io_bursts=[(2, 3)]), Process(2, "B", 4, 1, deadline=6)]
+        table = ProcessTable.from_processes(original)
+
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.nbytes, 2 * (11 * 8 + 1))
+        self.assertEqual(list(table.burst_time), [5, 1])
+        self.assertEqual(table[1].absolute_deadline, 10)
+        self.assertIsNone(table[0].deadline)
+
+        restored = table.to_processes()
+        self.assertEqual([(p.pid, p.name, p.io_bursts, p.deadline, p.state) for p in restored],
+                         [(p.pid, p.name, p.io_bursts, p.deadline, p.state) for p in original])
+        self.assertFalse(hasattr(restored[0], "__dict__"))
+
+    def test_views_drive_schedulers(self):
+        """Tests that table views can be scheduled in place like Process objects."""
+        table = ProcessTable()
+        table.add(1, "P1", 0, 8)
+        table.add(2, "P2", 1, 4)
+        table.add(3, "P3", 2, 9)
+
+        timeline = SJFScheduler(preemptive=True).schedule(table.views())
+
+        self.assertEqual(timeline, [(1, 0, 1), (2, 1, 5), (1, 5, 12), (3, 12, 21)])
+        self.assertEqual(list(table.completion_time), [12, 5, 21])
+        self.assertEqual(list(table.waiting_time), [4, 0, 10])
+
+        engine_table = ProcessTable()
+        engine_table.add(1, "P1", 0, 3, io_bursts=[(1, 2)])
+        EventEngine(FCFSScheduler().create_ready_queue()).run(engine_table.views())
+        self.assertEqual(engine_table[0].state, ProcessState.TERMINATED)
+        self.assertEqual(engine_table[0].turnaround_time, 5)
+
+    def test_snapshot_restore(self):
+        """Tests that a table snapshot is independent and restores in place."""
+        table = ProcessTable()
+        table.add(1, "P1", 0, 8)
+        table.add(2, "P2", 1, 4, io_bursts=[(2, 1)])
+        pristine = table.snapshot()
+        views = table.views()
+
+        SJFScheduler().schedule(views)
+        self.assertEqual(list(pristine.remaining_time), [8, 4])
+        self.assertIsNone(pristine[0].completion_time)
+
+        table.restore(pristine)
+        self.assertEqual(views[0].remaining_time, 8)
+        self.assertEqual(views[1].state, ProcessState.NEW)
+        self.assertEqual(views[1].io_bursts, ((2, 1),))
+        self.assertEqual(table.fingerprint(), pristine.fingerprint())
+
+class TestProcessClone(unittest.TestCase):
+    def test_clone_is_independent(self):
+        """Tests that clone() copies every field and restore() brings them back."""
+        p = Process(1, "P1", 0, 5, priority=3, io_bursts=[(2, 1)], period=10)
+        copy = p.clone()
+        p.execute_one_unit()
+        p.calculate_metrics(9)
+
+        self.assertEqual((copy.remaining_time, copy.completion_time), (5, None))
+        self.assertEqual((copy.priority, copy.io_bursts, copy.deadline), (3, ((2, 1),), 10))
+
+        p.restore(copy)
+        self.assertEqual((p.remaining_time, p.completion_time, p.waiting_time), (5, None, 0))
+
+    def test_kernel_reset_restores_processes(self):
+        """Tests that Kernel.reset() makes a second run reproduce the first."""
+        kernel = Kernel(context_switch_time=1)
+        kernel.set_scheduler(FCFSScheduler())
+        procs = [Process(1, "P1", 0, 4), Process(2, "P2", 1, 3, priority=1)]
+        for p in procs:
+            kernel.add_process(p)
+
+        first = kernel.run()
+        metrics = [(p.waiting_time, p.turnaround_time) for p in procs]
+        kernel.reset()
+        self.assertTrue(all(p.state == ProcessState.NEW and p.completion_time is None for p in procs))
+        self.assertEqual(kernel.run(), first)
+        self.assertEqual([(p.waiting_time, p.turnaround_time) for p in procs], metrics)
+
+class TestWorkloadGenerator(unittest.TestCase):
+    def make(self, arrivals, seed=3):
+        return WorkloadGenerator(
+            arrivals, burst=Bimodal(Exponential(2), Pareto(2.5, 20), 0.1),
+            priority=UniformInt(0, 4), seed=seed, backend="python"
+        )
+
+    def test_reproducible_and_sorted(self):
+        """Tests that a seed fixes the workload and arrivals come in order."""
+        for arrivals in (Poisson(0.5), MMPP((2.0, 0.05), (10, 100)), Diurnal(0.5, 0.8, 200)):
+            table = self.make(arrivals).generate(3000, chunk_size=1000)
+            self.assertEqual(len(table), 3000)
+            self.assertEqual(list(table.pid), list(range(1, 3001)))
+            self.assertEqual(list(table.arrival_time), sorted(table.arrival_time))
+            self.assertGreaterEqual(min(table.burst_time), 1)
+            self.assertEqual(set(table.priority), {0, 1, 2, 3, 4})
+            self.assertEqual(table.fingerprint(), self.make(arrivals).generate(3000, chunk_size=1000).fingerprint())
+            self.assertNotEqual(table.fingerprint(), self.make(arrivals, seed=4).generate(3000, chunk_size=1000).fingerprint())
+
+    def test_arrival_rate(self):
+        """Tests that each arrival process delivers its long-run mean rate."""
+        cases = [(Poisson(0.5), 0.5), (MMPP((2.0, 0.0), (10, 30)), 0.5), (Diurnal(0.5, 0.8, 100), 0.5)]
+        for arrivals, rate in cases:
+            table = self.make(arrivals).generate(20000)
+            self.assertAlmostEqual(len(table) / table.arrival_time[-1], rate, delta=rate * 0.1)
+
+    def test_mmpp_rejects_silent_phases(self):
+        """Tests that an MMPP that could never emit an arrival is rejected instead of looping."""
+        for arrivals in (MMPP((0.0, 0.0), (10, 30)), MMPP((1.0,), (10, 30)), MMPP((1.0, 0.5), (0, 0))):
+            with self.assertRaises(ValueError):
+                self.make(arrivals).generate(10)
+
+    def test_default_load_is_stable(self):
+        """Tests that the default settings offer one CPU less work than it can serve."""
+        table = WorkloadGenerator(seed=5, backend="python").generate(20000)
+        load = sum(table.burst_time) / table.arrival_time[-1]
+        self.assertLess(load, 0.9)
+        self.assertGreater(load, 0.7)
+
+    def test_stream_matches_generate(self):
+        """Tests that streamed processes equal the generated table and can drive the kernel."""
+        generator = self.make(Poisson(0.2))
+        expected = generator.generate(500, chunk_size=128).to_processes()
+        streamed = list(generator.stream(500, chunk_size=128))
+        self.assertEqual([(p.pid, p.arrival_time, p.burst_time, p.priority) for p in streamed],
+                         [(p.pid, p.arrival_time, p.burst_time, p.priority) for p in expected])
+
+        kernel = Kernel()
+        kernel.set_scheduler(FCFSScheduler())
+        kernel.simulate(process_stream=generator.stream(500, chunk_size=128), keep_timeline=False)
+        self.assertEqual(kernel.system_clock.get_time(), FCFSScheduler().schedule(expected)[-1][2])
+
+class TestTraceLoader(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.processes = [
+            Process(1, "init", 0, 5, io_bursts=[(2, 3)], deadline=20),
+            Process(2, "job", 1, 2, priority=3, memory_required=64, period=7),
+            Process(7, "batch", 4, 9)
+        ]
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def fields(self, processes, names=True):
+        return [(p.pid, p.name if names else None, p.arrival_time, p.burst_time, p.priority,
+                 p.memory_required, p.deadline, p.period) for p in processes]
+
+    def test_round_trip(self):
+        """Tests that every format writes and streams back the same processes."""
+        for ext in ("csv", "jsonl", "bin"):
+            path = os.path.join(self.dir.name, f"trace.{ext}")
+            self.assertEqual(write_trace(path, self.processes), 3)
+            loaded = list(read_trace(path))
+            binary = ext == "bin"
+            self.assertEqual(self.fields(loaded, names=not binary), self.fields(self.processes, names=not binary))
+            self.assertEqual(loaded[0].io_bursts, () if binary else ((2, 3),))
+            self.assertEqual(self.fields(load_trace_table(path), names=not binary), self.fields(loaded, names=not binary))
+
+    def test_minimal_csv_and_order_check(self):
+        """Tests CSV defaults and that out-of-order arrivals are rejected."""
+        path = os.path.join(self.dir.name, "jobs.csv")
+        with open(path, "w") as f:
+            f.write("arrival_time,burst_time\n0,4\n3,1\n2,2\n")
+        with self.assertRaises(ValueError):
+            list(read_trace(path))
+        loaded = list(read_trace(path, check_order=False))
+        self.assertEqual([(p.pid, p.name, p.priority) for p in loaded], [(1, "P1", 0), (2, "P2", 0), (3, "P3", 0)])
+        with self.assertRaises(ValueError):
+            read_trace(os.path.join(self.dir.name, "jobs.txt"))
+
+    def test_binary_rejects_empty_and_truncated(self):
+        """Tests that empty and truncated binary traces raise a clear ValueError on both read paths."""
+        path = os.path.join(self.dir.name, "trace.bin")
+        write_trace(path, self.processes)
+        with open(path, "rb") as f:
+            data = f.read()
+        for content, message in ((b"", "not a binary process trace"), (data[:-5], "truncated")):
+            with open(path, "wb") as f:
+                f.write(content)
+            with self.assertRaisesRegex(ValueError, message):
+                list(read_trace(path))
+            with self.assertRaisesRegex(ValueError, message):
+                load_trace_table(path)
+        write_trace(path, [])
+        self.assertEqual(list(read_trace(path)), [])
+        self.assertEqual(len(load_trace_table(path)), 0)
+
+    def test_kernel_replays_binary_trace(self):
+        """Tests that a streamed binary trace simulates exactly like the in-memory workload."""
+        path = os.path.join(self.dir.name, "trace.bin")
+        write_trace(path, [p for p in self.processes if not p.io_bursts])
+
+        kernel = Kernel(context_switch_time=1)
+        kernel.set_scheduler(FCFSScheduler())
+        timeline = kernel.simulate(process_stream=read_trace(path))
+        expected = Kernel(context_switch_time=1)
+        expected.set_scheduler(FCFSScheduler())
+        self.assertEqual(timeline, expected.simulate(process_stream=list(read_trace(path))))
+        self.assertEqual(timeline[0], (2, 1, 3))
+
+class TestTimelineFile(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "run.tl")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_round_trip(self):
+        """Tests conversion between tuple timelines and the binary file."""
+        timeline = [(1, 0, 3), ("CS", 3, 4), (2, 4, 6), ("MIG", 6, 7), (1, 7, 9)]
+        self.assertEqual(write_timeline(self.path, timeline), 5)
+        self.assertEqual(os.path.getsize(self.path), 8 + 5 * 32)
+        self.assertEqual(read_timeline(self.path), timeline)
+        with TimelineReader(self.path) as reader:
+            self.assertEqual(len(reader), 5)
+            self.assertEqual(reader[-1], (1, 7, 9))
+            columns = reader.columns()
+            self.assertEqual(list(columns["kind"]), [0, 1, 0, 2, 0])
+            self.assertEqual(list(columns["end"]), [3, 4, 6, 7, 9])
+        with self.assertRaises(ValueError):
+            write_timeline(self.path, [("IDLE", 0, 1)])
+
+    def test_large_pids(self):
+        """Tests that pids beyond 32 bits survive the round trip."""
+        timeline = [(2 ** 40, 0, 3), ("CS", 3, 4), (-(2 ** 35), 4, 6)]
+        write_timeline(self.path, timeline)
+        self.assertEqual(read_timeline(self.path), timeline)
+        with TimelineReader(self.path) as reader:
+            self.assertEqual(list(reader.columns()["pid"]), [2 ** 40, 0, -(2 ** 35)])
+        with open(self.path, "r+b") as f:
+            f.write(b"OSTLINE1")
+        with self.assertRaisesRegex(ValueError, "old"):
+            TimelineReader(self.path)
+
+    def test_kernel_writes_incrementally(self):
+        """Tests that a TimelineWriter sink records the same timeline the kernel returns."""
+        processes = [Process(1, "P1", 0, 5), Process(2, "P2", 1, 3), Process(3, "P3", 2, 1)]
+        kernel = Kernel(context_switch_time=1)
+        kernel.set_scheduler(RoundRobinScheduler(quantum=2))
+        expected = kernel.simulate(process_stream=[p.clone() for p in processes])
+
+        metrics = StreamingMetrics()
+        with TimelineWriter(self.path, buffer_segments=2) as writer:
+            kernel = Kernel(context_switch_time=1, metrics_sink=CompositeSink(metrics, writer))
+            kernel.set_scheduler(RoundRobinScheduler(quantum=2))
+            self.assertEqual(kernel.simulate(process_stream=processes, keep_timeline=False), [])
+        self.assertEqual(read_timeline(self.path), expected)
+        self.assertEqual(metrics.snapshot()["total_processes"], 3)
+
+if __name__ == '__main__':
+    unittest.main()
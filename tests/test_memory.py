@@ -1,12 +1,19 @@
 import unittest
 import sys
 import os
+import logging
+import tempfile
+from unittest import mock
 
 # Add src to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from os_simulator.memory_management.paging import PagingMemoryManager
-from os_simulator.memory_management.page_replacement import fifo_replacement, lru_replacement
+from os_simulator.memory_management.page_replacement import fifo_replacement, lru_replacement, optimal_replacement, next_use_indices
+from os_simulator.memory_management.stack_distance import COLD_MISS, lru_stack_distances, miss_ratio_curve
+from os_simulator.memory_management.replacement_policies import ALGORITHMS, TwoQueuePolicy, simulate_replacement
+from os_simulator.memory_management import replacement_batch
+from os_simulator.memory_management.replacement_batch import ReplacementBatch, ReferenceTraceReader, write_reference_trace
 
 class TestPaging(unittest.TestCase):
     def setUp(self):
@@ -88,5 +95,170 @@ class TestPageReplacement(unittest.TestCase):
         self.assertEqual(result["page_faults"], 5)
         self.assertEqual(result["page_hits"], 1)
 
+    def test_fifo_vs_lru_on_repeated_hits(self):
+        """Tests that hits reorder LRU but not FIFO, and that frame_size is validated."""
+        # 1 is hit repeatedly: LRU keeps it, FIFO still evicts it first
+        ref = [1, 2, 3, 1, 4, 1, 5, 1]
+        self.assertEqual(lru_replacement(ref, 3)["page_faults"], 5)
+        self.assertEqual(fifo_replacement(ref, 3)["page_faults"], 6)
+        self.assertEqual(lru_replacement(list(range(1000)) * 3, 1000)["page_faults"], 1000)
+        with self.assertRaises(ValueError):
+            fifo_replacement(ref, 0)
+
+    def test_optimal_textbook_string(self):
+        """Tests OPT on the classic textbook reference string and the next-use index."""
+        ref = [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2, 1, 2, 0, 1, 7, 0, 1]
+        self.assertEqual(optimal_replacement(ref, 3)["page_faults"], 9)
+        self.assertEqual(lru_replacement(ref, 3)["page_faults"], 12)
+        self.assertEqual(fifo_replacement(ref, 3)["page_faults"], 15)
+        self.assertEqual(next_use_indices([1, 2, 1, 3, 2]), [2, 4, 5, 5, 5])
+        # Long cyclic scans: OPT keeps frame_size - 1 pages, LRU thrashes
+        cyclic = list(range(50)) * 20
+        self.assertEqual(lru_replacement(cyclic, 40)["page_hits"], 0)
+        self.assertEqual(optimal_replacement(cyclic, 40)["page_faults"], 50 + 19 * 10)
+
+class TestStackDistance(unittest.TestCase):
+    def test_lru_distances(self):
+        """Tests LRU stack distances on a small string."""
+        self.assertEqual(lru_stack_distances([1, 2, 3, 1, 1, 2, 4, 3]),
+                         [COLD_MISS, COLD_MISS, COLD_MISS, 3, 1, 3, COLD_MISS, 4])
+
+    def test_curves_match_single_size_runs(self):
+        """Tests that one pass reproduces the fault count of every frame size."""
+        ref = [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2, 1, 2, 0, 1, 7, 0, 1] * 3
+        lru = miss_ratio_curve(ref, "lru")
+        opt = miss_ratio_curve(ref, "opt")
+        self.assertEqual(lru["frames"], list(range(1, 7)))
+        self.assertEqual(lru["page_faults"], [lru_replacement(ref, f)["page_faults"] for f in lru["frames"]])
+        self.assertEqual(opt["page_faults"], [optimal_replacement(ref, f)["page_faults"] for f in opt["frames"]])
+        self.assertEqual(lru["fault_ratio"], [lru_replacement(ref, f)["fault_ratio"] for f in lru["frames"]])
+        self.assertEqual(opt["page_faults"][-1], opt["cold_misses"])
+        self.assertEqual(miss_ratio_curve(ref, "opt", max_frames=2)["page_faults"], opt["page_faults"][:2])
+        with self.assertRaises(ValueError):
+            miss_ratio_curve(ref, "fifo")
+
+class TestReplacementPolicies(unittest.TestCase):
+    def test_policies_never_beat_optimal(self):
+        """Tests every policy against the optimal fault count and CLOCK against Second-Chance."""
+        ref = [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2, 1, 2, 0, 1, 7, 0, 1] * 3
+        for frames in (1, 3, 4):
+            best = optimal_replacement(ref, frames)["page_faults"]
+            for name in ALGORITHMS:
+                res = simulate_replacement(ref, frames, name)
+                self.assertGreaterEqual(res["page_faults"], best, name)
+                self.assertEqual(res["page_faults"] + res["page_hits"], len(ref))
+            self.assertEqual(simulate_replacement(ref, frames, "clock"), simulate_replacement(ref, frames, "second_chance"))
+        with self.assertRaises(ValueError):
+            simulate_replacement(ref, 3, "mru")
+
+    def test_scan_resistance(self):
+        """Tests that ARC and LFU keep a hot set through a one-off scan that flushes LRU."""
+        hot = [1, 2, 3, 4] * 20
+        ref = hot + list(range(100, 140)) + hot
+        lru = simulate_replacement(ref, 8, "lru")["page_faults"]
+        self.assertEqual(lru, 48)
+        for name in ("arc", "lfu"):
+            self.assertLess(simulate_replacement(ref, 8, name)["page_faults"], lru, name)
+
+    def test_two_queue_promotes_from_a1out(self):
+        """Tests that a page in A1out is promoted even when reclaiming trims it off A1out."""
+        policy = TwoQueuePolicy(2)
+        for page in [1, 2, 3, 1]:
+            policy.access(page)
+        self.assertEqual(list(policy._am), [1])
+        self.assertEqual(simulate_replacement([1, 2, 3, 1, 4, 3], 2, "2q")["page_faults"], 5)
+
+    def test_working_set_window(self):
+        """Tests that pages outside the working-set window are dropped."""
+        # The window counts the current reference: with tau = 3, page 1 leaves before its reuse
+        self.assertEqual(simulate_replacement([1, 2, 3, 1], 10, "working_set", window=3)["page_faults"], 4)
+        self.assertEqual(simulate_replacement([1, 2, 3, 1], 10, "working_set", window=4)["page_faults"], 3)
+        with self.assertRaises(ValueError):
+            simulate_replacement([1, 2, 3, 1], 10, "optimal", window=3)
+        # By default the frame cap never binds: a reference hits exactly when its page
+        # was used within the previous frame_size - 1 references
+        ref = [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2, 1, 2, 0, 1, 7, 0, 1]
+        for frames in (2, 3, 4):
+            last, expected = {}, 0
+            for t, page in enumerate(ref):
+                expected += page not in last or t - last[page] >= frames
+                last[page] = t
+            self.assertEqual(simulate_replacement(ref, frames, "working_set")["page_faults"], expected)
+
+class TestReplacementBatch(unittest.TestCase):
+    def setUp(self):
+        self.references = {
+            "textbook": [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2, 1, 2, 0, 1, 7, 0, 1],
+            "cyclic": list(range(6)) * 5,
+            "empty": []
+        }
+        self.frames = [1, 3, 4]
+        self.policies = ["fifo", "lru", "optimal", "arc"]
+        self.expected = [
+            {"trace": name, "policy": policy, "frames": frames, "references": len(ref),
+             **simulate_replacement(ref, frames, policy)}
+            for name, ref in self.references.items() for policy in self.policies for frames in self.frames
+        ]
+
+    def test_matches_single_runs(self):
+        """Tests that the batch table equals one simulation per combination, serially and on a pool."""
+        self.assertEqual(ReplacementBatch().run(self.references, self.frames, self.policies), self.expected)
+        self.assertEqual(ReplacementBatch(workers=2).run(self.references, self.frames, self.policies), self.expected)
+        with self.assertRaises(ValueError):
+            ReplacementBatch().run(self.references, self.frames, ["mru"])
+
+    def test_stack_pass_choice(self):
+        """Tests that stack-distance passes are used only when cheaper and give the same table."""
+        self.assertTrue(replacement_batch._use_stack_pass("lru", range(1, 13)))
+        self.assertFalse(replacement_batch._use_stack_pass("lru", [1, 3, 4]))
+        self.assertTrue(replacement_batch._use_stack_pass("optimal", range(1, 13)))
+        self.assertFalse(replacement_batch._use_stack_pass("optimal", [8, 1024]))
+        self.assertFalse(replacement_batch._use_stack_pass("optimal", range(1, 200)))
+        frames = list(range(1, 13))
+        expected = [
+            {"trace": name, "policy": policy, "frames": f, "references": len(ref), **simulate_replacement(ref, f, policy)}
+            for name, ref in self.references.items() for policy in ("lru", "optimal") for f in frames
+        ]
+        self.assertEqual(ReplacementBatch().run(self.references, frames, ["lru", "optimal"]), expected)
+
+    def test_reference_trace_file(self):
+        """Tests the memory-mapped reference trace round trip and running a batch from it."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tenants.pages")
+            self.assertEqual(write_reference_trace(path, self.references), 3)
+            with ReferenceTraceReader(path) as reader:
+                self.assertEqual(reader.names, list(self.references))
+                self.assertEqual(list(reader["cyclic"]), self.references["cyclic"])
+            self.assertEqual(ReplacementBatch(workers=2).run(path, self.frames, self.policies), self.expected)
+
+            # Pool jobs map the trace themselves and close it when done
+            close = ReferenceTraceReader.close
+            with mock.patch.object(ReferenceTraceReader, "close", autospec=True, side_effect=close) as closed:
+                try:
+                    replacement_batch._init_worker(path)
+                    rows = replacement_batch._run_job(("cyclic", self.frames, tuple(self.policies)))
+                finally:
+                    replacement_batch._init_worker({})
+                    logging.disable(logging.NOTSET)
+            self.assertEqual(rows, [{k: v for k, v in row.items() if k != "trace"} for row in self.expected if row["trace"] == "cyclic"])
+            self.assertEqual(closed.call_count, 1)
+
+            # A live view keeps the mapping open, but the file is closed anyway
+            reader = ReferenceTraceReader(path)
+            view = reader["textbook"]
+            with self.assertRaises(BufferError):
+                reader.close()
+            self.assertTrue(reader._file.closed)
+            self.assertEqual(view[0], 7)
+            view.release()
+            reader.close()
+
+            # Errors raised while views are alive are not replaced by BufferError
+            def failing(pages, frame_sizes, policies):
+                raise RuntimeError(f"failed on {len(pages)} pages")
+            with mock.patch.object(replacement_batch, "evaluate_reference_string", failing):
+                with self.assertRaisesRegex(RuntimeError, "failed on 20 pages"):
+                    ReplacementBatch().run(path, self.frames, self.policies)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
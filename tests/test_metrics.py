@@ -0,0 +1,273 @@
+import unittest
+import random
+import csv
+import tempfile
+import sys
+import os
+import json
+import subprocess
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from os_simulator.kernel import Kernel
+from os_simulator.process import Process
+from os_simulator.metrics import MetricsCalculator, np
+from os_simulator.process_table import ProcessTable
+from os_simulator.streaming_metrics import P2Quantile, RunningStats, StreamingMetrics
+from os_simulator.scheduling.round_robin import RoundRobinScheduler
+from os_simulator.scheduling.sjf import SJFScheduler
+from os_simulator.comparator import AlgorithmComparator
+from os_simulator.scheduling.mlfq import MLFQScheduler
+from os_simulator.sweep import ParameterSweep, find_knee
+from os_simulator.scheduling.fcfs import FCFSScheduler
+from os_simulator.batch import build_distribution, run_batch
+from os_simulator.workload import Bimodal, Exponential, Pareto
+
+class TestMetricsCalculator(unittest.TestCase):
+    def setUp(self):
+        self.processes = [Process(1, "P1", 0, 5), Process(2, "P2", 1, 3), Process(3, "P3", 2, 4)]
+        self.kernel = Kernel()
+        self.kernel.set_scheduler(FCFSScheduler())
+        for p in self.processes:
+            self.kernel.add_process(p)
+        self.timeline = self.kernel.run()
+
+    def test_averages_and_starvation(self):
+        """Tests average and maximum waiting time for FCFS."""
+        # Waiting times: P1=0, P2=4, P3=6
+        results = MetricsCalculator().calculate(self.processes, self.timeline, self.kernel.system_clock)
+
+        self.assertEqual(results["avg_waiting_time"], 3.33)
+        self.assertEqual(results["max_waiting_time"], 6)
+        self.assertEqual(results["avg_turnaround_time"], 7.33)
+        self.assertEqual(results["avg_response_time"], 3.33)
+        self.assertEqual(results["simulation_duration"], 12)
+
+    def test_deadline_metrics(self):
+        """Tests deadline-miss ratio and lateness percentiles."""
+        # Completions under FCFS: P1=5, P2=8, P3=12
+        processes = [Process(1, "P1", 0, 5, deadline=6), Process(2, "P2", 1, 3, deadline=4), Process(3, "P3", 2, 4, deadline=12)]
+        kernel = Kernel()
+        kernel.set_scheduler(FCFSScheduler())
+        for p in processes:
+            kernel.add_process(p)
+        timeline = kernel.run()
+
+        results = MetricsCalculator().calculate(processes, timeline, kernel.system_clock)
+
+        self.assertEqual([p.lateness for p in processes], [-1, 3, -2])
+        self.assertEqual(results["deadlines_missed"], 1)
+        self.assertEqual(results["deadline_miss_ratio"], 0.3333)
+        self.assertEqual(results["p50_lateness"], -1)
+        self.assertEqual(results["p99_lateness"], 3)
+        self.assertNotIn("deadline_jobs", MetricsCalculator().calculate(self.processes, self.timeline, self.kernel.system_clock))
+
+    def test_percentiles_and_histograms(self):
+        """Tests tail percentiles and histograms on the pure-Python path."""
+        calc = MetricsCalculator(histogram_bins=3, use_numpy=False)
+        results = calc.calculate(self.processes, self.timeline, self.kernel.system_clock)
+
+        # Waiting times sorted: 0, 4, 6
+        self.assertEqual(results["p50_waiting_time"], 4)
+        self.assertEqual(results["p99_waiting_time"], 6)
+        self.assertEqual(results["max_turnaround_time"], 10)
+        self.assertEqual(calc.histograms["waiting_time"], ([0, 2.0, 4.0, 6], [1, 0, 2]))
+
+    def test_process_table_input(self):
+        """Tests that a ProcessTable gives the same metrics as the process list."""
+        expected = MetricsCalculator().calculate(self.processes, self.timeline, self.kernel.system_clock)
+        table = ProcessTable.from_processes(self.processes)
+        self.assertEqual(MetricsCalculator().calculate(table, self.timeline, self.kernel.system_clock), expected)
+
+    @unittest.skipIf(np is None, "NumPy not installed")
+    def test_numpy_matches_python(self):
+        """Tests that the vectorized path reproduces the pure-Python results."""
+        python_calc = MetricsCalculator(use_numpy=False)
+        numpy_calc = MetricsCalculator(use_numpy=True)
+        expected = python_calc.calculate(self.processes, self.timeline, self.kernel.system_clock)
+
+        self.assertEqual(numpy_calc.calculate(self.processes, self.timeline, self.kernel.system_clock), expected)
+        self.assertEqual(numpy_calc.histograms, python_calc.histograms)
+
+class TestStreamingMetrics(unittest.TestCase):
+    def test_matches_batch_metrics(self):
+        """Tests that the kernel-fed sink agrees with MetricsCalculator, deadline metrics included."""
+        processes = [Process(1, "P1", 0, 5, deadline=8), Process(2, "P2", 1, 3, deadline=6), Process(3, "P3", 2, 4, deadline=12)]
+        sink = StreamingMetrics()
+        kernel = Kernel(context_switch_time=1, metrics_sink=sink)
+        kernel.set_scheduler(RoundRobinScheduler(quantum=2))
+        for p in processes:
+            kernel.add_process(p)
+        timeline = kernel.run(event_driven=True)
+
+        expected = MetricsCalculator().calculate(processes, timeline, kernel.system_clock)
+        live = sink.snapshot()
+        self.assertIn("p95_lateness", expected)
+        for key in expected:
+            self.assertEqual(live[key], expected[key], key)
+
+    def test_running_stats_and_quantiles(self):
+        """Tests Welford moments and P-square estimates against exact values."""
+        rng = random.Random(11)
+        values = [rng.expovariate(0.1) for _ in range(20000)]
+        stats, p95 = RunningStats(), P2Quantile(0.95)
+        for v in values:
+            stats.update(v)
+            p95.update(v)
+
+        mean = sum(values) / len(values)
+        self.assertAlmostEqual(stats.mean, mean)
+        self.assertAlmostEqual(stats.variance, sum((v - mean) ** 2 for v in values) / len(values))
+        exact = sorted(values)[int(0.95 * len(values))]
+        self.assertLess(abs(p95.value() - exact) / exact, 0.02)
+
+    def test_unbounded_stream(self):
+        """Tests a generated workload run without storing the timeline, with live reports."""
+        def workload(n):
+            for pid in range(n):
+                yield Process(pid, f"P{pid}", pid * 3, 2 + pid % 2)
+
+        reports = []
+        sink = StreamingMetrics(report_interval=2500, on_report=reports.append)
+        kernel = Kernel(metrics_sink=sink)
+        kernel.set_scheduler(RoundRobinScheduler(quantum=2))
+
+        timeline = kernel.simulate(process_stream=workload(10000), keep_timeline=False)
+
+        self.assertEqual(timeline, [])
+        self.assertEqual([r["total_processes"] for r in reports], [2500, 5000, 7500, 10000])
+        self.assertEqual(sink.snapshot()["avg_turnaround_time"], 2.5)
+        self.assertEqual(kernel.system_clock.get_busy_time(), 25000)
+
+class TestAlgorithmComparator(unittest.TestCase):
+    def setUp(self):
+        self.workloads = {
+            "small": [Process(1, "P1", 0, 5), Process(2, "P2", 1, 3), Process(3, "P3", 2, 4)],
+            "mixed": [Process(pid, f"P{pid}", pid * 2, 1 + pid % 7) for pid in range(1, 40)],
+        }
+        self.schedulers = [FCFSScheduler(), RoundRobinScheduler(quantum=2), RoundRobinScheduler(quantum=4), SJFScheduler()]
+
+    def test_compare_labels_and_isolation(self):
+        """Tests that repeated scheduler classes get distinct labels and inputs are untouched."""
+        results = AlgorithmComparator().compare(self.workloads["small"], self.schedulers, context_switch_time=1)
+
+        self.assertEqual(list(results), ["FCFSScheduler", "RoundRobinScheduler", "RoundRobinScheduler (2)", "SJFScheduler"])
+        self.assertEqual(results["FCFSScheduler"]["avg_waiting_time"], 3.33)
+        self.assertEqual([p.remaining_time for p in self.workloads["small"]], [5, 3, 4])
+
+    def test_parallel_grid_matches_sequential(self):
+        """Tests that the process pool produces the same, identically ordered results."""
+        sequential = AlgorithmComparator().compare_grid(self.workloads, self.schedulers, [0, 2])
+        parallel = AlgorithmComparator(workers=2).compare_grid(self.workloads, self.schedulers, [0, 2])
+
+        self.assertEqual(len(sequential), 2 * 4 * 2)
+        self.assertEqual(list(parallel.items()), list(sequential.items()))
+
+class TestParameterSweep(unittest.TestCase):
+    def setUp(self):
+        self.workload = [Process(pid, f"P{pid}", pid, 3 + pid % 5) for pid in range(1, 25)]
+        self.grid = {
+            "RR": (RoundRobinScheduler, {"quantum": range(1, 9)}),
+            "MLFQ": (MLFQScheduler, {"quanta": [[2, 4, 8], [1, 2, None]]}),
+        }
+
+    def test_sweep_rows_and_cache(self):
+        """Tests grid expansion, tidy rows, CSV export and the persistent cache."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = os.path.join(tmp, "cache.jsonl")
+            sweep = ParameterSweep(cache_path=cache_path)
+            rows = sweep.run({"w": self.workload}, self.grid, context_switch_times=[0, 1], core_counts=[1, 2])
+
+            self.assertEqual(len(rows), (8 + 2) * 2 * 2)
+            self.assertEqual(sweep.cache_misses, len(rows))
+            self.assertEqual((rows[0]["scheduler"], rows[0]["quantum"], rows[0]["num_cores"]), ("RR", 1, 1))
+            self.assertEqual(rows[-1]["quanta"], [1, 2, None])
+
+            csv_path = os.path.join(tmp, "sweep.csv")
+            sweep.to_csv(csv_path)
+            with open(csv_path) as f:
+                header = next(csv.reader(f))
+            self.assertEqual(header[:6], ["workload", "scheduler", "quantum", "context_switch_time", "num_cores", "avg_waiting_time"])
+            self.assertIn("quanta", header)
+
+            # A fresh sweep over a superset of the grid only simulates the new points
+            resumed = ParameterSweep(cache_path=cache_path)
+            again = resumed.run({"renamed": self.workload}, {"RR": (RoundRobinScheduler, {"quantum": range(1, 10)})},
+                                context_switch_times=[0, 1], core_counts=[1, 2])
+            self.assertEqual(resumed.cache_misses, 4)
+            self.assertEqual(again[0]["avg_waiting_time"], rows[0]["avg_waiting_time"])
+
+    def test_knee(self):
+        """Tests knee detection on a sweep curve and a synthetic one."""
+        self.assertEqual(find_knee([1, 2, 3, 4, 5, 6], [100, 40, 20, 15, 12, 10]), 3)
+        sweep = ParameterSweep()
+        sweep.run({"w": self.workload}, {"RR": (RoundRobinScheduler, {"quantum": range(1, 9)})}, context_switch_times=[1])
+        self.assertIn(sweep.knee("avg_turnaround_time", "quantum", scheduler="RR"), range(1, 9))
+
+class TestBatchRunner(unittest.TestCase):
+    def setUp(self):
+        self.spec = {
+            "workloads": {
+                "listed": {"processes": [
+                    {"name": "A", "arrival_time": 0, "burst_time": 6},
+                    {"name": "B", "arrival_time": 1, "burst_time": 2, "priority": 1}
+                ]},
+                "synthetic": {"generate": {
+                    "n": 200, "seed": 5, "backend": "python",
+                    "arrivals": {"type": "poisson", "rate": 0.3},
+                    "burst": {"type": "exponential", "mean": 4}
+                }}
+            },
+            "schedulers": {"FCFS": {"algorithm": "fcfs"}, "RR": {"algorithm": "rr", "params": {"quantum": [1, 3]}}, "srtf": {}},
+            "context_switch_times": [0, 1]
+        }
+
+    def test_run_batch(self):
+        """Tests that a job spec expands to one result row per combination."""
+        rows = run_batch(self.spec).rows
+        self.assertEqual(len(rows), 2 * (1 + 2 + 1) * 2)
+        srtf = next(r for r in rows if r["workload"] == "listed" and r["scheduler"] == "srtf" and r["context_switch_time"] == 0)
+        self.assertEqual((srtf["preemptive"], srtf["avg_waiting_time"]), (True, 1.0))
+        self.assertEqual({r["total_processes"] for r in rows if r["workload"] == "synthetic"}, {200})
+
+        with self.assertRaises(ValueError):
+            run_batch({"workloads": self.spec["workloads"], "schedulers": {"X": {"algorithm": "lottery"}}})
+
+    def test_build_distribution(self):
+        """Tests nested distribution specs."""
+        spec = {"type": "bimodal", "short": {"type": "exponential", "mean": 2},
+                "long": {"type": "pareto", "alpha": 2.5}, "long_fraction": 0.1}
+        self.assertEqual(build_distribution(spec), Bimodal(Exponential(2), Pareto(2.5), 0.1))
+        with self.assertRaises(ValueError):
+            build_distribution({"type": "zipf"})
+
+    def test_cli_batch_mode(self):
+        """Tests main.py --mode batch end to end, without the voice stack installed or imported."""
+        main = os.path.join(os.path.dirname(__file__), '..', 'src', 'main.py')
+        with tempfile.TemporaryDirectory() as tmp:
+            spec_path = os.path.join(tmp, "job.json")
+            with open(spec_path, "w") as f:
+                json.dump(dict(self.spec, workloads={"listed": self.spec["workloads"]["listed"]}), f)
+            result = subprocess.run([sys.executable, main, "--mode", "batch", "--spec", spec_path],
+                                    capture_output=True, text=True, check=True)
+        rows = json.loads(result.stdout)
+        self.assertEqual(len(rows), (1 + 2 + 1) * 2)
+        self.assertEqual(rows[0]["scheduler"], "FCFS")
+
+    def test_cli_batch_mode_spec_output(self):
+        """Tests that main.py --mode batch writes to the spec's output file and prints nothing."""
+        main = os.path.join(os.path.dirname(__file__), '..', 'src', 'main.py')
+        with tempfile.TemporaryDirectory() as tmp:
+            spec_path = os.path.join(tmp, "job.json")
+            with open(spec_path, "w") as f:
+                json.dump(dict(self.spec, workloads={"listed": self.spec["workloads"]["listed"]}, output="results.json"), f)
+            result = subprocess.run([sys.executable, main, "--mode", "batch", "--spec", spec_path],
+                                    capture_output=True, text=True, check=True)
+            with open(os.path.join(tmp, "results.json")) as f:
+                rows = json.load(f)
+        self.assertEqual(result.stdout.strip(), "")
+        self.assertEqual(len(rows), (1 + 2 + 1) * 2)
+
+if __name__ == '__main__':
+    unittest.main()
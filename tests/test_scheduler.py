@@ -9,6 +9,14 @@ from os_simulator.process import Process
 from os_simulator.scheduling.fcfs import FCFSScheduler
 from os_simulator.scheduling.round_robin import RoundRobinScheduler
 from os_simulator.scheduling.priority import PriorityScheduler
+from os_simulator.scheduling.sjf import SJFScheduler
+from os_simulator.scheduling.mlfq import MLFQScheduler
+from os_simulator.scheduling.cfs import CFSScheduler, priority_to_weight
+from os_simulator.scheduling.indexed_heap import IndexedHeap
+from os_simulator.scheduling.realtime import EDFScheduler, RateMonotonicScheduler, release_periodic_jobs
+from os_simulator.scheduling.schedulability import (
+    PeriodicTask, edf_demand_test, generate_task_sets, is_schedulable, response_time_analysis, screen_task_sets
+)
 
 class TestSchedulers(unittest.TestCase):
 
@@ -76,6 +84,34 @@ class TestSchedulers(unittest.TestCase):
         self.assertEqual(self.p3.turnaround_time, 9)
         self.assertEqual(self.p1.turnaround_time, 12)
 
+    def test_round_robin_merged_segments(self):
+        """Tests that merged RR collapses single-tenant stretches without changing the schedule."""
+        long_job = Process(1, "Long", 0, 100)
+        short_job = Process(2, "Short", 10, 3)
+        timeline = RoundRobinScheduler(quantum=4, merge_segments=True).schedule([long_job, short_job])
+
+        # P1 keeps the CPU until the quantum ending at 12, after P2 arrived at 10
+        self.assertEqual(timeline, [(1, 0, 12), (2, 12, 15), (1, 15, 103)])
+        self.assertEqual(short_job.waiting_time, 2)
+        self.assertEqual(RoundRobinScheduler(quantum=1, merge_segments=True).schedule([Process(1, "Solo", 5, 10**7)]),
+                         [(1, 5, 10**7 + 5)])
+
+    def test_round_robin_merged_matches_plain(self):
+        """Tests merged RR (closed-form rounds) against plain RR on mixed workloads."""
+        specs = [(1, 0, 9), (2, 0, 14), (3, 3, 30), (4, 40, 5), (5, 41, 22), (6, 90, 1)]
+        plain = [Process(pid, f"P{pid}", a, b) for pid, a, b in specs]
+        merged = [Process(pid, f"P{pid}", a, b) for pid, a, b in specs]
+
+        expected = []
+        for seg in RoundRobinScheduler(quantum=2).schedule(plain):
+            if expected and expected[-1][0] == seg[0] and expected[-1][2] == seg[1]:
+                expected[-1] = (seg[0], expected[-1][1], seg[2])
+            else:
+                expected.append(seg)
+
+        self.assertEqual(RoundRobinScheduler(quantum=2, merge_segments=True).schedule(merged), expected)
+        self.assertEqual([p.completion_time for p in merged], [p.completion_time for p in plain])
+
     def test_priority_scheduling(self):
         """Tests Non-preemptive Priority scheduling."""
         scheduler = PriorityScheduler()
@@ -101,6 +137,230 @@ class TestSchedulers(unittest.TestCase):
         self.assertEqual(self.p3.turnaround_time, 7)
         self.assertEqual(self.p3.waiting_time, 3)
 
+    def test_priority_tie_breaking(self):
+        """Tests that equal priorities fall back to arrival order."""
+        procs = [
+            Process(1, "P1", 0, 2, 1),
+            Process(2, "P2", 1, 2, 5),
+            Process(3, "P3", 1, 2, 5),
+            Process(4, "P4", 0, 2, 5),
+        ]
+        timeline = PriorityScheduler().schedule(procs)
+
+        # Time 0: P1 and P4 available, P4 wins (5 > 1).
+        # Time 2: P2, P3 (priority 5) and P1 available; P2 arrived first in input order.
+        expected_timeline = [(4, 0, 2), (2, 2, 4), (3, 4, 6), (1, 6, 8)]
+        self.assertEqual(timeline, expected_timeline)
+
+    def test_priority_large_workload(self):
+        """Tests that a large workload is scheduled back-to-back without gaps."""
+        procs = [Process(i, f"P{i}", i % 100, 1 + i % 7, i % 13) for i in range(20000)]
+        timeline = PriorityScheduler().schedule(procs)
+
+        self.assertEqual(len(timeline), 20000)
+        self.assertEqual(timeline[-1][2], sum(p.burst_time for p in procs))
+        # By time 1 a process with the top priority (12) has arrived and runs next
+        self.assertEqual(timeline[1][0] % 13, 12)
+
+    def test_preemptive_priority(self):
+        """Tests preemption on arrival of a strictly higher priority process."""
+        low = Process(1, "L", 0, 6, 1)
+        high = Process(2, "H", 2, 2, 5)
+        mid = Process(3, "M", 3, 2, 3)
+        timeline = PriorityScheduler(preemptive=True).schedule([low, high, mid])
+
+        # L runs 0-2, H preempts 2-4 (M arrives at 3 but cannot preempt H),
+        # M runs 4-6, L finishes 6-10.
+        expected_timeline = [(1, 0, 2), (2, 2, 4), (3, 4, 6), (1, 6, 10)]
+        self.assertEqual(timeline, expected_timeline)
+        self.assertEqual(low.waiting_time, 4)
+        self.assertEqual(mid.waiting_time, 1)
+
+    def test_priority_aging(self):
+        """Tests that aging lets a low-priority process overtake a stream of high-priority ones."""
+        low = Process(0, "Low", 0, 2, 0)
+        highs = [Process(i, f"H{i}", 2 * (i - 1), 2, 5) for i in range(1, 11)]
+
+        PriorityScheduler().schedule([low] + highs)
+        self.assertEqual(low.waiting_time, 20)
+
+        # Aging +2 every 3 units waited: priority 2 at t=4, 4 at t=6, 6 at t=10
+        timeline = PriorityScheduler(aging_interval=3, aging_step=2).schedule([low] + highs)
+        self.assertEqual(timeline[5], (0, 10, 12))
+        self.assertEqual(low.waiting_time, 10)
+
+    def test_priority_aging_cap(self):
+        """Tests that aged priorities never exceed max_priority."""
+        low = Process(0, "Low", 0, 2, 0)
+        highs = [Process(i, f"H{i}", 2 * (i - 1), 2, 5) for i in range(1, 11)]
+
+        # Capped below the high-priority level, aging can no longer rescue it
+        timeline = PriorityScheduler(aging_interval=1, max_priority=4).schedule([low] + highs)
+        self.assertEqual(timeline[-1], (0, 20, 22))
+
+    def test_sjf_scheduling(self):
+        """Tests non-preemptive SJF with the classic textbook workload."""
+        procs = [Process(1, "P1", 0, 8), Process(2, "P2", 1, 4), Process(3, "P3", 2, 9), Process(4, "P4", 3, 5)]
+        timeline = SJFScheduler().schedule(procs)
+
+        # P1 runs to completion, then the shortest waiting jobs: P2 (4), P4 (5), P3 (9)
+        expected_timeline = [(1, 0, 8), (2, 8, 12), (4, 12, 17), (3, 17, 26)]
+        self.assertEqual(timeline, expected_timeline)
+        self.assertEqual(procs[3].waiting_time, 9)
+
+    def test_srtf_scheduling(self):
+        """Tests Shortest-Remaining-Time-First preemption at arrival events."""
+        procs = [Process(1, "P1", 0, 8), Process(2, "P2", 1, 4), Process(3, "P3", 2, 9), Process(4, "P4", 3, 5)]
+        timeline = SJFScheduler(preemptive=True).schedule(procs)
+
+        # P2 (4) preempts P1 (7 left) at 1; P3 and P4 arrive but are longer than P2.
+        # Average waiting time is the classic 6.5.
+        expected_timeline = [(1, 0, 1), (2, 1, 5), (4, 5, 10), (1, 10, 17), (3, 17, 26)]
+        self.assertEqual(timeline, expected_timeline)
+        self.assertEqual(sum(p.waiting_time for p in procs) / 4, 6.5)
+
+    def test_srtf_does_not_split_without_preemption(self):
+        """Tests that arrivals which do not preempt leave the running segment intact."""
+        procs = [Process(1, "P1", 0, 4), Process(2, "P2", 1, 6), Process(3, "P3", 2, 5)]
+        timeline = SJFScheduler(preemptive=True).schedule(procs)
+
+        self.assertEqual(timeline, [(1, 0, 4), (3, 4, 9), (2, 9, 15)])
+
+    def test_mlfq_demotion(self):
+        """Tests that processes are demoted after using a full quantum."""
+        procs = [Process(1, "P1", 0, 7), Process(2, "P2", 1, 3)]
+        timeline = MLFQScheduler(quanta=[2, 4]).schedule(procs)
+
+        # P1 uses its level-0 quantum (0-2) and drops to level 1; P2 does the same (2-4).
+        # Level 1 then runs Round Robin with quantum 4.
+        expected_timeline = [(1, 0, 2), (2, 2, 4), (1, 4, 8), (2, 8, 9), (1, 9, 10)]
+        self.assertEqual(timeline, expected_timeline)
+        self.assertEqual(procs[0].turnaround_time, 10)
+
+    def test_mlfq_priority_boost(self):
+        """Tests that the periodic boost moves demoted processes back to the top level."""
+        make = lambda: [Process(1, "P1", 0, 10), Process(2, "P2", 2, 3)]
+
+        without_boost = MLFQScheduler(quanta=[1, 4]).schedule(make())
+        self.assertEqual(without_boost[3:], [(1, 6, 10), (2, 10, 12), (1, 12, 13)])
+
+        # At t=6 both processes return to level 0 and get quantum 1 again
+        with_boost = MLFQScheduler(quanta=[1, 4], boost_interval=6).schedule(make())
+        self.assertEqual(with_boost[3:], [(1, 6, 7), (2, 7, 8), (1, 8, 12), (2, 12, 13)])
+
+    def test_mlfq_single_level_is_round_robin(self):
+        """Tests that a one-level MLFQ degenerates to Round Robin."""
+        timeline = MLFQScheduler(quanta=[2]).schedule(self.processes)
+        expected_timeline = [
+            (1, 0, 2), (2, 2, 4), (3, 4, 6),
+            (1, 6, 8), (2, 8, 9), (3, 9, 11), (1, 11, 12)
+        ]
+        self.assertEqual(timeline, expected_timeline)
+
+    def test_mlfq_rejects_invalid_levels(self):
+        """Tests validation of the level configuration."""
+        with self.assertRaises(ValueError):
+            MLFQScheduler(quanta=[None, 4])
+        with self.assertRaises(ValueError):
+            MLFQScheduler(quanta=[2, 0])
+
+    def test_cfs_equal_weights(self):
+        """Tests that equal-priority processes split the target latency evenly."""
+        procs = [Process(1, "A", 0, 20), Process(2, "B", 0, 20)]
+        timeline = CFSScheduler(target_latency=20, min_granularity=4).schedule(procs)
+
+        self.assertEqual(timeline, [(1, 0, 10), (2, 10, 20), (1, 20, 30), (2, 30, 40)])
+
+    def test_cfs_weighted_share(self):
+        """Tests that higher priority maps to a larger weight and a larger CPU share."""
+        self.assertEqual(priority_to_weight(0), 1024)
+        self.assertEqual(priority_to_weight(5), 3121)
+        self.assertEqual(priority_to_weight(-100), 15)
+
+        heavy = Process(1, "Heavy", 0, 100, 5)
+        light = Process(2, "Light", 0, 100, 0)
+        timeline = CFSScheduler().schedule([heavy, light])
+
+        # Slices are proportional to weight: ceil(20 * 3121 / 4145) = 16 vs ceil(20 * 1024 / 4145) = 5.
+        # Light runs two slices back-to-back at 16-26, merged into one segment.
+        self.assertEqual(timeline[:3], [(1, 0, 16), (2, 16, 26), (1, 26, 42)])
+        self.assertLess(heavy.completion_time, light.completion_time)
+        self.assertEqual(light.completion_time, 200)
+
+    def test_cfs_late_arrival_starts_at_min_vruntime(self):
+        """Tests that a late arrival does not get credit for the time before it arrived."""
+        early = Process(1, "Early", 0, 100)
+        late = Process(2, "Late", 50, 20)
+        timeline = CFSScheduler(target_latency=20, min_granularity=4).schedule([early, late])
+
+        # Late joins at 60 with Early's vruntime (60), not 0; the tie goes to Early,
+        # after which both share the CPU in 10-unit slices.
+        self.assertEqual(timeline[:4], [(1, 0, 70), (2, 70, 80), (1, 80, 90), (2, 90, 100)])
+
+    def test_indexed_heap_updates(self):
+        """Tests key updates and removal in the indexed heap."""
+        heap = IndexedHeap()
+        for item, key in [("a", 5), ("b", 3), ("c", 8), ("d", 1)]:
+            heap.push(item, key)
+
+        heap.update("c", 0)
+        heap.update("d", 9)
+        heap.remove("b")
+
+        self.assertNotIn("b", heap)
+        self.assertEqual(heap.key_of("d"), 9)
+        self.assertEqual([heap.pop() for _ in range(len(heap))], [("c", 0), ("a", 5), ("d", 9)])
+
+    def test_periodic_job_release(self):
+        """Tests that periodic tasks are expanded into jobs with absolute deadlines."""
+        jobs = release_periodic_jobs([Process(1, "T1", 0, 2, period=5), Process(2, "T2", 1, 1, deadline=3)], horizon=11)
+
+        self.assertEqual([(j.pid, j.name, j.arrival_time) for j in jobs],
+                         [(1, "T1#0", 0), (2, "T2#0", 1), (3, "T1#1", 5), (4, "T1#2", 10)])
+        self.assertEqual([j.absolute_deadline for j in jobs], [5, 4, 10, 15])
+
+    def test_edf_meets_deadlines_rm_misses(self):
+        """Tests EDF and RM on a task set that is EDF- but not RM-schedulable (U = 0.97)."""
+        tasks = [Process(1, "T1", 0, 2, period=5), Process(2, "T2", 0, 4, period=7)]
+
+        edf_jobs = release_periodic_jobs(tasks, horizon=35)
+        edf_timeline = EDFScheduler().schedule(edf_jobs)
+        self.assertTrue(all(j.lateness <= 0 for j in edf_jobs))
+        self.assertEqual(edf_timeline[:3], [(1, 0, 2), (2, 2, 6), (3, 6, 8)])
+
+        rm_jobs = release_periodic_jobs(tasks, horizon=35)
+        rm_timeline = RateMonotonicScheduler().schedule(rm_jobs)
+        # T2#0 is preempted by T1#1 at 5 and completes at 8, one unit after its deadline
+        self.assertEqual(rm_timeline[:4], [(1, 0, 2), (2, 2, 5), (3, 5, 7), (2, 7, 8)])
+        self.assertEqual(rm_jobs[1].lateness, 1)
+
+    def test_response_time_analysis(self):
+        """Tests exact RM response times and detection of an RM-unschedulable set."""
+        tasks = [PeriodicTask(1, 4), PeriodicTask(2, 6), PeriodicTask(3, 12)]
+        self.assertEqual(response_time_analysis(tasks), [1, 3, 10])
+        self.assertTrue(is_schedulable(tasks, "rm"))
+
+        tight = [PeriodicTask(2, 5), PeriodicTask(4, 7)]
+        self.assertEqual(response_time_analysis(tight), [2, None])
+        self.assertFalse(is_schedulable(tight, "rm"))
+        self.assertTrue(is_schedulable(tight, "edf"))
+        self.assertFalse(edf_demand_test([PeriodicTask(2, 5, 2), PeriodicTask(2, 5, 2)]))
+
+        # Full utilization with a constrained deadline is exact; rounding just above 1 must terminate
+        self.assertTrue(edf_demand_test([PeriodicTask(1, 2, 1.5), PeriodicTask(1, 2)]))
+        self.assertFalse(edf_demand_test([PeriodicTask(1 + 3e-10, 3, 2), PeriodicTask(2, 3)]))
+
+    def test_bulk_schedulability_screening(self):
+        """Tests screening thousands of UUniFast task sets."""
+        light = generate_task_sets(2000, 8, 0.6, seed=7)
+        self.assertAlmostEqual(sum(t.utilization for t in light[0]), 0.6)
+        self.assertTrue(all(screen_task_sets(light, "rm")))
+
+        heavy = generate_task_sets(1000, 8, 0.95, seed=7)
+        self.assertTrue(all(screen_task_sets(heavy, "edf")))
+        self.assertLess(sum(screen_task_sets(heavy, "rm")), len(heavy))
+        self.assertFalse(any(screen_task_sets(generate_task_sets(100, 8, 1.05, seed=7), "edf")))
+
     def test_idle_handling(self):
         """Tests how schedulers handle gaps in arrival times."""
         p_late = Process(4, "P4", 20, 5) # Arrives much later